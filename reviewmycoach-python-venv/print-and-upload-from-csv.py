@@ -2,12 +2,17 @@
 import argparse
 import asyncio
 import csv
+import json
+import multiprocessing
 import os
 import shutil
 import re
 import sys
+import threading
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlsplit
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -17,16 +22,27 @@ from typing import Dict, List, Optional, Tuple
 # Utilities
 # ------------------------
 
+NON_SLUG_CHARS_RE = re.compile(r"[^a-z0-9]+")
+DASH_RUN_RE = re.compile(r"-+")
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     text = (text or "").strip().lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    return re.sub(r"-+", "-", text).strip("-") or "file"
+    text = NON_SLUG_CHARS_RE.sub("-", text)
+    return DASH_RUN_RE.sub("-", text).strip("-") or "file"
 
 
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
 
+def write_jsonl(path: Path, records: List[Dict[str, object]]):
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
 def find_csv_in_folder(folder: Path) -> Optional[Path]:
     for p in sorted(folder.glob("*.csv")):
         return p
@@ -36,15 +52,24 @@ def find_csv_in_folder(folder: Path) -> Optional[Path]:
 def read_rows(csv_path: Path) -> List[Dict[str, str]]:
     rows: List[Dict[str, str]] = []
     with csv_path.open(newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        if not reader.fieldnames:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+        if not fieldnames:
             sys.exit("ERROR: CSV has no headers.")
 
-        # Normalize headers
-        headers = [h.strip() if h else "" for h in reader.fieldnames]
+        # Normalize headers once; each row is then mapped by column position.
+        # Duplicate headers resolve as they did through DictReader.
+        columns: Dict[str, int] = {}
+        for k, i in dict(zip(fieldnames, range(len(fieldnames)))).items():
+            columns[k.strip()] = i
+        columns_items = tuple(columns.items())
+        width = len(fieldnames)
         for row in reader:
-            norm = { (k or "").strip(): (v or "").strip() for k, v in row.items() }
-            rows.append(norm)
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            rows.append({k: row[i].strip() for k, i in columns_items})
 
     if not rows:
         sys.exit("ERROR: CSV has no data rows.")
@@ -67,9 +92,10 @@ def guess_url_column(headers: List[str]) -> Optional[str]:
     return candidates[0]
 
 
-def build_candidate_urls(base_url: str) -> List[str]:
+@lru_cache(maxsize=2048)
+def _candidate_urls(base_url: str) -> Tuple[str, ...]:
     if not base_url:
-        return []
+        return ()
     url = base_url.strip().split('#', 1)[0]
     candidates: List[str] = []
     def add(u: str):
@@ -103,19 +129,26 @@ def build_candidate_urls(base_url: str) -> List[str]:
     if base_no_index:
         add(base_no_index)
         add(base_no_index.rstrip('/'))
-    return candidates
+    return tuple(candidates)
 
 
-def build_output_filename(row: Dict[str, str], default_state: Optional[str] = None) -> str:
-    # If CSV provides a filename use it
-    filename = (row.get('filename') or '').strip()
-    if filename:
-        return filename if filename.lower().endswith('.pdf') else f"{filename}.pdf"
+def build_candidate_urls(base_url: str) -> List[str]:
+    # CSVs often list the same base URL on several rows, so the variants
+    # are built once per URL; callers get their own list
+    return list(_candidate_urls(base_url))
+
+
+# Columns that can name the output PDF, in order of preference: the CSV's
+# own filename, then a nice human-readable name
+FILENAME_KEYS = ('filename', 'college', 'school', 'university', 'name', 'title')
+
 
-    # Prefer a nice human-readable name when possible
-    for key in ['college', 'school', 'university', 'name', 'title']:
+def build_output_filename(row: Dict[str, str], default_state: Optional[str] = None) -> str:
+    for key in FILENAME_KEYS:
         value = (row.get(key) or '').strip()
         if value:
+            if key == 'filename' and value.lower().endswith('.pdf'):
+                return value
             return f"{value}.pdf"
 
     # Fallback to state or URL slug
@@ -124,70 +157,137 @@ def build_output_filename(row: Dict[str, str], default_state: Optional[str] = No
 
 
 def zip_folder(folder: Path, zip_path: Path):
-    from zipfile import ZipFile, ZIP_DEFLATED
-    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zf:
-        for root, _, files in os.walk(folder):
-            for fn in files:
-                full = Path(root) / fn
-                arc = full.relative_to(folder)
-                zf.write(full, arcname=str(arc))
+    from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+    # PDF streams are already Flate-encoded, so PDFs are stored as-is; the
+    # text, CSV and issue files still get the fastest deflate level.
+    # A 1 MiB buffer keeps the archive writes large
+    with open(zip_path, "wb", buffering=1 << 20) as raw, \
+            ZipFile(raw, "w", ZIP_DEFLATED, compresslevel=1) as zf:
+        # scandir entries carry their type, so directories aren't re-stat'ed;
+        # like os.walk, symlinked directories are not descended into
+        stack = [os.fspath(folder)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    else:
+                        compress_type = ZIP_STORED if entry.name.lower().endswith(".pdf") else None
+                        zf.write(entry.path, arcname=os.path.relpath(entry.path, folder), compress_type=compress_type)
 
 
 # ------------------------
 # PDF Rendering (Playwright)
 # ------------------------
 
-async def render_pdf(browser, task: Dict[str, str], out_dir: Path, timeout_ms: int) -> Dict[str, str]:
+ERROR_404_RE = re.compile(r'\b(404)\b\s*(error|page)\b')
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_6_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36"
+)
+ACCEPT_HTML = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
+CONTEXT_HEADERS = {
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": ACCEPT_HTML,
+    "Cache-Control": "no-cache",
+}
+# Static-HTML fallback requests also send a Referer for the candidate's site
+FALLBACK_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': ACCEPT_HTML,
+}
+VIEWPORT = {"width": 1280, "height": 900}
+
+# Ad and analytics hosts. Their requests are aborted: they never affect the
+# printed directory, but they keep "networkidle" from being reached
+BLOCKED_REQUEST_RE = re.compile(
+    r'^https?://([^/?#]*\.)?(doubleclick\.net|googlesyndication\.com|googletagmanager\.com'
+    r'|google-analytics\.com|facebook\.net|hotjar\.com)([:/?#]|$)'
+)
+
+
+# Resolves once web fonts and every eager image on the page have loaded (or
+# failed). Lazy images off-screen never load, so they aren't waited for; the
+# listeners are added, not assigned, so the page's own handlers keep working
+PRINT_READY_JS = """async () => {
+    await document.fonts.ready;
+    await Promise.all([...document.images].filter(img => !img.complete && img.loading !== 'lazy').map(
+        img => new Promise(resolve => {
+            img.addEventListener('load', resolve, {once: true});
+            img.addEventListener('error', resolve, {once: true});
+        })));
+}"""
+PRINT_READY_TIMEOUT_S = 2
+
+
+async def abort_route(route):
+    await route.abort()
+
+
+async def new_render_context(browser, javascript_enabled: bool = True):
+    # Create a context with a realistic UA and language headers
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        extra_http_headers=CONTEXT_HEADERS,
+        viewport=VIEWPORT,
+        java_script_enabled=javascript_enabled,
+    )
+    # Only matching requests are routed through Python; everything else,
+    # including images, fonts and stylesheets, loads as before
+    await context.route(BLOCKED_REQUEST_RE, abort_route)
+    return context
+
+
+async def wait_for_print_ready(page):
+    # Fonts and images are what can still shift the layout before printing;
+    # a page that never settles is printed after the timeout anyway
+    try:
+        await asyncio.wait_for(page.evaluate(PRINT_READY_JS), timeout=PRINT_READY_TIMEOUT_S)
+    except Exception:
+        pass
+
+
+# Helpers for stricter error-page detection. They take already-lowercased
+# HTML, so a page is lowercased once however many checks it goes through
+def looks_like_404(h: str) -> bool:
+    return (
+        ('404 not found' in h)
+        or ERROR_404_RE.search(h) is not None
+        or 'the page you are looking for' in h and 'not found' in h
+        or 'error-404' in h
+    )
+
+
+def looks_like_403(h: str) -> bool:
+    return (
+        '403 forbidden' in h
+        or 'access denied' in h
+        or "you don't have permission" in h
+        or 'you do not have permission' in h
+        or 'the request could not be satisfied' in h
+        or 'error-403' in h
+    )
+
+
+def looks_like_staff_directory(h: str) -> bool:
+    return (
+        'staff directory' in h or 'directory' in h
+    )
+
+
+async def render_pdf(context, session, task: Dict[str, str], out_dir: Path, timeout_ms: int) -> Dict[str, str]:
     url = task["print_url"]
     outfile = out_dir / task["outfile"]
     info = {"url": url, "outfile": str(outfile), "status": "ok", "error": ""}
     try:
-        # Create a context with a realistic UA and language headers
-        user_agent = (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_6_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        )
-        context = await browser.new_context(
-            user_agent=user_agent,
-            extra_http_headers={
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-                "Cache-Control": "no-cache",
-            },
-            viewport={"width": 1280, "height": 900},
-        )
         page = await context.new_page()
         candidate_urls = build_candidate_urls(url)
         attempted_urls: List[str] = []
         last_error: str = ""
-        # Helpers for stricter error-page detection
-        def looks_like_404(html_text: str) -> bool:
-            h = html_text.lower()
-            return (
-                ('404 not found' in h)
-                or re.search(r'\b(404)\b\s*(error|page)\b', h) is not None
-                or 'the page you are looking for' in h and 'not found' in h
-                or 'error-404' in h
-            )
-
-        def looks_like_403(html_text: str) -> bool:
-            h = html_text.lower()
-            return (
-                '403 forbidden' in h
-                or 'access denied' in h
-                or "you don't have permission" in h
-                or 'you do not have permission' in h
-                or 'the request could not be satisfied' in h
-                or 'error-403' in h
-            )
-
-        def looks_like_staff_directory(html_text: str) -> bool:
-            h = html_text.lower()
-            return (
-                'staff directory' in h or 'directory' in h
-            )
-
         for candidate in candidate_urls:
             attempted_urls.append(candidate)
             try:
@@ -203,19 +303,15 @@ async def render_pdf(browser, task: Dict[str, str], out_dir: Path, timeout_ms: i
                 last_error = f"HTTP {response.status} returned"
                 # Fallback: try fetching static HTML with requests and render it anyway
                 try:
-                    import requests
-                    headers = {
-                        'User-Agent': user_agent,
-                        'Referer': referer,
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                    }
-                    r = requests.get(candidate, headers=headers, timeout=20)
+                    headers = {**FALLBACK_HEADERS, 'Referer': referer}
+                    # Blocking fetch runs in a thread so other renders keep going
+                    r = await asyncio.to_thread(session.get, candidate, headers=headers, timeout=20)
                     # If we get any HTML back, attempt to render it even if 404, as long as it looks like a directory
-                    if r.text and looks_like_staff_directory(r.text) and not looks_like_403(r.text):
+                    static_lower = r.text.lower()
+                    if r.text and looks_like_staff_directory(static_lower) and not looks_like_403(static_lower):
                         await page.set_content(r.text, wait_until='domcontentloaded')
                         await page.emulate_media(media="print")
-                        await page.wait_for_timeout(800)
+                        await wait_for_print_ready(page)
                         ensure_dir(outfile.parent)
                         await page.pdf(
                             path=str(outfile),
@@ -244,7 +340,7 @@ async def render_pdf(browser, task: Dict[str, str], out_dir: Path, timeout_ms: i
 
             # Looks good – render
             await page.emulate_media(media="print")
-            await page.wait_for_timeout(800)
+            await wait_for_print_ready(page)
             ensure_dir(outfile.parent)
             await page.pdf(
                 path=str(outfile),
@@ -265,17 +361,16 @@ async def render_pdf(browser, task: Dict[str, str], out_dir: Path, timeout_ms: i
         info["status"] = "error"
         info["error"] = str(e)
     finally:
-        try:
-            if 'page' in locals():
-                await page.close()
-        finally:
-            if 'context' in locals():
-                await context.close()
+        # The context is shared with later tasks, so only the page is closed
+        if 'page' in locals():
+            await page.close()
     return info
 
 
-async def print_all_from_csv(csv_rows: List[Dict[str, str]], out_dir: Path, concurrency: int, timeout_ms: int) -> List[Dict[str, str]]:
+async def print_all_from_csv(csv_rows: List[Dict[str, str]], out_dir: Path, concurrency: int, timeout_ms: int, javascript_enabled: bool = True, parse_pool: Optional[Executor] = None, run_stamp: Optional[str] = None) -> List[Dict[str, object]]:
     from playwright.async_api import async_playwright
+    import requests
+    from requests.adapters import HTTPAdapter
 
     # Determine URL column and collect tasks
     if not csv_rows:
@@ -286,6 +381,10 @@ async def print_all_from_csv(csv_rows: List[Dict[str, str]], out_dir: Path, conc
         sys.exit("ERROR: Could not find a URL column in the CSV (expected a column containing 'url').")
 
     tasks: List[Dict[str, str]] = []
+    results: List[Dict[str, object]] = []
+    # Rows naming an already-claimed PDF are skipped, so no file is rendered
+    # (or parsed) twice at once
+    outfiles: set = set()
     for r in csv_rows:
         base_url = r.get('print_url') or r.get(url_key) or ''
         base_url = base_url.strip()
@@ -293,27 +392,103 @@ async def print_all_from_csv(csv_rows: List[Dict[str, str]], out_dir: Path, conc
             continue
         # Keep original URL; rendering will try variants (?print=true, /print, original)
         r['print_url'] = base_url
+        outfile = build_output_filename(r)
+        if outfile in outfiles:
+            results.append({"url": base_url, "outfile": str(out_dir / outfile), "status": "skipped",
+                            "error": f"duplicate output file {outfile} (already printed for an earlier row)"})
+            continue
+        outfiles.add(outfile)
         tasks.append({
             'print_url': base_url,
-            'outfile': build_output_filename(r),
+            'outfile': outfile,
         })
 
-    results: List[Dict[str, str]] = []
-    sem = asyncio.Semaphore(concurrency)
+    # Printed PDFs are parsed in `parse_pool` while later rows still render;
+    # each result gets its parse_printed_pdf() output under 'parsed'
+    loop = asyncio.get_running_loop()
+    run_stamp = run_stamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+    parses: List[Tuple[Dict[str, object], asyncio.Future]] = []
+
+    def collect(done):
+        for f in done:
+            r = f.result()
+            results.append(r)
+            if parse_pool and r.get('status') == 'ok':
+                parses.append((r, loop.run_in_executor(parse_pool, parse_printed_pdf, r['outfile'], run_stamp)))
+
+    # Static-HTML fallbacks share pooled connections, sized for every render slot
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency * 2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
 
-        async def worker(t: Dict[str, str]):
-            async with sem:
-                return await render_pdf(browser, t, out_dir, timeout_ms)
+        # One long-lived context per concurrency slot, reused across tasks;
+        # each row borrows one for the duration of its render
+        contexts: asyncio.Queue = asyncio.Queue()
+        live_contexts = min(concurrency, len(tasks))
+        for _ in range(live_contexts):
+            contexts.put_nowait(await new_render_context(browser, javascript_enabled))
 
-        coros = [worker(t) for t in tasks]
-        for f in asyncio.as_completed(coros):
-            res = await f
-            results.append(res)
+        async def worker(t: Dict[str, str]):
+            nonlocal live_contexts
+            context = await contexts.get()
+            if context is None:
+                # Every context is gone (the browser died); pass the marker on
+                # so the remaining rows fail fast instead of waiting forever
+                contexts.put_nowait(None)
+                return {"url": t["print_url"], "outfile": str(out_dir / t["outfile"]), "status": "error",
+                        "error": "no browser context available"}
+            healthy = False
+            try:
+                result = await render_pdf(context, session, t, out_dir, timeout_ms)
+                healthy = result.get('status') != 'error'
+                return result
+            finally:
+                if not healthy:
+                    # A crashed or failed render can leave the context broken;
+                    # later rows get a fresh one instead
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+                    try:
+                        context = await new_render_context(browser, javascript_enabled)
+                    except Exception as e:
+                        print(f"⚠️  Could not replace a render context: {e}")
+                        context = None
+                        live_contexts -= 1
+                if context is not None:
+                    contexts.put_nowait(context)
+                elif live_contexts == 0:
+                    contexts.put_nowait(None)
+
+        # At most `concurrency` rows are in flight; each finished render
+        # makes room for the next row, so pending rows stay plain dicts
+        in_flight: set = set()
+        for t in tasks:
+            if len(in_flight) >= concurrency:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+            in_flight.add(asyncio.create_task(worker(t)))
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            collect(done)
+        while not contexts.empty():
+            context = contexts.get_nowait()
+            if context is not None:
+                await context.close()
         await browser.close()
+    session.close()
 
+    for r, parsed in parses:
+        # A failed parse (even a broken pool) only fails its own row
+        try:
+            r['parsed'] = await parsed
+        except Exception as e:
+            r['parsed'] = (None, None, str(e) or type(e).__name__)
     return results
 
 
@@ -321,36 +496,150 @@ async def print_all_from_csv(csv_rows: List[Dict[str, str]], out_dir: Path, conc
 # PDF Parsing and Firestore Upload (adapted from upload-coaches.py)
 # ------------------------
 
+# Phone number patterns, in priority order, each tagged with the shape of
+# what it matches so extract_and_format_phone never has to re-match it
+PHONE_PATTERNS = [(re.compile(p), shape) for p, shape in (
+    (r'\(\d{3}\)\s*\d{3}-\d{4}', 'as_is'),
+    (r'\(\d{3}\)\s*\d{3}\.\d{4}', 'as_is'),
+    (r'\d{3}-\d{3}-\d{4}', 'dashed_10'),
+    (r'\d{3}\.\d{3}\.\d{4}', 'as_is'),
+    (r'\d{3}\s+\d{3}-\d{4}', 'spaced_10'),
+    (r'\d{3}-\d{4}', 'local_7'),
+    (r'\d{3}\.\d{4}', 'local_7'),
+    (r'\b\d{7}\b', 'digits_7'),
+)]
+# Union of the patterns above, so lines without any phone number are
+# rejected in a single scan. The ordered list above still decides which
+# pattern wins, since an alternation would prefer the leftmost match instead.
+ANY_PHONE_RE = re.compile("|".join(f"(?:{p.pattern})" for p, _ in PHONE_PATTERNS))
+
+AREA_CODE_PATTERNS = [
+    re.compile(r'Area Code \((\d{3})\)', re.IGNORECASE),
+    re.compile(r'Area Code: \((\d{3})\)', re.IGNORECASE),
+    re.compile(r'Area Code (\d{3})', re.IGNORECASE),
+    re.compile(r'Area Code: (\d{3})', re.IGNORECASE),
+    re.compile(r'\((\d{3})\) area code', re.IGNORECASE),
+]
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+URL_RE = re.compile(r'https?://\S+')
+SPORT_SECTION_RE = re.compile(r'^([A-Z\s&]+(?:\([^)]+\))?)$')
+# Role-text keywords → sport, used when an entry has no sport section
+SPORT_KEYWORDS = {
+    'soccer': 'Soccer',
+    'football': 'Soccer',
+    "men's soccer": 'Soccer',
+    'mens soccer': 'Soccer',
+    'goalkeeper': 'Soccer',
+    'goalie': 'Soccer',
+    'midfielder': 'Soccer',
+    'defender': 'Soccer',
+    'forward': 'Soccer',
+    'striker': 'Soccer',
+    'baseball': 'Baseball',
+    'basketball': 'Basketball',
+    'tennis': 'Tennis',
+    'swimming': 'Swimming',
+    'track': 'Track & Field',
+    'field': 'Track & Field',
+    'cross country': 'Cross Country',
+    'volleyball': 'Volleyball',
+    'golf': 'Golf',
+    'wrestling': 'Wrestling',
+    'lacrosse': 'Lacrosse',
+    'softball': 'Softball',
+    'hockey': 'Hockey',
+    'rowing': 'Rowing',
+    'strength': 'Strength & Conditioning',
+    'conditioning': 'Strength & Conditioning'
+}
+# Zero-width so overlapping keywords ("men's soccer" / 'soccer') are all seen;
+# no keyword is a prefix of another, so one alternative per position suffices
+SPORT_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, SPORT_KEYWORDS)) + "))")
+ROLE_RE = re.compile(r'(Head Coach|Assistant Coach|Defensive Coordinator|[A-Za-z\s]+Coach)', re.IGNORECASE)
+
+# Known athletics directories, checked in order: the filename keyword, the
+# phrases that identify the school in the PDF text, and the info to record
+KNOWN_SCHOOLS = (
+    ('bryant', ('bryant university',), {
+        'university': 'Bryant',
+        'organization': 'Bryant University Athletics',
+        'location': 'Smithfield, Rhode Island',
+        'source': "Bryant University Men's Soccer Coaches Directory",
+    }),
+    ('rowan', ('rowan university',), {
+        'university': 'Rowan',
+        'organization': 'Rowan University Athletics',
+        'location': 'Glassboro, New Jersey',
+        'source': 'Rowan University Athletics Staff Directory',
+    }),
+    ('rutgers', ('rutgers university', 'scarlet knights'), {
+        'university': 'Rutgers',
+        'organization': 'Rutgers University Athletics',
+        'location': 'Piscataway, New Jersey',
+        'source': 'Rutgers University Athletics Staff Directory',
+    }),
+)
+
+# New unclaimed coach profile, in document order. Fields set to None are
+# filled per entry by map_to_coach_profile, which also gives each profile
+# its own lists and dicts. Timestamps are set at upload time.
+COACH_PROFILE_TEMPLATE = {
+    'username': None,
+    'displayName': None,
+    'email': None,
+    'bio': None,
+    'sports': None,
+    'experience': 5,
+    'certifications': None,
+    'hourlyRate': 0,
+    'location': None,
+    'availability': None,
+    'specialties': None,
+    'languages': None,
+    'organization': None,
+    'role': None,
+    'gender': '',
+    'ageGroup': None,
+    'sourceUrl': None,
+    'averageRating': 0,
+    'totalReviews': 0,
+    'isVerified': False,
+    'isPublic': True,
+    'hasActiveServices': False,
+    'profileImage': '',
+    'website': '',
+    'socialMedia': None,
+    'createdAt': None,
+    'updatedAt': None,
+    'profileCompleted': False,
+    'isClaimed': False,
+    'userId': None,
+    'claimedAt': None,
+    'verificationStatus': 'pending'
+}
+
+# google.rpc status codes worth retrying for a bulk write: DEADLINE_EXCEEDED, ABORTED, UNAVAILABLE
+RETRYABLE_WRITE_CODES = (4, 10, 14)
+MAX_WRITE_ATTEMPTS = 5
+
+
 def extract_and_format_phone(line: str, area_code: Optional[str]) -> Optional[str]:
-    phone_patterns = [
-        r'\(\d{3}\)\s*\d{3}-\d{4}',
-        r'\(\d{3}\)\s*\d{3}\.\d{4}',
-        r'\d{3}-\d{3}-\d{4}',
-        r'\d{3}\.\d{3}\.\d{4}',
-        r'\d{3}\s+\d{3}-\d{4}',
-        r'\d{3}-\d{4}',
-        r'\d{3}\.\d{4}',
-        r'\b\d{7}\b'
-    ]
-    for pattern in phone_patterns:
-        match = re.search(pattern, line)
+    if not ANY_PHONE_RE.search(line):
+        return None
+    for pattern, shape in PHONE_PATTERNS:
+        match = pattern.search(line)
         if match:
-            phone = match.group().strip()
-            if area_code and (re.match(r'^\d{3}-\d{4}$', phone) or re.match(r'^\d{3}\.\d{4}$', phone) or re.match(r'^\d{7}$', phone)):
-                if re.match(r'^\d{7}$', phone):
-                    phone = phone[:3] + '-' + phone[3:]
+            # No pattern can match leading or trailing whitespace
+            phone = match.group()
+            if shape == 'local_7' and area_code:
                 return f"({area_code}) {phone}"
-            elif re.match(r'^\d{3}-\d{3}-\d{4}$', phone):
-                area = phone[:3]
-                number = phone[4:]
-                return f"({area}) {number}"
-            elif re.match(r'^\d{3}\s+\d{3}-\d{4}$', phone):
-                parts = phone.split()
-                area = parts[0]
-                number = parts[1]
+            elif shape == 'digits_7' and area_code:
+                return f"({area_code}) {phone[:3]}-{phone[3:]}"
+            elif shape == 'dashed_10':
+                return f"({phone[:3]}) {phone[4:]}"
+            elif shape == 'spaced_10':
+                area, number = phone.split()
                 return f"({area}) {number}"
-            elif re.match(r'^\(\d{3}\)', phone):
-                return phone
             else:
                 return phone
     return None
@@ -364,44 +653,54 @@ def detect_pdf_info(path: str, text_content: str) -> Dict[str, str]:
         'source': ''
     }
     filename = os.path.basename(path).lower()
-    if 'bryant' in filename:
-        pdf_info['university'] = 'Bryant'
-        pdf_info['organization'] = "Bryant University Athletics"
-        pdf_info['location'] = 'Smithfield, Rhode Island'
-        pdf_info['source'] = "Bryant University Men's Soccer Coaches Directory"
-    elif 'rowan' in filename:
-        pdf_info['university'] = 'Rowan'
-        pdf_info['organization'] = 'Rowan University Athletics'
-        pdf_info['location'] = 'Glassboro, New Jersey'
-        pdf_info['source'] = 'Rowan University Athletics Staff Directory'
-    elif 'rutgers' in filename:
-        pdf_info['university'] = 'Rutgers'
-        pdf_info['organization'] = 'Rutgers University Athletics'
-        pdf_info['location'] = 'Piscataway, New Jersey'
-        pdf_info['source'] = 'Rutgers University Athletics Staff Directory'
+    for keyword, _, info in KNOWN_SCHOOLS:
+        if keyword in filename:
+            pdf_info.update(info)
+            break
 
     content_lower = text_content.lower()
-    if 'bryant university' in content_lower:
-        pdf_info['university'] = 'Bryant'
-        if not pdf_info['organization']:
-            pdf_info['organization'] = 'Bryant University Athletics'
-            pdf_info['location'] = 'Smithfield, Rhode Island'
-    elif 'rowan university' in content_lower:
-        pdf_info['university'] = 'Rowan'
-        if not pdf_info['organization']:
-            pdf_info['organization'] = 'Rowan University Athletics'
-            pdf_info['location'] = 'Glassboro, New Jersey'
-    elif 'rutgers university' in content_lower or 'scarlet knights' in content_lower:
-        pdf_info['university'] = 'Rutgers'
-        if not pdf_info['organization']:
-            pdf_info['organization'] = 'Rutgers University Athletics'
-            pdf_info['location'] = 'Piscataway, New Jersey'
+    for _, phrases, info in KNOWN_SCHOOLS:
+        if any(phrase in content_lower for phrase in phrases):
+            pdf_info['university'] = info['university']
+            if not pdf_info['organization']:
+                pdf_info['organization'] = info['organization']
+                pdf_info['location'] = info['location']
+            break
     return pdf_info
 
 
-def parse_pdf(path: str, output_txt: Optional[str] = None) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
-    import pdfplumber
+def extract_pdf_text(path: str) -> str:
+    """
+    Text of every non-empty page joined with newlines. Text comes from
+    PDFium (C++); pages where it finds nothing are retried with pdfplumber,
+    which is only opened if needed.
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        page_texts: List[str] = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+
+    empty_pages = [index for index, page_text in enumerate(page_texts) if not page_text.strip()]
+    if empty_pages:
+        import pdfplumber
+
+        # extract_text() runs pdfminer's layout analysis, so call it once per page
+        with pdfplumber.open(path) as plumber_pdf:
+            for index in empty_pages:
+                page_texts[index] = plumber_pdf.pages[index].extract_text() or ""
 
+    return "\n".join(page_text for page_text in page_texts if page_text)
+
+
+def parse_pdf(path: str, output_txt: Optional[str] = None) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
     entries: List[Dict[str, str]] = []
     all_lines: List[str] = []
     area_code: Optional[str] = None
@@ -410,18 +709,10 @@ def parse_pdf(path: str, output_txt: Optional[str] = None) -> Tuple[List[Dict[st
         with open(path, 'r', encoding='utf-8') as f:
             text = f.read()
     else:
-        with pdfplumber.open(path) as pdf:
-            text = "\n".join(page.extract_text() for page in pdf.pages if page.extract_text())
-
-    area_code_patterns = [
-        r'Area Code \((\d{3})\)',
-        r'Area Code: \((\d{3})\)',
-        r'Area Code (\d{3})',
-        r'Area Code: (\d{3})',
-        r'\((\d{3})\) area code'
-    ]
-    for pattern in area_code_patterns:
-        m = re.search(pattern, text, re.IGNORECASE)
+        text = extract_pdf_text(path)
+
+    for pattern in AREA_CODE_PATTERNS:
+        m = pattern.search(text)
         if m:
             area_code = m.group(1)
             break
@@ -433,15 +724,16 @@ def parse_pdf(path: str, output_txt: Optional[str] = None) -> Tuple[List[Dict[st
     current_sport_section: Optional[str] = None
     for i, line in enumerate(lines):
         line_stripped = line.strip()
-        sport_section_match = re.match(r'^([A-Z\s&]+(?:\([^)]+\))?)$', line_stripped)
+        sport_section_match = SPORT_SECTION_RE.match(line_stripped)
         if sport_section_match and any(sport in line_stripped.lower() for sport in [
             'baseball','basketball','soccer','football','swimming','volleyball','lacrosse','track','field hockey','cross country','softball'
         ]):
             current_sport_section = line_stripped
             continue
         # Strip any embedded hyperlinks from names (e.g., 'Dr. G. Anthony Grant' linked)
-        line = re.sub(r'https?://\S+', '', line)
-        m = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
+        if '://' in line:
+            line = URL_RE.sub('', line)
+        m = EMAIL_RE.search(line) if '@' in line else None
         if not m:
             continue
         if 'coach' not in line.lower():
@@ -471,7 +763,7 @@ def parse_pdf(path: str, output_txt: Optional[str] = None) -> Tuple[List[Dict[st
 
     if not single_line_entries:
         for i, line in enumerate(lines):
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
+            email_match = EMAIL_RE.search(line)
             if not email_match:
                 continue
             email = email_match.group()
@@ -482,12 +774,12 @@ def parse_pdf(path: str, output_txt: Optional[str] = None) -> Tuple[List[Dict[st
             for j in range(1, 4):
                 if i - j < 0:
                     break
-                prev_line = re.sub(r'https?://\S+', '', lines[i - j]).strip()
+                prev_line = URL_RE.sub('', lines[i - j]).strip()
                 if 'coach' in prev_line.lower() and not coach_title:
                     coach_title = prev_line
                     if i - j - 1 >= 0:
                         potential_name_line = lines[i - j - 1].strip()
-                        if (potential_name_line and not re.search(r'[\w\.-]+@[\w\.-]+\.\w+', potential_name_line) and not any(k in potential_name_line.lower() for k in ['coaching','staff','soccer','university','2025','/','pm','am','director of']) and len(potential_name_line.split()) >= 2):
+                        if (potential_name_line and not EMAIL_RE.search(potential_name_line) and not any(k in potential_name_line.lower() for k in ['coaching','staff','soccer','university','2025','/','pm','am','director of']) and len(potential_name_line.split()) >= 2):
                             coach_name = potential_name_line
                     break
             for j in range(1, 3):
@@ -613,36 +905,11 @@ def map_to_coach_profile(entry: Dict[str, str], pdf_info: Optional[Dict[str, str
         elif 'field hockey' in sport_section:
             sports.append('Field Hockey')
     if not sports:
-        sport_keywords = {
-            'soccer': 'Soccer',
-            'football': 'Soccer',
-            "men's soccer": 'Soccer',
-            'mens soccer': 'Soccer',
-            'goalkeeper': 'Soccer',
-            'goalie': 'Soccer',
-            'midfielder': 'Soccer',
-            'defender': 'Soccer',
-            'forward': 'Soccer',
-            'striker': 'Soccer',
-            'baseball': 'Baseball',
-            'basketball': 'Basketball',
-            'tennis': 'Tennis',
-            'swimming': 'Swimming',
-            'track': 'Track & Field',
-            'field': 'Track & Field',
-            'cross country': 'Cross Country',
-            'volleyball': 'Volleyball',
-            'golf': 'Golf',
-            'wrestling': 'Wrestling',
-            'lacrosse': 'Lacrosse',
-            'softball': 'Softball',
-            'hockey': 'Hockey',
-            'rowing': 'Rowing',
-            'strength': 'Strength & Conditioning',
-            'conditioning': 'Strength & Conditioning'
-        }
-        for keyword, sport in sport_keywords.items():
-            if keyword in role_text and sport not in sports:
+        # Every keyword occurring anywhere in the line, found in one scan;
+        # sports are still listed in keyword order
+        found = set(SPORT_KEYWORD_RE.findall(role_text))
+        for keyword, sport in SPORT_KEYWORDS.items():
+            if keyword in found and sport not in sports:
                 sports.append(sport)
     default_sport: Optional[str] = 'Soccer'
     if pdf_info:
@@ -656,7 +923,7 @@ def map_to_coach_profile(entry: Dict[str, str], pdf_info: Optional[Dict[str, str
         sports = ['General Athletics']
     role_part = entry.get('full_line', '')
     if 'coach' in role_part.lower():
-        role_match = re.search(r'(Head Coach|Assistant Coach|Defensive Coordinator|[A-Za-z\s]+Coach)', role_part, re.IGNORECASE)
+        role_match = ROLE_RE.search(role_part)
         role = role_match.group(1) if role_match else 'Coach'
     else:
         role = 'Coach'
@@ -668,50 +935,50 @@ def map_to_coach_profile(entry: Dict[str, str], pdf_info: Optional[Dict[str, str
         location = 'New Jersey'
         organization = 'University Athletics'
         source_url = 'University Athletics Directory'
-    coach_profile = {
-        'username': entry['username'],
-        'displayName': f"{entry['first_name']} {entry['last_name']}".strip(),
-        'email': entry['email'],
-        'bio': f"Experienced {role.lower()} specializing in {', '.join(sports).lower()}.",
-        'sports': sports,
-        'experience': 5,
-        'certifications': [],
-        'hourlyRate': 0,
-        'location': location,
-        'availability': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'],
-        'specialties': sports,
-        'languages': ['English'],
-        'organization': organization,
-        'role': role,
-        'gender': '',
-        'ageGroup': ['Adult', 'Teen', 'Youth'],
-        'sourceUrl': source_url,
-        'averageRating': 0,
-        'totalReviews': 0,
-        'isVerified': False,
-        'isPublic': True,
-        'hasActiveServices': False,
-        'profileImage': '',
-        'website': '',
-        'socialMedia': {
+    coach_profile = COACH_PROFILE_TEMPLATE.copy()
+    coach_profile.update(
+        username=entry['username'],
+        displayName=f"{entry['first_name']} {entry['last_name']}".strip(),
+        email=entry['email'],
+        bio=f"Experienced {role.lower()} specializing in {', '.join(sports).lower()}.",
+        sports=sports,
+        certifications=[],
+        location=location,
+        availability=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'],
+        specialties=sports,
+        languages=['English'],
+        organization=organization,
+        role=role,
+        ageGroup=['Adult', 'Teen', 'Youth'],
+        sourceUrl=source_url,
+        socialMedia={
             'instagram': '',
             'twitter': '',
             'linkedin': ''
         },
-        'createdAt': None,
-        'updatedAt': None,
-        'profileCompleted': False,
-        'isClaimed': False,
-        'userId': None,
-        'claimedAt': None,
-        'verificationStatus': 'pending'
-    }
+    )
     if 'phone' in entry:
         coach_profile['phoneNumber'] = entry['phone']
     return coach_profile
 
 
-def upload_to_firestore(entries: List[Dict[str, str]], key_path: str, pdf_info: Optional[Dict[str, str]] = None, collection: str = 'coaches', dry_run: bool = False):
+@lru_cache(maxsize=None)
+def get_firestore_client(key_path: str):
+    """Firestore client for a service-account key, created once per process"""
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+
+    # Initialize Firebase app once per process
+    try:
+        # Will raise if app not initialized
+        firebase_admin.get_app()
+    except ValueError:
+        cred = credentials.Certificate(key_path)
+        firebase_admin.initialize_app(cred)
+    return firestore.client()
+
+
+def upload_to_firestore(entries: List[Dict[str, str]], db=None, pdf_info: Optional[Dict[str, str]] = None, collection: str = 'coaches', dry_run: bool = False):
     if dry_run:
         print("DRY RUN MODE - No actual upload to Firestore")
         for e in entries:
@@ -720,39 +987,72 @@ def upload_to_firestore(entries: List[Dict[str, str]], key_path: str, pdf_info:
             print(f"[DRY RUN] Would create unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → {collection}/{coach_profile['username']}{phone_info}")
         return
 
-    import firebase_admin
-    from firebase_admin import credentials, firestore
-
-    cred = credentials.Certificate(key_path)
-    firebase_admin.initialize_app(cred)
-    db = firestore.client()
+    from firebase_admin import firestore
+    from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 
     uploaded_count = 0
     skipped_count = 0
+
+    # One profile per username; a later entry for the same username wins,
+    # as it would have with sequential set() calls
+    profiles: Dict[str, Dict[str, object]] = {}
     for e in entries:
         try:
             coach_profile = map_to_coach_profile(e, pdf_info)
-            username = coach_profile['username']
-            coach_ref = db.collection(collection).document(username)
-            existing_coach = coach_ref.get()
-            if existing_coach.exists:
-                existing_data = existing_coach.to_dict()
+            # Ensure server timestamps
+            coach_profile['createdAt'] = firestore.SERVER_TIMESTAMP
+            coach_profile['updatedAt'] = firestore.SERVER_TIMESTAMP
+            profiles[coach_profile['username']] = coach_profile
+        except Exception as error:
+            print(f"❌ Error processing {e.get('email','?')}: {error}")
+
+    refs = [db.collection(collection).document(username) for username in profiles]
+    existing_usernames: set = set()
+
+    # Acknowledgements for this batch arrive on BulkWriter threads while
+    # later profiles are still being queued
+    count_lock = threading.Lock()
+
+    def on_write_result(reference, result, bulk_writer):
+        nonlocal uploaded_count
+        coach_profile = profiles[reference.id]
+        phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
+        status = "Updated" if reference.id in existing_usernames else "Created"
+        print(f"✔ {status} unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → {collection}/{reference.id}{phone_info}")
+        with count_lock:
+            uploaded_count += 1
+
+    def on_write_error(failure, bulk_writer):
+        # Timeouts, contention and transient unavailability are retried with backoff
+        if failure.code in RETRYABLE_WRITE_CODES and failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        print(f"❌ Error processing {profiles[failure.operation.reference.id]['email']}: {failure.message}")
+        return False
+
+    bulk_writer = db.bulk_writer(options=BulkWriterOptions(initial_ops_per_second=500))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+
+    try:
+        # Single batched read instead of one get() round trip per coach
+        for coach_doc in db.get_all(refs):
+            username = coach_doc.id
+            coach_profile = profiles[username]
+            if coach_doc.exists:
+                existing_data = coach_doc.to_dict()
                 if existing_data.get('isClaimed', False):
                     print(f"⏭️  Skipped {coach_profile['email']} - already claimed by user")
                     skipped_count += 1
                     continue
                 else:
                     print(f"🔄 Updating unclaimed profile for {coach_profile['email']}")
-            # Ensure server timestamps
-            coach_profile['createdAt'] = firestore.SERVER_TIMESTAMP
-            coach_profile['updatedAt'] = firestore.SERVER_TIMESTAMP
-            coach_ref.set(coach_profile)
-            phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
-            status = "Updated" if existing_coach.exists else "Created"
-            print(f"✔ {status} unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → {collection}/{username}{phone_info}")
-            uploaded_count += 1
-        except Exception as error:
-            print(f"❌ Error processing {e.get('email','?')}: {error}")
+                    existing_usernames.add(username)
+            bulk_writer.set(coach_doc.reference, coach_profile)
+    except Exception as error:
+        print(f"❌ Error looking up coach profiles: {error}")
+    finally:
+        # Flushes all queued writes and waits for their results
+        bulk_writer.close()
 
     print("\n📊 Upload Summary:")
     print(f"✔ {uploaded_count} coach profiles created/updated")
@@ -772,6 +1072,23 @@ def collect_state_folder(base_dir: Path, state: Optional[str], state_folder: Opt
     return (base_dir / 'pdfs' / state.lower()).resolve()
 
 
+def parse_printed_pdf(outfile: str, run_stamp: str) -> Tuple[Path, Optional[List[Dict[str, str]]], Optional[str]]:
+    """
+    Parse one printed PDF, writing its review file (named with the run's
+    `run_stamp`) next to it.
+    Returns (review_file, entries, error); entries is None if parsing failed.
+    Runs in a worker process, so issue files are left to the caller.
+    """
+    pdf_file = Path(outfile)
+    # Write a small review file next to the PDF for auditing
+    txt_out = pdf_file.parent / f"coaches_filtered_{pdf_file.stem}_{run_stamp}.txt"
+    try:
+        entries, _ = parse_pdf(str(pdf_file), str(txt_out))
+    except Exception as e:
+        return txt_out, None, str(e)
+    return txt_out, entries, None
+
+
 def main():
     parser = argparse.ArgumentParser(description="Print athletics staff directories from CSV and upload parsed coaches to Firestore.")
     parser.add_argument("--state", help="Two-letter state code (e.g., pa). If provided, output folder is pdfs/<state>.")
@@ -780,7 +1097,9 @@ def main():
     parser.add_argument("--key", help="Path to Firebase Admin JSON key (optional for dry-run)")
     parser.add_argument("--collection", default="coaches", help="Firestore collection to write documents into (default: coaches)")
     parser.add_argument("--concurrency", type=int, default=4, help="Parallel renderers (default: 4)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes used to parse printed PDFs (default: CPU count)")
     parser.add_argument("--timeout", type=int, default=30000, help="Page timeout in ms (default: 30000)")
+    parser.add_argument("--disable-js", action="store_true", help="Render pages without JavaScript (faster for static directory pages)")
     parser.add_argument("--zip", action="store_true", help="Zip the state folder after printing")
     parser.add_argument("--dry-run", action="store_true", help="Parse and show results without uploading to Firestore")
     args = parser.parse_args()
@@ -805,38 +1124,48 @@ def main():
     rows = read_rows(csv_path)
 
     t0 = time.time()
+    run_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # Text extraction is CPU-bound, so printed PDFs are parsed in separate
+    # processes while rendering continues. Workers are spawned, not forked,
+    # since the event loop and browser driver are already running by then.
+    # With one worker or one row, PDFs are parsed in-process after printing
+    parse_pool = None
+    if args.workers > 1 and len(rows) > 1:
+        parse_pool = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"))
     try:
-        results = asyncio.run(print_all_from_csv(rows, out_dir, concurrency=max(1, args.concurrency), timeout_ms=args.timeout))
+        results = asyncio.run(print_all_from_csv(rows, out_dir, concurrency=max(1, args.concurrency), timeout_ms=args.timeout, javascript_enabled=not args.disable_js, parse_pool=parse_pool, run_stamp=run_stamp))
     except KeyboardInterrupt:
         sys.exit("Interrupted.")
     except Exception as e:
         sys.exit(f"Fatal error during printing: {e}")
-
-    ok = [r for r in results if r.get('status') == 'ok']
-    skipped = [r for r in results if r.get('status') == 'skipped']
-    err = [r for r in results if r.get('status') not in ('ok', 'skipped')]
-    print(f"\nPrinting completed in {time.time()-t0:.1f}s")
-    print(f"Success: {len(ok)} | Skipped: {len(skipped)} | Errors: {len(err)}")
+    finally:
+        if parse_pool:
+            parse_pool.shutdown(cancel_futures=True)
+
+    ok: List[Dict[str, object]] = []
+    skipped: List[Dict[str, object]] = []
+    err: List[Dict[str, object]] = []
+    for r in results:
+        status = r.get('status')
+        (ok if status == 'ok' else skipped if status == 'skipped' else err).append(r)
+    # The report can run to thousands of lines, so it is printed in one write
+    report = [
+        f"\nPrinting completed in {time.time()-t0:.1f}s",
+        f"Success: {len(ok)} | Skipped: {len(skipped)} | Errors: {len(err)}",
+    ]
     if ok:
-        print("\nResolved URLs used:")
-        for r in ok:
-            print(f"- {Path(r['outfile']).name}: {r.get('url', '')}")
+        report.append("\nResolved URLs used:")
+        report.extend(f"- {Path(r['outfile']).name}: {r.get('url', '')}" for r in ok)
     if err:
-        print("\nErrors:")
-        for r in err:
-            print(f"- {r['url']} -> {r['error']}")
+        report.append("\nErrors:")
+        report.extend(f"- {r['url']} -> {r['error']}" for r in err)
     if skipped:
-        print("\nSkipped:")
+        report.append("\nSkipped:")
         for r in skipped:
             tried = ", ".join(r.get('attempted_urls', [])) if isinstance(r.get('attempted_urls'), list) else ""
             suffix = f" (tried: {tried})" if tried else ""
-            print(f"- {r['url']} -> {r['error']}{suffix}")
-
-    # Optional zip
-    if args.zip and ok:
-        zip_path = (out_dir.parent / f"{out_dir.name}.zip").resolve()
-        print(f"\nZipping PDFs to: {zip_path}")
-        zip_folder(out_dir, zip_path)
+            report.append(f"- {r['url']} -> {r['error']}{suffix}")
+    print("\n".join(report))
 
     # Prepare issues folder
     issues_dir = out_dir / "issues"
@@ -844,83 +1173,94 @@ def main():
 
     # Record skipped/errored links into issues summary
     if skipped:
-        with (issues_dir / "skipped-links.txt").open("w", encoding="utf-8") as f:
-            for r in skipped:
-                tried = ", ".join(r.get('attempted_urls', [])) if isinstance(r.get('attempted_urls'), list) else ""
-                f.write(f"{Path(r.get('outfile', 'unknown.pdf')).name} :: {r.get('url','')} :: {r.get('error','')}\n")
-                if tried:
-                    f.write(f"  tried: {tried}\n")
-                f.write("\n")
-
-    # Parse all successfully generated PDFs and upload
+        parts: List[str] = []
+        for r in skipped:
+            tried = ", ".join(r.get('attempted_urls', [])) if isinstance(r.get('attempted_urls'), list) else ""
+            parts.append(f"{Path(r.get('outfile', 'unknown.pdf')).name} :: {r.get('url','')} :: {r.get('error','')}\n")
+            if tried:
+                parts.append(f"  tried: {tried}\n")
+            parts.append("\n")
+        (issues_dir / "skipped-links.txt").write_text("".join(parts), encoding="utf-8")
+
+    # Collect entries parsed from successfully generated PDFs and upload
     print("\nParsing printed PDFs and preparing upload entries...")
-    all_entries: List[Dict[str, str]] = []
-    seen_usernames: set = set()
+    # First entry per username wins; dict order keeps entries in parse order
+    entries_by_username: Dict[str, Dict[str, str]] = {}
     zero_coaches: List[str] = []
     low_quality_colleges: List[str] = []
+    # Per-PDF issues are recorded as one JSON line each in a file per category
+    parse_errors: List[Dict[str, object]] = []
+    low_quality_samples: List[Dict[str, object]] = []
     for r in ok:
-        pdf_file = Path(r['outfile'])
-        # Write a small review file next to the PDF for auditing
-        txt_out = pdf_file.with_suffix("")
-        txt_out = txt_out.parent / f"coaches_filtered_{txt_out.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        try:
-            entries, pdf_info = parse_pdf(str(pdf_file), str(txt_out))
-        except Exception as e:
-            print(f"❌ Parse failed for {pdf_file.name}: {e}")
+        pdf_name = Path(r['outfile']).name
+        if 'parsed' in r:
+            txt_out, entries, parse_error = r['parsed']
+        else:
+            txt_out, entries, parse_error = parse_printed_pdf(r['outfile'], run_stamp)
+        if entries is None:
+            print(f"❌ Parse failed for {pdf_name}: {parse_error}")
             # Record as issue
-            with (issues_dir / f"{pdf_file.stem} - PARSE_ERROR.txt").open("w", encoding="utf-8") as f:
-                f.write(f"Parse failed for {pdf_file.name}: {e}\n")
+            parse_errors.append({"pdf": pdf_name, "error": parse_error})
             continue
         # Flag zero-coach PDFs
         if len(entries) == 0:
-            zero_coaches.append(pdf_file.name)
-            with (issues_dir / f"{pdf_file.stem} - NO_COACHES.txt").open("w", encoding="utf-8") as f:
-                f.write(f"No coach entries parsed from {pdf_file.name}\n")
+            zero_coaches.append(pdf_name)
             continue
 
         # Low-quality detection
         low_quality, bad_sample = is_low_quality_entries(entries)
         if low_quality:
-            low_quality_colleges.append(pdf_file.name)
-            issue_file = issues_dir / f"{pdf_file.stem} - LOW_QUALITY.txt"
-            with issue_file.open("w", encoding="utf-8") as f:
-                f.write(f"Low-quality parsing detected in {pdf_file.name}.\n")
-                f.write(f"Sample problematic entries ({len(bad_sample)}):\n")
-                for bx in bad_sample:
-                    f.write(f"- {bx.get('full_line','').strip()}\n")
-            # Copy the filtered output for review if it exists
+            low_quality_colleges.append(pdf_name)
+            low_quality_samples.append({
+                "pdf": pdf_name,
+                "sample": [bx.get('full_line', '').strip() for bx in bad_sample],
+            })
+            # Link the filtered output for review if it exists, copying only
+            # where hard links aren't supported (or the name is taken)
             try:
                 if txt_out.exists():
-                    shutil.copy2(txt_out, issues_dir / txt_out.name)
+                    try:
+                        os.link(txt_out, issues_dir / txt_out.name)
+                    except OSError:
+                        shutil.copy2(txt_out, issues_dir / txt_out.name)
             except Exception:
                 pass
 
         for e in entries:
-            if e['username'] in seen_usernames:
-                continue
-            seen_usernames.add(e['username'])
-            all_entries.append(e)
+            entries_by_username.setdefault(e['username'], e)
 
+    all_entries = list(entries_by_username.values())
     print(f"✔ Total coach entries prepared: {len(all_entries)}")
+    if parse_errors:
+        write_jsonl(issues_dir / "parse_errors.jsonl", parse_errors)
+    if zero_coaches:
+        write_jsonl(issues_dir / "no_coaches.jsonl", [{"pdf": name} for name in zero_coaches])
+    if low_quality_samples:
+        write_jsonl(issues_dir / "low_quality.jsonl", low_quality_samples)
     # Write issues summary
     summary_path = issues_dir / "summary.txt"
-    with summary_path.open("w", encoding="utf-8") as f:
-        f.write(f"Printing results: Success={len(ok)} Skipped={len(skipped)} Errors={len(err)}\n")
-        if skipped:
-            f.write("\nSkipped/Failed links:\n")
-            for r in skipped:
-                tried = ", ".join(r.get('attempted_urls', [])) if isinstance(r.get('attempted_urls'), list) else ""
-                f.write(f"- {Path(r.get('outfile','unknown.pdf')).name}: {r.get('url','')} -> {r.get('error','')}\n")
-                if tried:
-                    f.write(f"  tried: {tried}\n")
-        if zero_coaches:
-            f.write("\nPDFs with zero coaches detected:\n")
-            for name in zero_coaches:
-                f.write(f"- {name}\n")
-        if low_quality_colleges:
-            f.write("\nPDFs flagged as low-quality parsing:\n")
-            for name in low_quality_colleges:
-                f.write(f"- {name}\n")
+    parts = [f"Printing results: Success={len(ok)} Skipped={len(skipped)} Errors={len(err)}\n"]
+    if skipped:
+        parts.append("\nSkipped/Failed links:\n")
+        for r in skipped:
+            tried = ", ".join(r.get('attempted_urls', [])) if isinstance(r.get('attempted_urls'), list) else ""
+            parts.append(f"- {Path(r.get('outfile','unknown.pdf')).name}: {r.get('url','')} -> {r.get('error','')}\n")
+            if tried:
+                parts.append(f"  tried: {tried}\n")
+    if zero_coaches:
+        parts.append("\nPDFs with zero coaches detected:\n")
+        parts.extend(f"- {name}\n" for name in zero_coaches)
+    if low_quality_colleges:
+        parts.append("\nPDFs flagged as low-quality parsing:\n")
+        parts.extend(f"- {name}\n" for name in low_quality_colleges)
+    summary_path.write_text("".join(parts), encoding="utf-8")
+
+    # Optional zip; after parsing, so the review and issue files are archived
+    # whether PDFs were parsed in the pool or in-process
+    if args.zip and ok:
+        zip_path = (out_dir.parent / f"{out_dir.name}.zip").resolve()
+        print(f"\nZipping PDFs to: {zip_path}")
+        zip_folder(out_dir, zip_path)
 
     if len(all_entries) == 0:
         print("No coach entries parsed from PDFs. Nothing to upload.")
@@ -928,12 +1268,12 @@ def main():
 
     # Upload
     if args.dry_run:
-        upload_to_firestore(all_entries, key_path=args.key or "", pdf_info=None, collection=args.collection, dry_run=True)
+        upload_to_firestore(all_entries, pdf_info=None, collection=args.collection, dry_run=True)
     else:
         if not args.key:
             print("No Firebase key provided. Use --dry-run or provide --key to upload.")
             return
-        upload_to_firestore(all_entries, key_path=args.key, pdf_info=None, collection=args.collection, dry_run=False)
+        upload_to_firestore(all_entries, get_firestore_client(args.key), pdf_info=None, collection=args.collection, dry_run=False)
 
 
 if __name__ == "__main__":
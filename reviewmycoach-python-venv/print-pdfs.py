@@ -2,14 +2,16 @@
 import argparse
 import asyncio
 import csv
+import itertools
 import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Set
 
 # -------- Utilities --------
 
@@ -18,21 +20,20 @@ def slugify(text: str) -> str:
     text = re.sub(r"[^a-z0-9]+", "-", text)
     return re.sub(r"-+", "-", text).strip("-") or "file"
 
-def read_rows(csv_path: Path) -> List[Dict[str, str]]:
-    rows = []
+def iter_rows(csv_path: Path) -> Iterator[Dict[str, str]]:
+    """Yield normalized row dicts one at a time; the CSV is never held in memory."""
     with csv_path.open(newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Normalize the header once instead of every row's keys
+        header = [c.strip() for c in next(reader, [])]
         required = {"print_url"}
-        missing = required - set([c.strip() for c in reader.fieldnames or []])
+        missing = required - set(header)
         if missing:
             sys.exit(f"ERROR: CSV is missing required column(s): {', '.join(sorted(missing))}")
         for row in reader:
-            # Normalize keys
-            row = { (k or "").strip(): (v or "").strip() for k, v in row.items() }
-            rows.append(row)
-    if not rows:
-        sys.exit("ERROR: CSV has no data rows.")
-    return rows
+            if not row:
+                continue
+            yield {k: v.strip() for k, v in zip(header, row)}
 
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
@@ -46,80 +47,275 @@ def build_output_filename(row: Dict[str, str]) -> str:
     base = row.get("college") or row.get("state") or row.get("print_url") or "output"
     return f"{slugify(base)}.pdf"
 
-def zip_folder(folder: Path, zip_path: Path):
-    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zf:
-        for root, _, files in os.walk(folder):
-            for fn in files:
-                full = Path(root) / fn
-                arc = full.relative_to(folder)
-                zf.write(full, arcname=str(arc))
-
 # -------- Playwright worker --------
 
-async def render_pdf(browser, task, out_dir: Path, timeout_ms: int) -> Dict[str, str]:
+# Contexts are recycled after this many renders to bound Chromium memory growth
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100"))
+
+# Upper bound on waiting for the "load" event after DOMContentLoaded
+LOAD_WAIT_MS = 5000
+
+# Analytics/tracker hosts that keep the network busy without affecting print output
+TRACKER_RE = re.compile(r"(google-analytics|googletagmanager|doubleclick|hotjar|segment)\.(com|io|net)")
+
+# Resource types skipped unless --load-images is given; print CSS rarely needs them
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "other"})
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        # Defer to earlier routes (tracker blocking) before the network
+        await route.fallback()
+
+async def new_context(browser, load_images: bool = False):
+    # Isolated context: no cookie/cache bleed between concurrent renders
+    # Extra headers help some sites avoid blocking
+    context = await browser.new_context(extra_http_headers={"User-Agent": "Mozilla/5.0 (PDFBot) Playwright"})
+    # Routes are installed once per context, not per page
+    await context.route(TRACKER_RE, lambda route: route.abort())
+    if not load_images:
+        await context.route("**/*", _block_heavy_resources)
+    return context
+
+async def render_pdf(context, task, out_dir: Path, timeout_ms: int,
+                     zf: ZipFile, zip_lock: asyncio.Lock, keep_pdfs: bool = False,
+                     zip_writes: Optional[Dict[str, asyncio.Task]] = None) -> Dict[str, str]:
     """
     task: { 'print_url': str, 'outfile': str, 'college': str?, 'state': str? }
+
+    The PDF bytes are handed to the zip (and optionally --out) and released
+    before returning; only metadata is returned, so results never hold PDFs.
+    The zip write task is registered in `zip_writes` under the task's outfile,
+    so a caller that times the render out can still wait for it.
     """
-    page = await browser.new_page()
     url = task["print_url"]
     outfile = out_dir / task["outfile"]
-    info = {"url": url, "outfile": str(outfile), "status": "ok", "error": ""}
+    info = {"url": url, "outfile": str(outfile), "status": "ok", "error": "", "size": 0}
 
+    page = None
     try:
-        # Extra headers help some sites avoid blocking
-        await page.set_extra_http_headers({"User-Agent": "Mozilla/5.0 (PDFBot) Playwright"})
-        await page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+        page = await context.new_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+        # Give JS-driven content a bounded chance to finish; print what we have otherwise
+        try:
+            await page.wait_for_load_state("load", timeout=min(timeout_ms, LOAD_WAIT_MS))
+        except Exception:
+            pass
         # Try to apply print CSS
         await page.emulate_media(media="print")
 
-        # Some print pages need a small delay for JS-driven content
-        await page.wait_for_timeout(800)
-
-        # Create parent dir
-        ensure_dir(outfile.parent)
-
         # High quality PDF (tweak as needed)
-        await page.pdf(
-            path=str(outfile),
+        data = await page.pdf(
             format="Letter",           # or "A4"
             print_background=True,
             margin={"top": "0.4in", "right": "0.4in", "bottom": "0.4in", "left": "0.4in"},
             prefer_css_page_size=True
         )
+
+        # Stream straight into the zip; off the event loop so other renders keep going.
+        # Shielded so a render timeout can't release the lock mid-write.
+        async def write_to_zip(data):
+            async with zip_lock:
+                await asyncio.to_thread(zf.writestr, task["outfile"], data)
+            return len(data)
+        write = asyncio.ensure_future(write_to_zip(data))
+        if zip_writes is not None:
+            zip_writes[task["outfile"]] = write
+        await asyncio.shield(write)
+
+        if keep_pdfs:
+            ensure_dir(outfile.parent)
+            outfile.write_bytes(data)
+
+        info["size"] = len(data)
+        del data
     except Exception as e:
         info["status"] = "error"
         info["error"] = str(e)
     finally:
-        await page.close()
+        if page is not None:
+            await page.close()
     return info
 
-async def run_all(rows: List[Dict[str, str]], out_dir: Path, concurrency: int, timeout_ms: int) -> List[Dict[str, str]]:
-    from playwright.async_api import async_playwright
-
-    # Prepare tasks
-    tasks = []
+def iter_tasks(rows: Iterable[Dict[str, str]]) -> Iterator[Dict[str, str]]:
     for r in rows:
         url = r.get("print_url", "")
         if not url:
             continue
-        tasks.append({
+        yield {
             "print_url": url,
             "outfile": build_output_filename(r),
-        })
+        }
+
+def zipped_names(zip_path: Path) -> Set[str]:
+    if not zip_path.exists():
+        return set()
+    with ZipFile(zip_path) as zf:
+        return set(zf.namelist())
+
+async def run_all(rows: Iterable[Dict[str, str]], out_dir: Path, zip_path: Path, concurrency: int, timeout_ms: int,
+                  load_images: bool = False, keep_pdfs: bool = False, force: bool = False,
+                  skip_names: Iterable[str] = ()) -> List[Dict[str, str]]:
+    """
+    Unless `force` is set, rows whose PDF is already in the zip (or in
+    `skip_names`, or on disk under out_dir) are skipped without opening a page,
+    and new PDFs are appended to the existing zip.
+    """
+    from playwright.async_api import async_playwright
 
     results: List[Dict[str, str]] = []
-    sem = asyncio.Semaphore(concurrency)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        async def worker(t):
-            async with sem:
-                return await render_pdf(browser, t, out_dir, timeout_ms)
-        coros = [worker(t) for t in tasks]
-        for f in asyncio.as_completed(coros):
-            res = await f
-            results.append(res)
-        await browser.close()
+    zip_lock = asyncio.Lock()
+    # Shielded zip writes by arcname; a write outlives a timed-out render and
+    # must finish before the zip is closed
+    zip_writes: Dict[str, asyncio.Task] = {}
+
+    # Arcnames already archived or claimed by an in-flight task
+    zipped: Set[str] = set()
+    mode = "w"
+    if not force:
+        zipped.update(skip_names)
+        if zip_path.exists():
+            zipped.update(zipped_names(zip_path))
+            mode = "a"
+
+    async def skip_existing(t) -> Optional[Dict[str, str]]:
+        name = t["outfile"]
+        outfile = out_dir / name
+        info = {"url": t["print_url"], "outfile": str(outfile), "status": "skip", "error": "", "size": 0}
+        if name in zipped:
+            return info
+        zipped.add(name)
+        if not force and outfile.exists() and outfile.stat().st_size > 0:
+            # Rendered by an earlier run: archive it from disk instead
+            async with zip_lock:
+                await asyncio.to_thread(zf.write, outfile, arcname=name)
+            return info
+        return None
+
+    # PDFs are already compressed internally; level 1 saves CPU for a negligible size cost
+    with ZipFile(zip_path, mode, ZIP_DEFLATED, compresslevel=1) as zf:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+
+            # Pre-warmed context pool; its size bounds concurrency
+            ctx_pool: asyncio.Queue = asyncio.Queue()
+            for _ in range(concurrency):
+                await ctx_pool.put([await new_context(browser, load_images), 0])
+
+            async def render(t):
+                skipped = await skip_existing(t)
+                if skipped:
+                    return skipped
+                slot = await ctx_pool.get()
+                hung = False
+                try:
+                    # goto() honours timeout_ms, but emulate_media()/pdf() don't; bound the whole render
+                    info = await asyncio.wait_for(
+                        render_pdf(slot[0], t, out_dir, timeout_ms, zf, zip_lock, keep_pdfs, zip_writes),
+                        timeout=timeout_ms * 2 / 1000,
+                    )
+                except asyncio.TimeoutError:
+                    hung = True
+                    info = {"url": t["print_url"], "outfile": str(out_dir / t["outfile"]), "status": "timeout",
+                            "error": f"render exceeded {timeout_ms * 2 / 1000:.0f}s", "size": 0}
+                    # A zip write already under way was shielded from the timeout;
+                    # if it lands, the PDF is archived and the row counts as printed
+                    write = zip_writes.get(t["outfile"])
+                    if write is not None:
+                        try:
+                            info.update(status="ok", error="", size=await write)
+                        except Exception:
+                            pass
+                finally:
+                    slot[1] += 1
+                    # Never hand a context with a hung page back to the pool
+                    if hung or slot[1] >= BROWSER_POOL_RECYCLE_AFTER:
+                        await slot[0].close()
+                        slot[:] = [await new_context(browser, load_images), 0]
+                    await ctx_pool.put(slot)
+                    # Forget a write once it has landed; any still pending is
+                    # awaited before the zip closes
+                    write = zip_writes.get(t["outfile"])
+                    if write is not None and write.done():
+                        del zip_writes[t["outfile"]]
+                if info["status"] != "ok":
+                    zipped.discard(t["outfile"])
+                return info
+
+            # Bounded producer/consumer: only a few tasks are queued at any time
+            task_q: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 4)
+
+            async def worker_loop():
+                while True:
+                    t = await task_q.get()
+                    if t is None:
+                        return
+                    results.append(await render(t))
+
+            async def producer():
+                for t in iter_tasks(rows):
+                    await task_q.put(t)
+                for _ in range(concurrency):
+                    await task_q.put(None)
+
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(producer())
+                    for _ in range(concurrency):
+                        tg.create_task(worker_loop())
+            finally:
+                # Writes left behind by cancelled renders must not touch a closed zip
+                if zip_writes:
+                    await asyncio.gather(*zip_writes.values(), return_exceptions=True)
+
+            while not ctx_pool.empty():
+                ctx, _ = ctx_pool.get_nowait()
+                await ctx.close()
+            await browser.close()
+    return results
+
+# -------- Multi-process sharding --------
+
+def run_shard(shard_args) -> List[Dict[str, str]]:
+    """
+    Render every `workers`-th CSV row (starting at `index`) with this process's
+    own browser and context pool, into its own partial zip.
+    """
+    (csv_path, index, workers, out_dir, shard_zip, concurrency, timeout_ms,
+     load_images, keep_pdfs, force, skip_names) = shard_args
+    rows = itertools.islice(iter_rows(csv_path), index, None, workers)
+    return asyncio.run(run_all(rows, out_dir, shard_zip, concurrency=concurrency, timeout_ms=timeout_ms,
+                               load_images=load_images, keep_pdfs=keep_pdfs, force=force, skip_names=skip_names))
+
+def merge_zips(parts: List[Path], zip_path: Path, append: bool = False):
+    with ZipFile(zip_path, "a" if append else "w", ZIP_DEFLATED, compresslevel=1) as zf:
+        merged = set(zf.namelist())
+        for part in parts:
+            if not part.exists():
+                continue
+            with ZipFile(part) as src:
+                for info in src.infolist():
+                    # Duplicate CSV rows in different shards produce the same name; keep the first
+                    if info.filename in merged:
+                        continue
+                    merged.add(info.filename)
+                    # PDFs are already compressed, so store them rather than deflate them again
+                    zf.writestr(ZipInfo(info.filename, info.date_time), src.read(info), compress_type=ZIP_STORED)
+            part.unlink()
+
+def run_sharded(csv_path: Path, out_dir: Path, zip_path: Path, workers: int, concurrency: int, timeout_ms: int,
+                load_images: bool = False, keep_pdfs: bool = False, force: bool = False) -> List[Dict[str, str]]:
+    parts = [zip_path.with_name(f"{zip_path.stem}.part{i}.zip") for i in range(workers)]
+    # Shards write fresh partial zips, so they're told what the final zip already holds
+    skip_names = set() if force else zipped_names(zip_path)
+    shard_args = [
+        (csv_path, i, workers, out_dir, parts[i], concurrency, timeout_ms, load_images, keep_pdfs, force, skip_names)
+        for i in range(workers)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = list(itertools.chain.from_iterable(ex.map(run_shard, shard_args)))
+    merge_zips(parts, zip_path, append=not force and zip_path.exists())
     return results
 
 # -------- CLI --------
@@ -127,46 +323,64 @@ async def run_all(rows: List[Dict[str, str]], out_dir: Path, concurrency: int, t
 def main():
     parser = argparse.ArgumentParser(description="Render athletics staff directory print pages to PDFs and zip them.")
     parser.add_argument("csv", help="Path to CSV with columns: print_url (required), college/state/division/filename (optional).")
-    parser.add_argument("--out", default="pdf_output", help="Output folder for PDFs (default: pdf_output)")
+    parser.add_argument("--out", default="pdf_output", help="Output folder for PDFs when --keep-pdfs is set (default: pdf_output)")
     parser.add_argument("--zip", default="athletics_staff_pdfs.zip", help="Zip file name to create (default: athletics_staff_pdfs.zip)")
     parser.add_argument("--concurrency", type=int, default=4, help="Parallel renderers (default: 4)")
     parser.add_argument("--timeout", type=int, default=30000, help="Page timeout in ms (default: 30000)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes, each with its own browser and --concurrency renderers (default: 1)")
+    parser.add_argument("--force", action="store_true", help="Re-render PDFs that are already in the zip or --out")
+    parser.add_argument("--keep-pdfs", action="store_true", help="Also write each PDF to --out (zip is always written)")
+    parser.add_argument("--load-images", action="store_true", help="Load images/fonts/media (blocked by default for faster print rendering)")
     args = parser.parse_args()
 
     csv_path = Path(args.csv).resolve()
     out_dir = Path(args.out).resolve()
     zip_path = Path(args.zip).resolve()
 
-    rows = read_rows(csv_path)
+    rows = iter_rows(csv_path)
+    first = next(rows, None)
+    if first is None:
+        sys.exit("ERROR: CSV has no data rows.")
+    rows = itertools.chain([first], rows)
 
-    print(f"-> Reading {len(rows)} rows from {csv_path}")
-    print(f"-> Output PDFs to {out_dir}")
-    ensure_dir(out_dir)
+    print(f"-> Streaming rows from {csv_path}")
+    print(f"-> Writing PDFs to {zip_path}")
+    if args.keep_pdfs:
+        print(f"-> Keeping PDFs in {out_dir}")
+        ensure_dir(out_dir)
 
     t0 = time.time()
     try:
-        results = asyncio.run(run_all(rows, out_dir, concurrency=max(1, args.concurrency), timeout_ms=args.timeout))
+        if args.workers > 1:
+            results = run_sharded(csv_path, out_dir, zip_path, workers=args.workers, concurrency=max(1, args.concurrency),
+                                  timeout_ms=args.timeout, load_images=args.load_images, keep_pdfs=args.keep_pdfs,
+                                  force=args.force)
+        else:
+            results = asyncio.run(run_all(rows, out_dir, zip_path, concurrency=max(1, args.concurrency), timeout_ms=args.timeout,
+                                          load_images=args.load_images, keep_pdfs=args.keep_pdfs, force=args.force))
     except KeyboardInterrupt:
         sys.exit("Interrupted.")
     except Exception as e:
         sys.exit(f"Fatal error: {e}")
 
     ok = [r for r in results if r["status"] == "ok"]
-    err = [r for r in results if r["status"] != "ok"]
+    skipped = [r for r in results if r["status"] == "skip"]
+    err = [r for r in results if r["status"] not in ("ok", "skip")]
 
     print(f"\nCompleted in {time.time()-t0:.1f}s")
-    print(f"Success: {len(ok)} | Errors: {len(err)}")
+    print(f"Success: {len(ok)} | Skipped: {len(skipped)} | Errors: {len(err)}")
 
     if err:
         print("\nErrors:")
         for r in err:
             print(f"- {r['url']} -> {r['error']}")
 
-    # Always zip whatever succeeded
-    if ok:
-        print(f"\nZipping PDFs to: {zip_path}")
-        zip_folder(out_dir, zip_path)
+    # The zip holds whatever succeeded; don't leave an empty archive behind
+    if zipped_names(zip_path):
+        print(f"\nPDFs zipped to: {zip_path}")
         print("Done.")
+    else:
+        zip_path.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     main()
@@ -1,211 +1,335 @@
 import argparse
+import itertools
 import re
-import pdfplumber
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pypdfium2 as pdfium
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 import os
 from datetime import datetime
 
+# Phone number patterns, in priority order
+PHONE_PATTERNS = [re.compile(p) for p in (
+    r'\(\d{3}\)\s*\d{3}-\d{4}',      # (856) 256-4687
+    r'\(\d{3}\)\s*\d{3}\.\d{4}',      # (856) 256.4687
+    r'\d{3}-\d{3}-\d{4}',             # 856-256-4687
+    r'\d{3}\.\d{3}\.\d{4}',           # 856.256.4687
+    r'\d{3}\s+\d{3}-\d{4}',           # 856 256-4687
+    r'\d{3}-\d{4}',                   # 256-4687 (7-digit)
+    r'\d{3}\.\d{4}',                  # 256.4687 (7-digit)
+    r'\b\d{7}\b'                      # 2564687 (7-digit no separator)
+)]
+
+# All phone patterns fused into one alternation: lines without any phone are
+# rejected in a single scan. The ordered list above still decides which
+# pattern wins, since an alternation would prefer the leftmost match instead.
+ANY_PHONE_RE = re.compile("|".join(f"(?:{p.pattern})" for p in PHONE_PATTERNS))
+
+SEVEN_DIGIT_RE = re.compile(r'^(?:\d{3}-\d{4}|\d{3}\.\d{4}|\d{7})$')
+DIGITS_7_RE = re.compile(r'^\d{7}$')
+DASHED_10_RE = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+SPACED_10_RE = re.compile(r'^\d{3}\s+\d{3}-\d{4}$')
+
+AREA_CODE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'Area Code \((\d{3})\)',
+    r'Area Code: \((\d{3})\)',
+    r'Area Code (\d{3})',
+    r'Area Code: (\d{3})',
+    r'\((\d{3})\) area code'
+)]
+
+# Email addresses and "coach" markers, found together in one scan of the text.
+# An email alternative consumes any "coach" inside it, so those are checked
+# on the matched email text instead.
+EMAIL_OR_COACH_RE = re.compile(r'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)|(?P<coach>coach)', re.IGNORECASE)
+
+NAME_LINE_EXCLUDE_KEYWORDS = ('coaching', 'staff', 'soccer', 'university', '2025', '/', 'pm', 'am', 'director of')
+
+def scan_line(line):
+    """
+    Single regex pass over one line.
+    Returns (first email on the line or None, whether the line mentions "coach").
+    """
+    email = None
+    is_coach = False
+    for m in EMAIL_OR_COACH_RE.finditer(line):
+        found = m.group('email')
+        if found:
+            if email is None:
+                email = found
+            if 'coach' in found.lower():
+                is_coach = True
+        else:
+            is_coach = True
+    return email, is_coach
+
 def extract_and_format_phone(line, area_code):
     """
     Extract phone number from line and format with area code if needed.
     (Same as upload-coaches.py for consistency)
     """
-    # Phone number patterns
-    phone_patterns = [
-        r'\(\d{3}\)\s*\d{3}-\d{4}',      # (856) 256-4687
-        r'\(\d{3}\)\s*\d{3}\.\d{4}',      # (856) 256.4687
-        r'\d{3}-\d{3}-\d{4}',             # 856-256-4687
-        r'\d{3}\.\d{3}\.\d{4}',           # 856.256.4687
-        r'\d{3}\s+\d{3}-\d{4}',           # 856 256-4687
-        r'\d{3}-\d{4}',                   # 256-4687 (7-digit)
-        r'\d{3}\.\d{4}',                  # 256.4687 (7-digit)
-        r'\b\d{7}\b'                      # 2564687 (7-digit no separator)
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, line)
+    if not ANY_PHONE_RE.search(line):
+        return None
+
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(line)
         if match:
             phone = match.group().strip()
             
             # If it's a 7-digit number and we have an area code, add it
-            if area_code and (re.match(r'^\d{3}-\d{4}$', phone) or 
-                             re.match(r'^\d{3}\.\d{4}$', phone) or 
-                             re.match(r'^\d{7}$', phone)):
-                if re.match(r'^\d{7}$', phone):
+            if area_code and SEVEN_DIGIT_RE.match(phone):
+                if DIGITS_7_RE.match(phone):
                     # Format 7-digit number with dash
                     phone = phone[:3] + '-' + phone[3:]
                 
                 return f"({area_code}) {phone}"
             
             # If it already has area code, clean up format
-            elif re.match(r'^\d{3}-\d{3}-\d{4}$', phone):
+            elif DASHED_10_RE.match(phone):
                 area = phone[:3]
                 number = phone[4:]
                 return f"({area}) {number}"
             
-            elif re.match(r'^\d{3}\s+\d{3}-\d{4}$', phone):
+            elif SPACED_10_RE.match(phone):
                 parts = phone.split()
                 area = parts[0]
                 number = parts[1]
                 return f"({area}) {number}"
             
-            # Return as-is if already well formatted
-            elif re.match(r'^\(\d{3}\)', phone):
-                return phone
-            
-            # For other formats, return as-is
+            # Return as-is if already well formatted or in any other format
             else:
                 return phone
     
     return None
 
-def parse_pdf_for_removal(path):
+# Lines kept around the email line: name + up to 3 title lines behind, 2 phone lines ahead
+WINDOW_BEHIND = 4
+WINDOW_AHEAD = 2
+
+def iter_text_lines(path):
     """
-    Extract coach data from PDF that matches what was uploaded.
-    Uses the same multi-line parsing logic as upload-coaches.py
+    Yield the lines of a text file or PDF one page at a time, so the whole
+    document is never held in memory. PDF text comes from PDFium (C++),
+    extracted exactly once per page; empty pages are skipped.
     """
-    coaches_to_remove = []
-    area_code = None
-    
-    # Check if file is a text file (for testing) or PDF
     if path.lower().endswith('.txt'):
         print(f"📝 Processing text file: {path}")
         with open(path, 'r', encoding='utf-8') as f:
-            text = f.read()
+            for raw in f:
+                yield from raw.splitlines()
     else:
         print(f"📄 Processing PDF file: {path}")
-        with pdfplumber.open(path) as pdf:
-            text = "\n".join(
-                page.extract_text() 
-                for page in pdf.pages 
-                if page.extract_text()
-            )
-
-    # Extract area code from the text
-    area_code_patterns = [
-        r'Area Code \((\d{3})\)',
-        r'Area Code: \((\d{3})\)',
-        r'Area Code (\d{3})',
-        r'Area Code: (\d{3})',
-        r'\((\d{3})\) area code'
-    ]
+        pdf = pdfium.PdfDocument(path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if text:
+                    # Same line boundaries as joining the pages with newlines
+                    yield from (text + "\n").splitlines()
+        finally:
+            pdf.close()
+
+def match_coach(window, i):
+    """
+    Build a coach entry for the email line at window[i], looking back for the
+    title/name and ahead for a phone line. Window items are
+    (stripped line, first email or None, mentions coach).
+    The raw phone line is returned alongside, to be formatted once the
+    document's area code is known.
+    """
+    email = window[i][1]
+    username = email.split("@", 1)[0]
     
-    for pattern in area_code_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            area_code = match.group(1)
-            print(f"📞 Detected area code: ({area_code})")
+    # Look backwards for coach title and name
+    coach_title = ""
+    coach_name = ""
+    phone_line = None
+    
+    # Check previous lines for coach title and name
+    for j in range(1, 4):  # Look back up to 3 lines
+        if i - j < 0:
             break
+        # Check if this line contains "coach"
+        if window[i - j][2]:
+            coach_title = window[i - j][0]
+            
+            # The name should be the line immediately before the coach title
+            if i - j - 1 >= 0:
+                potential_name_line, name_email, _ = window[i - j - 1]
+                # Make sure it's not an email, header, or other metadata
+                if (potential_name_line and 
+                    name_email is None and
+                    not any(keyword in potential_name_line.lower() for keyword in NAME_LINE_EXCLUDE_KEYWORDS) and
+                    len(potential_name_line.split()) >= 2):  # Require at least first and last name
+                    coach_name = potential_name_line
+            break  # Stop once we find the coach title
     
-    if not area_code:
-        print("⚠️  No area code detected - phone numbers will remain as-is")
-
-    lines = text.splitlines()
+    # Only create entry if we found a coach title
+    if not coach_title:
+        return None, None
     
-    # Use multi-line format parsing (same as upload script)
-    for i, line in enumerate(lines):
-        # Look for email addresses
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
-        if not email_match:
-            continue
-        
-        email = email_match.group()
-        username = email.split("@", 1)[0]
-        
-        # Look backwards for coach title and name
-        coach_title = ""
-        coach_name = ""
-        phone_number = None
-        
-        # Check previous lines for coach title and name
-        for j in range(1, 4):  # Look back up to 3 lines
-            if i - j < 0:
-                break
-            prev_line = lines[i - j].strip()
-            
-            # Check if this line contains "coach"
-            if "coach" in prev_line.lower() and not coach_title:
-                coach_title = prev_line
-                
-                # The name should be the line immediately before the coach title
-                if i - j - 1 >= 0:
-                    potential_name_line = lines[i - j - 1].strip()
-                    # Make sure it's not an email, header, or other metadata
-                    if (potential_name_line and 
-                        not re.search(r'[\w\.-]+@[\w\.-]+\.\w+', potential_name_line) and
-                        not any(keyword in potential_name_line.lower() for keyword in 
-                               ['coaching', 'staff', 'soccer', 'university', '2025', '/', 'pm', 'am', 'director of']) and
-                        len(potential_name_line.split()) >= 2):  # Require at least first and last name
-                        coach_name = potential_name_line
-                break  # Stop once we find the coach title
-        
-        # Check following lines for phone number
-        for j in range(1, 3):  # Look ahead up to 2 lines
-            if i + j >= len(lines):
-                break
-            next_line = lines[i + j].strip()
-            phone_number = extract_and_format_phone(next_line, area_code)
-            if phone_number:
+    # Check following lines for phone number
+    for j in range(1, 3):  # Look ahead up to 2 lines
+        if i + j >= len(window):
+            break
+        next_line = window[i + j][0]
+        if extract_and_format_phone(next_line, None):
+            phone_line = next_line
+            break
+    
+    # Parse name
+    name_tokens = coach_name.split() if coach_name else []
+    
+    # Drop common prefixes
+    if name_tokens and name_tokens[0].lower() in ("dr.", "dr"):
+        name_tokens = name_tokens[1:]
+    
+    first_name = name_tokens[0] if name_tokens else ""
+    last_name = " ".join(name_tokens[1:]) if len(name_tokens) > 1 else ""
+    
+    coach_data = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": email,
+        "username": username,
+        "role": coach_title if coach_title else "coach",
+        "full_line": f"{coach_name} {coach_title} {email}".strip()
+    }
+    return coach_data, phone_line
+
+def parse_pdf_for_removal(path):
+    """
+    Extract coach data from PDF that matches what was uploaded.
+    Uses the same multi-line parsing logic as upload-coaches.py, streamed
+    through a sliding window of lines instead of the whole document.
+    """
+    found = []  # (coach_data, raw phone line)
+    area_code = None
+    area_code_rank = len(AREA_CODE_PATTERNS)
+    window = deque(maxlen=WINDOW_BEHIND + 1 + WINDOW_AHEAD)
+
+    for line in iter_text_lines(path):
+        # Area code: earlier patterns win wherever they appear in the document
+        for rank in range(area_code_rank):
+            match = AREA_CODE_PATTERNS[rank].search(line)
+            if match:
+                area_code = match.group(1)
+                area_code_rank = rank
                 break
-        
-        # Only create entry if we found a coach title
-        if coach_title and "coach" in coach_title.lower():
-            # Parse name
-            name_tokens = coach_name.split() if coach_name else []
-            
-            # Drop common prefixes
-            if name_tokens and name_tokens[0].lower() in ("dr.", "dr"):
-                name_tokens = name_tokens[1:]
-            
-            first_name = name_tokens[0] if name_tokens else ""
-            last_name = " ".join(name_tokens[1:]) if len(name_tokens) > 1 else ""
-            
-            coach_data = {
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": email,
-                "username": username,
-                "role": coach_title if coach_title else "coach",
-                "full_line": f"{coach_name} {coach_title} {email}".strip()
-            }
-            
-            if phone_number:
-                coach_data["phone"] = phone_number
-            
-            coaches_to_remove.append(coach_data)
+
+        email, is_coach = scan_line(line)
+        window.append((line.strip(), email, is_coach))
+
+        # The line WINDOW_AHEAD back now has all its lookahead lines
+        i = len(window) - 1 - WINDOW_AHEAD
+        if i >= 0 and window[i][1]:
+            coach_data, phone_line = match_coach(window, i)
+            if coach_data:
+                found.append((coach_data, phone_line))
+
+    # Trailing lines never got a full lookahead window
+    for i in range(max(0, len(window) - WINDOW_AHEAD), len(window)):
+        if window[i][1]:
+            coach_data, phone_line = match_coach(window, i)
+            if coach_data:
+                found.append((coach_data, phone_line))
+
+    if area_code:
+        print(f"📞 Detected area code: ({area_code})")
+    else:
+        print("⚠️  No area code detected - phone numbers will remain as-is")
+
+    coaches_to_remove = []
+    for coach_data, phone_line in found:
+        if phone_line:
+            coach_data["phone"] = extract_and_format_phone(phone_line, area_code)
+        coaches_to_remove.append(coach_data)
     
     return coaches_to_remove
 
-def remove_coaches_from_firestore(coaches_to_remove, key_path, collection='coaches', dry_run=False):
+def parse_pdfs_for_removal(paths):
+    """
+    Parse several PDFs, one per process, since text extraction is CPU-bound.
+    Results keep the order of `paths`.
+    """
+    if len(paths) == 1:
+        return parse_pdf_for_removal(paths[0])
+    with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+        return list(itertools.chain.from_iterable(ex.map(parse_pdf_for_removal, paths)))
+
+_db = None
+
+def get_db(key_path):
+    """
+    Return the process-wide Firestore client, initializing Firebase once.
+    The client keeps one pooled gRPC channel that every call reuses.
+    """
+    global _db
+    if _db is None:
+        if not firebase_admin._apps:
+            cred = credentials.Certificate(key_path)
+            firebase_admin.initialize_app(cred)
+        _db = firestore.client()
+    return _db
+
+def remove_coaches_from_firestore(coaches_to_remove, db, collection='coaches', dry_run=False):
     """
     Remove coach profiles from Firestore based on username/email.
     """
     if dry_run:
         print("DRY RUN MODE - No actual removal from Firestore")
         for coach in coaches_to_remove:
-            print(f"[DRY RUN] Would remove coach: {coach['first_name']} {coach['last_name']} ({coach['email']}) → coaches/{coach['username']}")
+            print(f"[DRY RUN] Would remove coach: {coach['first_name']} {coach['last_name']} ({coach['email']}) → {collection}/{coach['username']}")
         return
 
-    cred = credentials.Certificate(key_path)
-    firebase_admin.initialize_app(cred)
-    db = firestore.client()
-
-    removed_count = 0
     not_found_count = 0
     errors = []
 
-    for coach in coaches_to_remove:
-        try:
-            username = coach['username']
-            email = coach['email']
-            
-            # Check if coach profile exists
-            coach_ref = db.collection('coaches').document(username)
-            coach_doc = coach_ref.get()
-            
+    # One ref per username; fetched together and deleted through a BulkWriter
+    coaches_by_username = {coach['username']: coach for coach in coaches_to_remove}
+    refs = [db.collection(collection).document(username) for username in coaches_by_username]
+
+    def describe(username):
+        coach = coaches_by_username[username]
+        return f"{coach['first_name']} {coach['last_name']} ({coach['email']}) → {collection}/{username}"
+
+    removed = []
+    # Deletes are confirmed on BulkWriter's threads; removed and errors are
+    # appended under one lock rather than relying on list.append being atomic
+    results_lock = threading.Lock()
+
+    def on_write_result(reference, result, bulk_writer):
+        print(f"🗑️  Removed coach: {describe(reference.id)}")
+        with results_lock:
+            removed.append(reference.id)
+
+    def on_write_error(failure, bulk_writer):
+        username = failure.operation.reference.id
+        error_msg = f"❌ Error removing {coaches_by_username[username]['email']}: {failure.message}"
+        print(error_msg)
+        with results_lock:
+            errors.append(error_msg)
+        return False  # don't retry
+
+    # Start fast enough that deletes share the channel instead of trickling out
+    bulk_writer = db.bulk_writer(options=BulkWriterOptions(initial_ops_per_second=500))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+
+    try:
+        # Single batched read instead of one get() round trip per coach
+        for coach_doc in db.get_all(refs):
+            username = coach_doc.id
+            email = coaches_by_username[username]['email']
+
             if not coach_doc.exists:
-                print(f"⏭️  Coach not found: {coach['first_name']} {coach['last_name']} ({email}) → coaches/{username}")
+                print(f"⏭️  Coach not found: {describe(username)}")
                 not_found_count += 1
                 continue
             
@@ -215,16 +339,16 @@ def remove_coaches_from_firestore(coaches_to_remove, key_path, collection='coach
                 print(f"⚠️  Email mismatch for {username}: expected {email}, found {coach_data.get('email', 'N/A')}")
                 continue
             
-            # Delete the coach profile
-            coach_ref.delete()
-            
-            print(f"🗑️  Removed coach: {coach['first_name']} {coach['last_name']} ({email}) → coaches/{username}")
-            removed_count += 1
-            
-        except Exception as error:
-            error_msg = f"❌ Error removing {coach['email']}: {error}"
-            print(error_msg)
-            errors.append(error_msg)
+            bulk_writer.delete(coach_doc.reference)
+    except Exception as error:
+        error_msg = f"❌ Error looking up coaches: {error}"
+        print(error_msg)
+        errors.append(error_msg)
+    finally:
+        # Flushes all queued deletes and waits for their results
+        bulk_writer.close()
+
+    removed_count = len(removed)
     
     print(f"\n📊 Removal Summary:")
     print(f"🗑️  {removed_count} coach profiles removed")
@@ -238,8 +362,8 @@ def main():
     parser = argparse.ArgumentParser(
         description="Remove coaches from Firestore based on PDF data (reverse of upload-coaches.py)"
     )
-    parser.add_argument("--pdf", default="pdfs/Men's Soccer Coaches - Bryant University.pdf", 
-                       help="Path to the PDF file used for original upload")
+    parser.add_argument("--pdf", nargs='+', default=["pdfs/Men's Soccer Coaches - Bryant University.pdf"],
+                       help="Path(s) to the PDF file(s) used for original upload")
     parser.add_argument("--key", help="Path to Firebase Admin JSON key (required for actual removal)")
     parser.add_argument("--collection", default="coaches",
                        help="Firestore collection to remove documents from (default: coaches)")
@@ -248,8 +372,8 @@ def main():
     
     args = parser.parse_args()
 
-    coaches_to_remove = parse_pdf_for_removal(args.pdf)
-    print(f"Found {len(coaches_to_remove)} coach entries to remove (from PDF).")
+    coaches_to_remove = parse_pdfs_for_removal(args.pdf)
+    print(f"Found {len(coaches_to_remove)} coach entries to remove (from {len(args.pdf)} PDF(s)).")
     
     if len(coaches_to_remove) == 0:
         print("No coach entries found in the PDF.")
@@ -257,7 +381,7 @@ def main():
     
     # Remove from Firestore if not dry run and key is provided
     if not args.dry_run and args.key:
-        remove_coaches_from_firestore(coaches_to_remove, args.key, args.collection)
+        remove_coaches_from_firestore(coaches_to_remove, get_db(args.key), args.collection)
     elif args.dry_run:
         remove_coaches_from_firestore(coaches_to_remove, None, args.collection, dry_run=True)
     elif not args.key:
@@ -1,64 +1,333 @@
 import argparse
+import io
 import re
+from contextlib import nullcontext, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
 import pdfplumber
+import pypdfium2 as pdfium
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 import os
+import threading
 from datetime import datetime
 
-def extract_and_format_phone(line, area_code):
+# Phone number patterns, in priority order
+PHONE_PATTERNS = [re.compile(p) for p in (
+    r'\(\d{3}\)\s*\d{3}-\d{4}',      # (856) 256-4687
+    r'\(\d{3}\)\s*\d{3}\.\d{4}',      # (856) 256.4687
+    r'\d{3}-\d{3}-\d{4}',             # 856-256-4687
+    r'\d{3}\.\d{3}\.\d{4}',           # 856.256.4687
+    r'\d{3}\s+\d{3}-\d{4}',           # 856 256-4687
+    r'\d{3}-\d{4}',                   # 256-4687 (7-digit)
+    r'\d{3}\.\d{4}',                  # 256.4687 (7-digit)
+    r'\b\d{7}\b'                      # 2564687 (7-digit no separator)
+)]
+# Union of the patterns above, so lines without any phone number are
+# rejected in a single scan. The ordered list above still decides which
+# pattern wins, since an alternation would prefer the leftmost match instead.
+ANY_PHONE_RE = re.compile("|".join(f"(?:{p.pattern})" for p in PHONE_PATTERNS))
+PAREN_PHONE_PATTERNS = PHONE_PATTERNS[:2]
+BARE_PHONE_PATTERNS = PHONE_PATTERNS[2:]
+SEVEN_DIGIT_RE = re.compile(r'^(?:\d{3}-\d{4}|\d{3}\.\d{4}|\d{7})$')
+DIGITS_7_RE = re.compile(r'^\d{7}$')
+DASHED_10_RE = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+SPACED_10_RE = re.compile(r'^\d{3}\s+\d{3}-\d{4}$')
+
+# Area code phrasings in priority order, fused into one scan. Each alternative
+# is a lookahead so every position is tried against all of them; the group
+# name (a0..a4) gives the alternative's priority.
+AREA_CODE_RE = re.compile("|".join(f"(?={p})" for p in (
+    r'Area Code \((?P<a0>\d{3})\)',
+    r'Area Code: \((?P<a1>\d{3})\)',
+    r'Area Code (?P<a2>\d{3})',
+    r'Area Code: (?P<a3>\d{3})',
+    r'\((?P<a4>\d{3})\) area code'
+)), re.IGNORECASE)
+
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+EMAIL_WORD_RE = re.compile(r"\b[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}\b")
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+# detect_pdf_info / infer_org_from_filename / build_username_from_name
+# The patterns below without IGNORECASE are matched against already-lowercased text
+INSTITUTION_WORD_RE = re.compile(r"\b(university|college|academy|institute|school)\b")
+GENERIC_HEADER_RE = re.compile(r"staff|directory|athletics")
+FILENAME_GENERIC_WORDS_RE = re.compile(r"(?i)\b(staff\s+directory|directory|athletics|athletic\s+staff|staff)\b")
+USERNAME_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+# Title extraction/cleanup
+TITLE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"(head\s+coach[ A-Za-z\s/&-]*)",
+    r"(associate\s+(head\s+)?coach[ A-Za-z\s/&-]*)",
+    r"(assistant\s+(head\s+)?coach[ A-Za-z\s/&-]*)",
+    r"([A-Za-z\s/&-]*?\bcoach\b[ A-Za-z\s/&-]*)",
+    r"([A-Za-z\s/&-]*coordinator[ A-Za-z\s/&-]*)",
+)]
+# Trailing personal name after 'coach' (e.g., 'Head Coach John Doe' → 'Head Coach')
+TRAILING_NAME_AFTER_COACH_RE = re.compile(r"(\bcoach\b)\s+[A-Z][A-Za-z’'\-]+(?:\s+[A-Z][A-Za-z’'\-]+){0,2}\s*$", re.IGNORECASE)
+HEAD_WORD_RE = re.compile(r"\bhead\b")
+TITLE_PHONE_PAREN_RE = re.compile(r"\(\d{3}\)\s*\d{3}[-\.]\d{4}")
+TITLE_PHONE_10_RE = re.compile(r"\b\d{3}[-\.]\d{3}[-\.]\d{4}\b")
+TITLE_PHONE_7_RE = re.compile(r"\b\d{3}[-\.]\d{4}\b")
+TITLE_PHONE_PREFIX_RE = re.compile(r"\b\d{3}[-\.]\b")
+TITLE_TRAILING_DIGITS_RE = re.compile(r"[\s\-–,:]*\b\d{2,}\b.*$")
+# "<Last> Coach" at the start of a title
+SURNAME_COACH_RE = re.compile(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", re.IGNORECASE)
+
+# Name parsing
+# Tokens that are never part of a person's name
+NAME_STOPWORDS = frozenset({
+    "and","of","the","dept","department","athletics","athletic","recreation","business","health","trainer",
+    "performance","strength","conditioning","manager","representative","advisor","associate","assistant","head",
+    "coach","coaching","coaches","coordinator","director","offensive","defensive","women","women's","men","men's","club","ext",
+    "sr","jr","ii","iii","iv","senior","junior","admin","administrative",
+    # sports/common program words to avoid in names
+    "baseball","basketball","soccer","football","swimming","diving","volleyball","lacrosse","track","cross",
+    "country","cross-country","field","field-hockey","fieldhockey","softball","tennis","golf","wrestling",
+    "hockey","rowing","cheer","cheerleading","stunt","esports","bowling","fencing","gymnastics",
+    # generic headers that should never be names
+    "staff","coachng","directory","university","college"
+})
+# Role words that sanitize_name drops when they land in a name slot
+ROLE_NAME_WORDS = frozenset({"head","assistant","associate","coach","coordinator","director"})
+# Tokens containing any of these are role words, not names (e.g. 'Coach-Men's', 'Recruiting')
+NAME_ROLE_SUBSTRING_RE = re.compile(
+    "coach|assistant|associate|head|recruit|coordinator|director|manager|strength|conditioning|athletic|operations|performance"
+)
+NAME_PART_SPLIT_RE = re.compile(r"[-/]+")
+NAME_TOKEN_RE = re.compile(r"^[A-Za-z][A-Za-z'’\-]+$")
+EMAIL_LOCAL_SPLIT_RE = re.compile(r"[._\-]+")
+CAMEL_CASE_NAME_RE = re.compile(r"^([A-Z][a-z]+)([A-Z][a-z]+)$")
+STANDALONE_NAME_RE = re.compile(r"^([A-Z][A-Za-z’'\-]+)\s+([A-Z][A-Za-z’'\-]+)(?:\s+[A-Z][A-Za-z’'\-]+)?$")
+# Lines that cannot be a standalone name in the multi-line format (matched against lowercased lines)
+NAME_LINE_BLOCKLIST_RE = re.compile("coaching|staff|soccer|university|2025|/|pm|am|director of")
+# Role before 'Coach' then a Name at the end (e.g., "Head Men's Basketball Coach John Doe")
+ROLE_THEN_NAME_RE = re.compile(
+    r"^(?P<role>.*?\bcoach(?:[\w\s/&\-’']*)?)\s+(?P<name>[A-Z][A-Za-z’'\-\.]+(?:\s+[A-Z][A-Za-z’'\-\.]+){1,3})\s*$",
+    re.IGNORECASE,
+)
+# Multi-word phrase ending in Coach
+TITLE_AT_END_RE = re.compile(r"([A-Za-z'’/&\-\s]*?\b(?:[A-Za-z'’/&\-]+\s+){1,6}coach)\b\s*$", re.IGNORECASE)
+COACH_TITLE_AT_END_RE = re.compile(r"([A-Za-z’/&\-\s]*?\bcoach\b[ A-Za-z’/&\-]*)$", re.IGNORECASE)
+NAME_ROLE_TAIL_RE = re.compile(
+    r"[-—–,:/\s]*(?:head|assistant|associate|coach|coordinator|director|recruit(?:ing|er)?|operations?|strength|conditioning|athletic|performance|men|women|men's|women's)\b.*$",
+    re.IGNORECASE,
+)
+# Name text ends at the first role word; the caller slices, so no ".*$" tail
+RAW_ROLE_WORD_RE = re.compile(r"\b(?:coordinator|associate|assistant|coaching|director|staff|coach|head)\b", re.IGNORECASE)
+
+# Line classification
+# Offsets of the lines around a 'coach' line searched for an email, in search order
+NEIGHBOR_OFFSETS = tuple(d for d in range(-8, 9) if d != 0)
+SPORT_SECTION_RE = re.compile(r'^([A-Z\s&]+(?:\([^)]+\))?)$')
+# Sports that make an all-caps line a section header; matched as substrings of the lowercased line
+SPORT_NAME_RE = re.compile(
+    "baseball|basketball|soccer|football|swimming|volleyball|lacrosse|track|field hockey|cross country|softball"
+)
+COACHING_STAFF_RE = re.compile(r"coaching\s+staff")
+# Display names that mark a header row rather than a person
+HEADER_DISPLAY_NAMES = frozenset({'', 'staff', 'coaches', 'coaching'})
+
+# TXT validation
+HEADER_ORIGINAL_LINE_RE = re.compile(r"coaching\s+staff|^coaches\b")
+ENTRY_NUMBER_RE = re.compile(r"^\d+\.\s+\S+")
+
+# Sport-section keywords → sport, in priority order. 'field hockey' sections
+# land on 'field' first and map to Track & Field.
+SECTION_SPORTS = (
+    ('basketball', 'Basketball'),
+    ('soccer', 'Soccer'),
+    ('football', 'Football'),
+    ('baseball', 'Baseball'),
+    ('softball', 'Softball'),
+    ('swimming', 'Swimming'),
+    ('track', 'Track & Field'),
+    ('field', 'Track & Field'),
+    ('cross country', 'Cross Country'),
+    ('volleyball', 'Volleyball'),
+    ('lacrosse', 'Lacrosse'),
+)
+# Every section keyword present, in one scan; no keyword is a prefix of another
+SECTION_SPORT_RE = re.compile("(?=(" + "|".join(re.escape(k) for k, _ in SECTION_SPORTS) + "))")
+# (section marker, qualifier) pairs checked in order for gendered programs
+SECTION_GENDER_QUALIFIERS = {
+    'Basketball': (('men', 'Men'), ('women', 'Women')),
+    'Soccer': (('men', 'Men'), ('women', 'Women')),
+    'Lacrosse': (('women', 'Women'),),
+}
+
+# Role-text keywords → sport, used by map_to_coach_profile when there is no sport section
+SPORT_KEYWORDS = {
+    'soccer': 'Soccer',
+    'football': 'Soccer',  # In case they use "football" to mean soccer
+    'men\'s soccer': 'Soccer',
+    'mens soccer': 'Soccer',
+    'goalkeeper': 'Soccer',
+    'goalie': 'Soccer',
+    'midfielder': 'Soccer',
+    'defender': 'Soccer',
+    'forward': 'Soccer',
+    'striker': 'Soccer',
+    # Keep other common sports as fallback
+    'baseball': 'Baseball',
+    'basketball': 'Basketball',
+    'tennis': 'Tennis',
+    'swimming': 'Swimming',
+    'track': 'Track & Field',
+    'field': 'Track & Field',
+    'cross country': 'Cross Country',
+    'volleyball': 'Volleyball',
+    'golf': 'Golf',
+    'wrestling': 'Wrestling',
+    'lacrosse': 'Lacrosse',
+    'softball': 'Softball',
+    'hockey': 'Hockey',
+    'rowing': 'Rowing',
+    'strength': 'Strength & Conditioning',
+    'conditioning': 'Strength & Conditioning'
+}
+# Zero-width so overlapping keywords ('men's soccer' / 'soccer') are all seen;
+# no keyword is a prefix of another, so one alternative per position suffices
+SPORT_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, SPORT_KEYWORDS)) + "))")
+
+# Role fallback in map_to_coach_profile
+ROLE_FALLBACK_RE = re.compile(r'(Head Coach|Assistant Coach|Defensive Coordinator|[A-Za-z\s]+Coach)', re.IGNORECASE)
+
+# google.rpc status codes worth retrying for a bulk write: DEADLINE_EXCEEDED, ABORTED, UNAVAILABLE
+RETRYABLE_WRITE_CODES = (4, 10, 14)
+MAX_WRITE_ATTEMPTS = 5
+
+# New unclaimed coach profile, in document order. Fields set to None are
+# filled per entry by map_to_coach_profile, which also gives each profile
+# its own lists and dicts.
+COACH_PROFILE_TEMPLATE = {
+    'username': None,
+    'displayName': None,
+    'email': None,
+    'bio': None,
+    'sports': None,
+    # 'experience' intentionally omitted per user request
+    'certifications': None,
+    'hourlyRate': 0,  # To be set during profile completion
+    'location': None,
+    'availability': None,
+    'specialties': None,
+    'languages': None,
+    'organization': None,
+    'university': None,
+    'role': None,
+    'gender': '',  # To be filled during claiming
+    'ageGroup': None,
+    'sourceUrl': None,
+    'averageRating': 0,
+    'totalReviews': 0,
+    'isVerified': False,
+    'isPublic': True,  # Required by search API to show in results
+    'hasActiveServices': False,  # Will be set to True when services are added
+    'profileImage': '',
+    'website': '',
+    'socialMedia': None,
+    'createdAt': firestore.SERVER_TIMESTAMP,
+    'updatedAt': firestore.SERVER_TIMESTAMP,
+    'profileCompleted': False,
+    'isClaimed': False,  # Key field for claiming system
+    'userId': None,  # Will be linked when claimed
+    'claimedAt': None,
+    'verificationStatus': 'pending'  # pending, in_review, verified, rejected
+}
+
+
+@lru_cache(maxsize=4096)
+def _name_strip_patterns(first_name: str, last_name: str):
+    """Compiled patterns that remove a coach's first, last and full name from a title."""
+    names = [n for n in (first_name, last_name) if n]
+    if all(n.isalpha() for n in names):
+        # Plain-letter names (the usual case) need no escaping, and once every
+        # whole-word first and last name is gone no full name can remain, so
+        # one pass with one pattern does the same job as the four below
+        return (re.compile(rf"\b(?:{'|'.join(names)})\b", re.IGNORECASE),) if names else ()
+    patterns = []
+    if first_name:
+        patterns.append(rf"\b{re.escape(first_name)}\b")
+    if last_name:
+        patterns.append(rf"\b{re.escape(last_name)}\b")
+    if first_name and last_name:
+        patterns.append(rf"\b{re.escape(first_name)}\s+{re.escape(last_name)}\b")
+        patterns.append(rf"\b{re.escape(last_name)}\s+{re.escape(first_name)}\b")
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+@lru_cache(maxsize=4096)
+def _surname_coach_pattern(surname: str):
+    """Compiled '^<Surname> Coach' pattern used to drop a surname leaked into a title."""
+    return re.compile(rf"^{re.escape(surname)}\s+Coach\b", re.IGNORECASE)
+
+
+def extract_and_format_phone(line: str, area_code: Optional[str]) -> Optional[str]:
     """
     Extract phone number from line and format with area code if needed.
     """
-    # Phone number patterns
-    phone_patterns = [
-        r'\(\d{3}\)\s*\d{3}-\d{4}',      # (856) 256-4687
-        r'\(\d{3}\)\s*\d{3}\.\d{4}',      # (856) 256.4687
-        r'\d{3}-\d{3}-\d{4}',             # 856-256-4687
-        r'\d{3}\.\d{3}\.\d{4}',           # 856.256.4687
-        r'\d{3}\s+\d{3}-\d{4}',           # 856 256-4687
-        r'\d{3}-\d{4}',                   # 256-4687 (7-digit)
-        r'\d{3}\.\d{4}',                  # 256.4687 (7-digit)
-        r'\b\d{7}\b'                      # 2564687 (7-digit no separator)
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, line)
+    # Every pattern needs at least 7 digits; most lines have none, so count
+    # them before running any regex
+    if sum(map(str.isdigit, line)) < 7 or not ANY_PHONE_RE.search(line):
+        return None
+
+    # Happy path: "(###) ###-####" is already in the output format. Both
+    # parenthesised patterns need a "(", so other lines skip straight past them.
+    if "(" in line:
+        for pattern in PAREN_PHONE_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                return match.group().strip()
+
+    for pattern in BARE_PHONE_PATTERNS:
+        match = pattern.search(line)
         if match:
             phone = match.group().strip()
             
             # If it's a 7-digit number and we have an area code, add it
-            if area_code and (re.match(r'^\d{3}-\d{4}$', phone) or 
-                             re.match(r'^\d{3}\.\d{4}$', phone) or 
-                             re.match(r'^\d{7}$', phone)):
-                if re.match(r'^\d{7}$', phone):
+            if area_code and SEVEN_DIGIT_RE.match(phone):
+                if DIGITS_7_RE.match(phone):
                     # Format 7-digit number with dash
                     phone = phone[:3] + '-' + phone[3:]
                 
                 return f"({area_code}) {phone}"
             
             # If it already has area code, clean up format
-            elif re.match(r'^\d{3}-\d{3}-\d{4}$', phone):
+            elif DASHED_10_RE.match(phone):
                 area = phone[:3]
                 number = phone[4:]
                 return f"({area}) {number}"
             
-            elif re.match(r'^\d{3}\s+\d{3}-\d{4}$', phone):
+            elif SPACED_10_RE.match(phone):
                 parts = phone.split()
                 area = parts[0]
                 number = parts[1]
                 return f"({area}) {number}"
             
-            # Return as-is if already well formatted
-            elif re.match(r'^\(\d{3}\)', phone):
-                return phone
-            
-            # For other formats, return as-is
+            # Return as-is if already well formatted or in any other format
             else:
                 return phone
     
     return None
 
+def detect_area_code(text: str) -> Optional[str]:
+    """
+    Return the area code from the highest-priority phrasing found anywhere in
+    the text (its first occurrence), scanning the text once.
+    """
+    best_rank, best_code = None, None
+    for match in AREA_CODE_RE.finditer(text):
+        rank = int(match.lastgroup[1:])
+        if best_rank is None or rank < best_rank:
+            best_rank, best_code = rank, match.group(match.lastgroup)
+            if rank == 0:
+                break
+    return best_code
+
 def detect_pdf_info(path, text_content):
     """
     Detect university and organization information from PDF path and content.
@@ -123,16 +392,17 @@ def detect_pdf_info(path, text_content):
         lines = [ln.strip() for ln in text_content.splitlines() if ln and len(ln.strip()) > 2]
         candidates = []
         for ln in lines[:200]:
-            if re.search(r"\b(University|College|Academy|Institute|School)\b", ln, flags=re.IGNORECASE):
+            ln_low = ln.lower()
+            if INSTITUTION_WORD_RE.search(ln_low):
                 # Avoid overly generic headers
-                if not re.search(r"(?i)staff|directory|athletics", ln):
+                if not GENERIC_HEADER_RE.search(ln_low):
                     candidates.append(ln)
         if candidates:
             # Prefer the shortest reasonable candidate (less clutter)
             pdf_info['university'] = min(candidates, key=lambda s: len(s))
     return pdf_info
 
-def infer_org_from_filename(path: str):
+def infer_org_from_filename(path: str) -> str:
     base = os.path.splitext(os.path.basename(path))[0]
     # Prefer the segment after " - " if present (e.g., "Staff Directory - Camden County College")
     if " - " in base:
@@ -140,22 +410,287 @@ def infer_org_from_filename(path: str):
     else:
         candidate = base
     # Remove generic words
-    candidate = re.sub(r"(?i)\b(staff\s+directory|directory|athletics|athletic\s+staff|staff)\b", "", candidate).strip()
-    candidate = re.sub(r"\s{2,}", " ", candidate)
+    candidate = FILENAME_GENERIC_WORDS_RE.sub("", candidate).strip()
+    candidate = MULTI_SPACE_RE.sub(" ", candidate)
     # Title case
     if candidate:
         return candidate
     return ""
 
-def build_username_from_name(first_name: str, last_name: str):
+def _username_part(s: str) -> str:
+    return USERNAME_SEPARATOR_RE.sub(".", s).strip(".")
+
+def build_username_from_name(first_name: str, last_name: str) -> str:
     fn = (first_name or "").strip().lower()
     ln = (last_name or "").strip().lower()
-    def clean(s):
-        return re.sub(r"[^a-z0-9]+", ".", s).strip(".")
     if fn or ln:
-        return ".".join([p for p in [clean(fn), clean(ln)] if p])
+        return ".".join([p for p in [_username_part(fn), _username_part(ln)] if p])
     return ""
 
+def extract_coach_title(s: str) -> str:
+    s_low = s.lower()
+    if "coach" not in s_low:
+        return ""
+    # Remove emails to avoid capturing local-part tokens after 'coach'
+    s_wo_email = EMAIL_WORD_RE.sub("", s)
+    # Common role phrases preceding/following 'coach'
+    for pat in TITLE_PATTERNS:
+        m = pat.search(s_wo_email)
+        if m:
+            cand = m.group(1).strip()
+            # Remove trailing personal name after 'coach' at end of string (e.g., 'Head Coach John Doe' → 'Head Coach')
+            cand = TRAILING_NAME_AFTER_COACH_RE.sub(r"\1", cand)
+            return cand.strip()
+    return "coach"
+
+def derive_title_from_namepart(name_part: str, first_name: str, last_name: str) -> str:
+    s = (name_part or "").strip()
+    # Drop common prefixes and the detected name from the front
+    prefixes = ["dr.", "dr", "mr.", "mr", "ms.", "ms", "mrs.", "mrs"]
+    tokens = s.split()
+    # Remove leading prefixes
+    while tokens and tokens[0].lower() in prefixes:
+        tokens = tokens[1:]
+    # Remove first and last name if they appear at the start
+    if tokens and first_name and tokens[0].lower() == first_name.lower():
+        tokens = tokens[1:]
+    if tokens and last_name and tokens[0].lower() == last_name.lower():
+        tokens = tokens[1:]
+    cleaned = " ".join(tokens).strip().lstrip("-—–,:").strip()
+    # If cleaned still doesn't include 'coach', try generic extractor on original
+    if "coach" not in cleaned.lower():
+        cleaned = extract_coach_title(s)
+    # Capitalize nicely
+    return cleaned.strip()
+
+def normalize_title(title_candidate: str, context_text: str = "") -> str:
+    """
+    Normalize ambiguous titles per rule:
+    - If explicit title contains 'coach', keep it.
+    - Else if the context mentions the standalone word 'Head', return 'Head Coach'.
+    - Otherwise default to 'Assistant Coach'.
+    """
+    t = (title_candidate or "").strip()
+    if t and ("coach" in t.lower()):
+        return t
+    if HEAD_WORD_RE.search((context_text or "").lower()):
+        return "Head Coach"
+    return "Assistant Coach"
+
+def strip_name_from_title(title_text: str, first_name: str, last_name: str) -> str:
+    """
+    Remove occurrences of the coach's name tokens from the title string.
+    """
+    t = (title_text or "").strip()
+    if not t:
+        return t
+    # Remove first, last, and full name cases (case-insensitive, word-bound)
+    for pat in _name_strip_patterns(first_name or "", last_name or ""):
+        t = pat.sub("", t)
+    # Collapse extra spaces and punctuation left behind
+    t = MULTI_SPACE_RE.sub(" ", t).strip(" -—–,:\t\n")
+    return t.strip()
+
+def clean_title_text(title_text: str) -> str:
+    """Remove phone numbers and numeric fragments from title text; trim whitespace/punct."""
+    if not title_text:
+        return title_text
+    t = title_text
+    # Every removal below needs a digit; most titles have none
+    if any(map(str.isdigit, t)):
+        # Remove common phone patterns
+        t = TITLE_PHONE_PAREN_RE.sub("", t)
+        t = TITLE_PHONE_10_RE.sub("", t)
+        t = TITLE_PHONE_7_RE.sub("", t)
+        t = TITLE_PHONE_PREFIX_RE.sub("", t)
+        # Remove stray digits at end or within
+        t = TITLE_TRAILING_DIGITS_RE.sub("", t)
+    # Collapse spaces and clean punctuation
+    t = MULTI_SPACE_RE.sub(" ", t).strip(" -—–,:\t\n")
+    return t.strip()
+
+def clean_name_tokens(name_text: str) -> Tuple[str, str]:
+    txt = (name_text or "").strip()
+    tokens = txt.split()
+    cleaned = []
+    for t in tokens:
+        t_stripped = t.strip(",.:;|/()&[]{}-—–")
+        if not t_stripped:
+            continue
+        if any(ch.isdigit() for ch in t_stripped):
+            continue
+        if '@' in t_stripped:
+            continue
+        low = t_stripped.lower()
+        # remove if token equals a stopword (men, women's, etc.)
+        if low in NAME_STOPWORDS:
+            continue
+        # remove if token contains role-like substrings (e.g., 'Coach-Men's', 'Recruiting')
+        if NAME_ROLE_SUBSTRING_RE.search(low):
+            continue
+        # remove if any hyphen or slash part is a stopword (role substrings were
+        # already ruled out for the whole token above)
+        if any(part in NAME_STOPWORDS for part in NAME_PART_SPLIT_RE.split(low)):
+            continue
+        # keep only name-like tokens (letters, apostrophes including Unicode ’, hyphens)
+        if not NAME_TOKEN_RE.match(t_stripped):
+            continue
+        cleaned.append(t_stripped)
+    if not cleaned:
+        return "", ""
+    if len(cleaned) == 1:
+        return cleaned[0], ""
+    # choose first token and the last DIFFERENT token if possible
+    first = cleaned[0]
+    last_candidates = [t for t in cleaned[1:] if t.lower() != first.lower()]
+    last = last_candidates[-1] if last_candidates else ""
+    return first, last
+
+def sanitize_name(first_name: str, last_name: str) -> Tuple[str, str]:
+    fn = (first_name or "").strip()
+    ln = (last_name or "").strip()
+    if fn and ln and fn.lower() == ln.lower():
+        ln = ""
+    # drop role-y leftovers in last name
+    if ln.lower() in ROLE_NAME_WORDS:
+        ln = ""
+    # drop role words used as first name (to trigger email-derived fallback later)
+    if fn.lower() in ROLE_NAME_WORDS:
+        fn = ""
+    return fn, ln
+
+@lru_cache(maxsize=8192)
+def derive_name_from_email(email: str) -> Tuple[str, str]:
+    """Derive a plausible name from an email local part."""
+    if not email or '@' not in email:
+        return "", ""
+    local = email.split('@', 1)[0]
+    # common separators
+    parts = EMAIL_LOCAL_SPLIT_RE.split(local)
+    parts = [p for p in parts if p]
+    if not parts:
+        return "", ""
+    # If local starts with a single letter followed by separator and then a word, treat as initial + last
+    if len(parts) >= 2 and len(parts[0]) == 1:
+        first = parts[0].upper()
+        last = parts[1].capitalize()
+        return first, last
+    if len(parts) >= 2:
+        first = parts[0].capitalize()
+        last = parts[1].capitalize()
+        return first, last
+    # Single token: try to split camel case else capitalize
+    token = parts[0]
+    m = CAMEL_CASE_NAME_RE.match(token)
+    if m:
+        return m.group(1), m.group(2)
+    return token.capitalize(), ""
+
+def first_name_for_surname(email_first: str, email_last: str, last_name: str) -> str:
+    """
+    First name for a coach whose surname came from a '<Last> Coach' prefix,
+    taken from the email-derived name. A local part like 'johnsmith' that ends
+    in the surname is cut down to 'John'.
+    """
+    if email_last and email_last.lower() == last_name.lower():
+        return email_first
+    if email_first and email_first.lower().endswith(last_name.lower()) and len(email_first) > len(last_name):
+        return email_first[:len(email_first)-len(last_name)].strip("._-").capitalize()
+    return email_first
+
+def first_name_besides_surname(email_first: str, email_last: str, last_name: str) -> str:
+    """
+    First name for a coach whose title reads '<Last> Coach': whichever
+    email-derived part isn't the same as last_name.
+    """
+    if email_first and (not email_last or email_last.lower() == last_name.lower()):
+        return email_first
+    if email_last and email_last.lower() != last_name.lower():
+        return email_last
+    return ""
+
+def split_name_and_title(pre_email_text: str) -> Tuple[str, str, str]:
+    """
+    Split pre-email segment into (first_name, last_name, title).
+    Prefer multi-word titles ending with 'Coach'.
+    """
+    pre = (pre_email_text or "").strip()
+    if not pre:
+        return "", "", ""
+    # Case A: Role before 'Coach' then a Name at the end (e.g., "Head Men's Basketball Coach John Doe")
+    m_role_then_name = ROLE_THEN_NAME_RE.search(pre)
+    # Prefer multi-word phrase ending in Coach
+    m_end = TITLE_AT_END_RE.search(pre)
+    title = ""
+    name_only = pre
+    if m_role_then_name:
+        title = m_role_then_name.group('role').strip()
+        name_only = m_role_then_name.group('name').strip()
+    elif m_end:
+        title = m_end.group(1).strip()
+        # The title runs to the end of the string, so the name is everything before it
+        name_only = pre[:m_end.start(1)].strip().rstrip("-—–,:").strip()
+    else:
+        m = COACH_TITLE_AT_END_RE.search(pre)
+        if m:
+            title = m.group(1).strip()
+            name_only = pre[:m.start(1) + len(m.group(1)) - len(m.group(1).lstrip())].strip().rstrip('-—–,:').strip()
+        else:
+            title = extract_coach_title(pre)
+            name_only = pre
+    # Strip trailing role tokens and descriptors from name_only if any slipped through
+    name_only = NAME_ROLE_TAIL_RE.sub("", name_only).strip()
+    first_name, last_name = clean_name_tokens(name_only)
+    return first_name, last_name, title
+
+def make_entry(first_name: str, last_name: str, email: str, username: str, full_line: str,
+               title: str, uploadable: bool = True, phone: Optional[str] = None, **context) -> dict:
+    """
+    Build a parsed coach entry. Extra keyword arguments (e.g. sport_section)
+    are stored as given; phone is only added when one was found.
+    """
+    entry = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": email,
+        "username": username,
+        "full_line": full_line,
+        "role": title,
+        "title": title,
+        **context,
+        "uploadable": uploadable,
+    }
+    if phone:
+        entry["phone"] = phone
+    return entry
+
+def extract_pdf_text(path: str) -> str:
+    """
+    Return the text of every non-empty page joined with newlines.
+    Text comes from PDFium (C++), once per page. Pages where PDFium finds
+    nothing are retried with pdfplumber, which is only opened if needed.
+    """
+    page_texts = []
+    empty_pages = []
+    pdf = pdfium.PdfDocument(path)
+    try:
+        for index, page in enumerate(pdf):
+            textpage = page.get_textpage()
+            page_texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+            if not page_texts[-1].strip():
+                empty_pages.append(index)
+    finally:
+        pdf.close()
+
+    if empty_pages:
+        with pdfplumber.open(path) as plumber_pdf:
+            for index in empty_pages:
+                page_texts[index] = plumber_pdf.pages[index].extract_text() or ""
+
+    return "\n".join(page_text for page_text in page_texts if page_text)
+
 def parse_pdf(path, output_txt=None):
     """
     Extract lines with emails from PDF and parse first/last names + username.
@@ -180,28 +715,12 @@ def parse_pdf(path, output_txt=None):
     else:
         # Handle PDF file
         print(f"📄 Processing PDF file: {path}")
-        with pdfplumber.open(path) as pdf:
-            text = "\n".join(
-                page.extract_text() 
-                for page in pdf.pages 
-                if page.extract_text()
-            )
+        text = extract_pdf_text(path)
 
     # Extract area code from the text (Rhode Island commonly uses 401)
-    area_code_patterns = [
-        r'Area Code \((\d{3})\)',
-        r'Area Code: \((\d{3})\)',
-        r'Area Code (\d{3})',
-        r'Area Code: (\d{3})',
-        r'\((\d{3})\) area code'
-    ]
-    
-    for pattern in area_code_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            area_code = match.group(1)
-            print(f"📞 Detected area code: ({area_code})")
-            break
+    area_code = detect_area_code(text)
+    if area_code:
+        print(f"📞 Detected area code: ({area_code})")
     
     if not area_code:
         print("⚠️  No area code detected - phone numbers will remain as-is")
@@ -219,238 +738,12 @@ def parse_pdf(path, output_txt=None):
     print(f"🏫 Detected organization: {pdf_info.get('organization', 'Unknown')}")
 
     lines = text.splitlines()
-    
-    def extract_coach_title(s: str) -> str:
-        s_low = s.lower()
-        if "coach" not in s_low:
-            return ""
-        # Remove emails to avoid capturing local-part tokens after 'coach'
-        s_wo_email = re.sub(r"\b[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}\b", "", s)
-        # Common role phrases preceding/following 'coach'
-        title_patterns = [
-            r"(head\s+coach[ A-Za-z\s/&-]*)",
-            r"(associate\s+(head\s+)?coach[ A-Za-z\s/&-]*)",
-            r"(assistant\s+(head\s+)?coach[ A-Za-z\s/&-]*)",
-            r"([A-Za-z\s/&-]*?\bcoach\b[ A-Za-z\s/&-]*)",
-            r"([A-Za-z\s/&-]*coordinator[ A-Za-z\s/&-]*)",
-        ]
-        for pat in title_patterns:
-            m = re.search(pat, s_wo_email, flags=re.IGNORECASE)
-            if m:
-                cand = m.group(1).strip()
-                # Remove trailing personal name after 'coach' at end of string (e.g., 'Head Coach John Doe' → 'Head Coach')
-                cand = re.sub(r"(\bcoach\b)\s+[A-Z][A-Za-z’'\-]+(?:\s+[A-Z][A-Za-z’'\-]+){0,2}\s*$", r"\1", cand, flags=re.IGNORECASE)
-                return cand.strip()
-        return "coach"
-
-    def derive_title_from_namepart(name_part: str, first_name: str, last_name: str) -> str:
-        s = (name_part or "").strip()
-        # Drop common prefixes and the detected name from the front
-        prefixes = ["dr.", "dr", "mr.", "mr", "ms.", "ms", "mrs.", "mrs"]
-        tokens = s.split()
-        # Remove leading prefixes
-        while tokens and tokens[0].lower() in prefixes:
-            tokens = tokens[1:]
-        # Remove first and last name if they appear at the start
-        if tokens and first_name and tokens[0].lower() == first_name.lower():
-            tokens = tokens[1:]
-        if tokens and last_name and tokens[0].lower() == last_name.lower():
-            tokens = tokens[1:]
-        cleaned = " ".join(tokens).strip().lstrip("-—–,:").strip()
-        # If cleaned still doesn't include 'coach', try generic extractor on original
-        if "coach" not in cleaned.lower():
-            cleaned = extract_coach_title(s)
-        # Capitalize nicely
-        return cleaned.strip()
-
-    def normalize_title(title_candidate: str, context_text: str = "") -> str:
-        """
-        Normalize ambiguous titles per rule:
-        - If explicit title contains 'coach', keep it.
-        - Else if the context mentions the standalone word 'Head', return 'Head Coach'.
-        - Otherwise default to 'Assistant Coach'.
-        """
-        t = (title_candidate or "").strip()
-        if t and ("coach" in t.lower()):
-            return t
-        if re.search(r"\bhead\b", (context_text or ""), flags=re.IGNORECASE):
-            return "Head Coach"
-        return "Assistant Coach"
-
-    def strip_name_from_title(title_text: str, first_name: str, last_name: str) -> str:
-        """
-        Remove occurrences of the coach's name tokens from the title string.
-        """
-        t = (title_text or "").strip()
-        if not t:
-            return t
-        # Build patterns to remove first, last, and full name cases (case-insensitive, word-bound)
-        patterns = []
-        if first_name:
-            patterns.append(rf"\b{re.escape(first_name)}\b")
-        if last_name:
-            patterns.append(rf"\b{re.escape(last_name)}\b")
-        if first_name and last_name:
-            patterns.append(rf"\b{re.escape(first_name)}\s+{re.escape(last_name)}\b")
-            patterns.append(rf"\b{re.escape(last_name)}\s+{re.escape(first_name)}\b")
-        # Apply removals
-        for pat in patterns:
-            t = re.sub(pat, "", t, flags=re.IGNORECASE)
-        # Collapse extra spaces and punctuation left behind
-        t = re.sub(r"\s{2,}", " ", t).strip(" -—–,:\t\n")
-        return t.strip()
-
-    def clean_title_text(title_text: str) -> str:
-        """Remove phone numbers and numeric fragments from title text; trim whitespace/punct."""
-        if not title_text:
-            return title_text
-        t = title_text
-        # Remove common phone patterns
-        t = re.sub(r"\(\d{3}\)\s*\d{3}[-\.]\d{4}", "", t)
-        t = re.sub(r"\b\d{3}[-\.]\d{3}[-\.]\d{4}\b", "", t)
-        t = re.sub(r"\b\d{3}[-\.]\d{4}\b", "", t)
-        t = re.sub(r"\b\d{3}[-\.]\b", "", t)
-        # Remove stray digits at end or within
-        t = re.sub(r"[\s\-–,:]*\b\d{2,}\b.*$", "", t)
-        # Collapse spaces and clean punctuation
-        t = re.sub(r"\s{2,}", " ", t).strip(" -—–,:\t\n")
-        return t.strip()
-
-    def clean_name_tokens(name_text: str):
-        txt = (name_text or "").strip()
-        tokens = txt.split()
-        cleaned = []
-        stopwords = {
-            "and","of","the","dept","department","athletics","athletic","recreation","business","health","trainer",
-            "performance","strength","conditioning","manager","representative","advisor","associate","assistant","head",
-            "coach","coaching","coaches","coordinator","director","offensive","defensive","women","women's","men","men's","club","ext",
-            "sr","jr","ii","iii","iv","senior","junior","admin","administrative",
-            # sports/common program words to avoid in names
-            "baseball","basketball","soccer","football","swimming","diving","volleyball","lacrosse","track","cross",
-            "country","cross-country","field","field","field-hockey","fieldhockey","softball","tennis","golf","wrestling",
-            "hockey","rowing","cheer","cheerleading","stunt","esports","bowling","fencing","gymnastics","rowing",
-            # generic headers that should never be names
-            "staff","coachng","directory","university","college"
-        }
-        role_substrings = [
-            "coach", "assistant", "associate", "head", "recruit", "recruiting", "recruiter",
-            "coordinator", "director", "manager", "strength", "conditioning", "athletic",
-            "operations", "performance"
-        ]
-        for t in tokens:
-            t_stripped = t.strip(",.:;|/()&[]{}-—–")
-            if not t_stripped:
-                continue
-            if any(ch.isdigit() for ch in t_stripped):
-                continue
-            if '@' in t_stripped:
-                continue
-            low = t_stripped.lower()
-            # remove if token equals a stopword (men, women's, etc.)
-            if low in stopwords:
-                continue
-            # remove if token contains role-like substrings (e.g., 'Coach-Men's', 'Recruiting')
-            if any(substr in low for substr in role_substrings):
-                continue
-            # remove if any hyphen or slash part is a stopword/role substring
-            for part in re.split(r"[-/]+", low):
-                if part in stopwords or any(substr in part for substr in role_substrings):
-                    low = ""
-                    break
-            if not low:
-                continue
-            # keep only name-like tokens (letters, apostrophes including Unicode ’, hyphens)
-            if not re.match(r"^[A-Za-z][A-Za-z'’\-]+$", t_stripped):
-                continue
-            cleaned.append(t_stripped)
-        if not cleaned:
-            return "", ""
-        if len(cleaned) == 1:
-            return cleaned[0], ""
-        # choose first token and the last DIFFERENT token if possible
-        first = cleaned[0]
-        last_candidates = [t for t in cleaned[1:] if t.lower() != first.lower()]
-        last = last_candidates[-1] if last_candidates else ""
-        return first, last
-
-    def sanitize_name(first_name: str, last_name: str):
-        fn = (first_name or "").strip()
-        ln = (last_name or "").strip()
-        if fn and ln and fn.lower() == ln.lower():
-            ln = ""
-        # drop role-y leftovers in last name
-        if ln.lower() in {"head","assistant","associate","coach","coordinator","director"}:
-            ln = ""
-        # drop role words used as first name (to trigger email-derived fallback later)
-        if fn.lower() in {"head","assistant","associate","coach","coordinator","director"}:
-            fn = ""
-        return fn, ln
-
-    def derive_name_from_email(email: str):
-        """Derive a plausible name from an email local part."""
-        if not email or '@' not in email:
-            return "", ""
-        local = email.split('@', 1)[0]
-        # common separators
-        parts = re.split(r"[._\-]+", local)
-        parts = [p for p in parts if p]
-        # If local starts with a single letter followed by separator and then a word, treat as initial + last
-        if len(parts) >= 2 and len(parts[0]) == 1:
-            first = parts[0].upper()
-            last = parts[1].capitalize()
-            return first, last
-        if len(parts) >= 2:
-            first = parts[0].capitalize()
-            last = parts[1].capitalize()
-            return first, last
-        # Single token: try to split camel case else capitalize
-        token = parts[0]
-        m = re.match(r"^([A-Z][a-z]+)([A-Z][a-z]+)$", token)
-        if m:
-            return m.group(1), m.group(2)
-        return token.capitalize(), ""
-
-    def split_name_and_title(pre_email_text: str):
-        """
-        Split pre-email segment into (first_name, last_name, title).
-        Prefer multi-word titles ending with 'Coach'.
-        """
-        pre = (pre_email_text or "").strip()
-        if not pre:
-            return "", "", ""
-        # Case A: Role before 'Coach' then a Name at the end (e.g., "Head Men's Basketball Coach John Doe")
-        m_role_then_name = re.search(
-            r"^(?P<role>.*?\bcoach(?:[\w\s/&\-’']*)?)\s+(?P<name>[A-Z][A-Za-z’'\-\.]+(?:\s+[A-Z][A-Za-z’'\-\.]+){1,3})\s*$",
-            pre,
-            flags=re.IGNORECASE,
-        )
-        # Prefer multi-word phrase ending in Coach
-        m_end = re.search(r"([A-Za-z'’/&\-\s]*?\b(?:[A-Za-z'’/&\-]+\s+){1,6}coach)\b\s*$", pre, flags=re.IGNORECASE)
-        title = ""
-        name_only = pre
-        if m_role_then_name:
-            title = m_role_then_name.group('role').strip()
-            name_only = m_role_then_name.group('name').strip()
-        elif m_end:
-            title = m_end.group(1).strip()
-            name_only = re.sub(re.escape(m_end.group(1)) + r"\s*$", "", pre, flags=re.IGNORECASE).strip().rstrip("-—–,:").strip()
-        else:
-            m = re.search(r"([A-Za-z’/&\-\s]*?\bcoach\b[ A-Za-z’/&\-]*)$", pre, flags=re.IGNORECASE)
-            if m:
-                title = m.group(1).strip()
-                name_only = re.sub(re.escape(title) + r'\s*$', '', pre, flags=re.IGNORECASE).strip().rstrip('-—–,:').strip()
-            else:
-                title = extract_coach_title(pre)
-                name_only = pre
-        # Strip trailing role tokens and descriptors from name_only if any slipped through
-        name_only = re.sub(
-            r"[-—–,:/\s]*(?:head|assistant|associate|coach|coordinator|director|recruit(?:ing|er)?|operations?|strength|conditioning|athletic|performance|men|women|men's|women's)\b.*$",
-            "",
-            name_only,
-            flags=re.IGNORECASE,
-        ).strip()
-        first_name, last_name = clean_name_tokens(name_only)
-        return first_name, last_name, title
+    # Per-line views shared by all three methods, computed once. The email
+    # regex only runs on lines that contain '@'.
+    n_lines = len(lines)
+    stripped = [ln.strip() for ln in lines]
+    lowers = [ln.lower() for ln in lines]
+    email_matches = [EMAIL_RE.search(ln) if '@' in ln else None for ln in lines]
     
     # Method 1: Try single-line format first (original logic)  
     single_line_entries = []
@@ -458,21 +751,19 @@ def parse_pdf(path, output_txt=None):
     
     for i, line in enumerate(lines):
         # Check if this line is a sport section header
-        line_stripped = line.strip()
-        sport_section_match = re.match(r'^([A-Z\s&]+(?:\([^)]+\))?)$', line_stripped)
-        if sport_section_match and any(sport in line_stripped.lower() for sport in 
-                                      ['baseball', 'basketball', 'soccer', 'football', 'swimming', 
-                                       'volleyball', 'lacrosse', 'track', 'field hockey', 'cross country', 'softball']):
+        line_stripped = stripped[i]
+        line_lower = lowers[i]
+        if SPORT_SECTION_RE.match(line_stripped) and SPORT_NAME_RE.search(line_lower):
             current_sport_section = line_stripped
             print(f"🏃‍♂️ Found sport section: {current_sport_section}")
             continue
         
-        m = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
-        if not m:
+        # Filter for lines containing "coach" (case-insensitive) before the email regex
+        if "coach" not in line_lower:
             continue
-        
-        # Filter for lines containing "coach" (case-insensitive)
-        if "coach" not in line.lower():
+
+        m = email_matches[i]
+        if not m:
             continue
             
         email = m.group()
@@ -482,7 +773,8 @@ def parse_pdf(path, output_txt=None):
         phone_number = extract_and_format_phone(line, area_code)
         
         # Store full line for txt output
-        all_lines.append(line.strip())
+        all_lines.append(line_stripped)
+        email_first, email_last = derive_name_from_email(email)
 
         # Prefer to split the pre-email segment into name and title first
         s_first, s_last, s_title = split_name_and_title(name_part)
@@ -503,10 +795,10 @@ def parse_pdf(path, output_txt=None):
             for back in range(1, 4):
                 if i - back < 0:
                     break
-                prev = (lines[i - back] or "").strip()
-                if not prev or '@' in prev.lower() or 'coach' in prev.lower():
+                prev = stripped[i - back]
+                if not prev or '@' in prev or 'coach' in lowers[i - back]:
                     continue
-                m_name = re.match(r"^([A-Z][A-Za-z’'\-]+)\s+([A-Z][A-Za-z’'\-]+)(?:\s+[A-Z][A-Za-z’'\-]+)?$", prev)
+                m_name = STANDALONE_NAME_RE.match(prev)
                 if m_name:
                     recovered_first = m_name.group(1)
                     recovered_last = m_name.group(2)
@@ -515,166 +807,114 @@ def parse_pdf(path, output_txt=None):
                 first_name, last_name = sanitize_name(recovered_first, recovered_last)
             else:
                 # Fallback to deriving from email
-                df_first, df_last = derive_name_from_email(email)
-                first_name, last_name = sanitize_name(df_first, df_last)
+                first_name, last_name = sanitize_name(email_first, email_last)
         # Heuristic: if title segment looks like "<Last> Coach", use that as last name
         if (not last_name) and (s_title or name_part):
             title_source = (s_title or name_part or "").strip()
-            m_last_coach = re.search(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", title_source, flags=re.IGNORECASE)
+            m_last_coach = SURNAME_COACH_RE.search(title_source)
             if m_last_coach:
                 last_candidate = m_last_coach.group(1)
                 if not last_name:
                     last_name = last_candidate
                 if not first_name:
-                    df_first2, df_last2 = derive_name_from_email(email)
-                    if df_last2 and df_last2.lower() == last_name.lower():
-                        first_name = df_first2
-                    elif df_first2 and df_first2.lower().endswith(last_name.lower()) and len(df_first2) > len(last_name):
-                        first_name = df_first2[:len(df_first2)-len(last_name)].strip("._-").capitalize()
-                    elif df_first2:
-                        first_name = df_first2
+                    first_name = first_name_for_surname(email_first, email_last, last_name)
                 first_name, last_name = sanitize_name(first_name, last_name)
         username   = email.split("@", 1)[0]
-        df_first_aux, df_last_aux = derive_name_from_email(email)
 
         title_text = s_title or derive_title_from_namepart(name_part, first_name, last_name)
         # Camden heuristic: if title looks like "<Last> Coach" and last_name empty, set last_name
         if (not last_name) and title_text:
-            m_ln = re.match(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", title_text.strip(), flags=re.IGNORECASE)
+            m_ln = SURNAME_COACH_RE.match(title_text.strip())
             if m_ln:
                 last_name = m_ln.group(1)
                 if not first_name:
-                    df_first2, df_last2 = derive_name_from_email(email)
-                    # Prefer the email-derived part that isn't the same as last_name
-                    if df_first2 and (not df_last2 or df_last2.lower() == last_name.lower()):
-                        first_name = df_first2
-                    elif df_last2 and df_last2.lower() != last_name.lower():
-                        first_name = df_last2
+                    first_name = first_name_besides_surname(email_first, email_last, last_name)
                 first_name, last_name = sanitize_name(first_name, last_name)
         title_text = normalize_title(title_text, name_part)
         title_text = strip_name_from_title(title_text, first_name, last_name)
         # Strip a lone surname before 'Coach' if it appears in the username or email-derived tokens
-        m_title_surname = re.match(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", (title_text or "").strip(), re.IGNORECASE)
+        m_title_surname = SURNAME_COACH_RE.match((title_text or "").strip())
         if m_title_surname:
             possible_surname = m_title_surname.group(1)
             surname_hit = False
             if possible_surname and username and (possible_surname.lower() in username.lower() or username.lower().endswith(possible_surname.lower())):
                 surname_hit = True
-            if not surname_hit and (df_first_aux or df_last_aux):
-                if possible_surname and ((df_first_aux and possible_surname.lower() == df_first_aux.lower()) or (df_last_aux and possible_surname.lower() == df_last_aux.lower())):
+            if not surname_hit and (email_first or email_last):
+                if possible_surname and ((email_first and possible_surname.lower() == email_first.lower()) or (email_last and possible_surname.lower() == email_last.lower())):
                     surname_hit = True
             if surname_hit:
-                title_text = re.sub(rf"^{re.escape(possible_surname)}\s+Coach\b", "Coach", title_text, flags=re.IGNORECASE)
+                title_text = _surname_coach_pattern(possible_surname).sub("Coach", title_text)
         title_text = clean_title_text(title_text)
-        entry = {
-            "first_name": first_name,
-            "last_name":  last_name,
-            "email":      email,
-            "username":   username,
-            "full_line":  line.strip(),
-            "role": title_text or extract_coach_title(line),
-            "title": title_text or extract_coach_title(line),
-            "sport_section": current_sport_section,  # Add sport context
-            "uploadable": True
-        }
-        
-        if phone_number:
-            entry["phone"] = phone_number
-        
-        single_line_entries.append(entry)
+        single_line_entries.append(make_entry(
+            first_name, last_name, email, username, line_stripped,
+            title_text or extract_coach_title(line),
+            phone=phone_number,
+            sport_section=current_sport_section,  # Add sport context
+        ))
     
     # Method 2: If no single-line entries found, try multi-line format
     if not single_line_entries:
         print("🔄 No single-line format found, trying multi-line format...")
-        for i, line in enumerate(lines):
+        # Label every line once; the walk below then only indexes these lists
+        is_title = ["coach" in low for low in lowers]
+        is_name = [
+            bool(st) and not email_matches[k] and not NAME_LINE_BLOCKLIST_RE.search(lowers[k])
+            and len(st.split()) >= 2  # Require at least first and last name
+            for k, st in enumerate(stripped)
+        ]
+        for i in range(n_lines):
             # Look for email addresses
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
+            email_match = email_matches[i]
             if not email_match:
                 continue
-            
+
+            # Nearest line with "coach" in the 3 lines above the email is the title
+            title_idx = next((k for k in range(i - 1, max(i - 4, -1), -1) if is_title[k]), None)
+            if title_idx is None:
+                continue
+
             email = email_match.group()
             username = email.split("@", 1)[0]
-            
-            # Look backwards for coach title and name
-            coach_title = ""
-            coach_name = ""
-            phone_number = None
-            
-            # Check previous lines for coach title and name
-            for j in range(1, 4):  # Look back up to 3 lines
-                if i - j < 0:
-                    break
-                prev_line = lines[i - j].strip()
-                
-                # Check if this line contains "coach"
-                if "coach" in prev_line.lower() and not coach_title:
-                    coach_title = prev_line
-                    all_lines.append(f"{prev_line} -> {line.strip()}")
-                    
-                    # The name should be the line immediately before the coach title
-                    if i - j - 1 >= 0:
-                        potential_name_line = lines[i - j - 1].strip()
-                        # Make sure it's not an email, header, or other metadata
-                        if (potential_name_line and 
-                            not re.search(r'[\w\.-]+@[\w\.-]+\.\w+', potential_name_line) and
-                            not any(keyword in potential_name_line.lower() for keyword in 
-                                   ['coaching', 'staff', 'soccer', 'university', '2025', '/', 'pm', 'am', 'director of']) and
-                            len(potential_name_line.split()) >= 2):  # Require at least first and last name
-                            coach_name = potential_name_line
-                    break  # Stop once we find the coach title
-            
+            coach_title = stripped[title_idx]
+            all_lines.append(f"{coach_title} -> {stripped[i]}")
+            # The name should be the line immediately before the coach title
+            coach_name = stripped[title_idx - 1] if title_idx > 0 and is_name[title_idx - 1] else ""
+
             # Check following lines for phone number
-            for j in range(1, 4):  # Look ahead up to 3 lines
-                if i + j >= len(lines):
-                    break
-                next_line = lines[i + j].strip()
-                phone_number = extract_and_format_phone(next_line, area_code)
+            phone_number = None
+            for k in range(i + 1, min(i + 4, n_lines)):
+                phone_number = extract_and_format_phone(stripped[k], area_code)
                 if phone_number:
                     break
-            
-            # Only create entry if we found a coach title
-            if coach_title and "coach" in coach_title.lower():
-                # Parse name
-                name_tokens = coach_name.split() if coach_name else []
-                
-                # Drop common prefixes
-                if name_tokens and name_tokens[0].lower() in ("dr.", "dr"):
-                    name_tokens = name_tokens[1:]
-                
-                first_name = name_tokens[0] if name_tokens else ""
-                last_name = " ".join(name_tokens[1:]) if len(name_tokens) > 1 else ""
-                first_name, last_name = sanitize_name(first_name, last_name)
-                # If name still missing, try deriving from email
-                if not first_name and not last_name and email:
-                    df_first_ml, df_last_ml = derive_name_from_email(email)
-                    first_name, last_name = sanitize_name(df_first_ml, df_last_ml)
-                # If still missing last name and title looks like '<Last> Coach', set last and derive first from email
-                if (not last_name) and coach_title:
-                    m_last_ml = re.match(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", coach_title.strip(), flags=re.IGNORECASE)
-                    if m_last_ml:
-                        last_name = m_last_ml.group(1)
-                        if not first_name and email:
-                            df_first_ml2, df_last_ml2 = derive_name_from_email(email)
-                            if df_first_ml2 and (not df_last_ml2 or df_last_ml2.lower() == last_name.lower()):
-                                first_name = df_first_ml2
-                            elif df_last_ml2 and df_last_ml2.lower() != last_name.lower():
-                                first_name = df_last_ml2
-                        first_name, last_name = sanitize_name(first_name, last_name)
-                entry = {
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "email": email,
-                    "username": username,
-                    "full_line": f"{coach_name} {coach_title} {email}".strip(),
-                    "role": clean_title_text(coach_title if coach_title else "coach"),
-                    "title": clean_title_text(coach_title if coach_title else "coach"),
-                    "uploadable": True
-                }
+
+            email_first, email_last = derive_name_from_email(email)
+            # Parse name
+            name_tokens = coach_name.split() if coach_name else []
                 
-                if phone_number:
-                    entry["phone"] = phone_number
+            # Drop common prefixes
+            if name_tokens and name_tokens[0].lower() in ("dr.", "dr"):
+                name_tokens = name_tokens[1:]
                 
-                entries.append(entry)
+            first_name = name_tokens[0] if name_tokens else ""
+            last_name = " ".join(name_tokens[1:]) if len(name_tokens) > 1 else ""
+            first_name, last_name = sanitize_name(first_name, last_name)
+            # If name still missing, try deriving from email
+            if not first_name and not last_name and email:
+                first_name, last_name = sanitize_name(email_first, email_last)
+            # If still missing last name and title looks like '<Last> Coach', set last and derive first from email
+            if (not last_name) and coach_title:
+                m_last_ml = SURNAME_COACH_RE.match(coach_title.strip())
+                if m_last_ml:
+                    last_name = m_last_ml.group(1)
+                    if not first_name and email:
+                        first_name = first_name_besides_surname(email_first, email_last, last_name)
+                    first_name, last_name = sanitize_name(first_name, last_name)
+            entries.append(make_entry(
+                first_name, last_name, email, username,
+                f"{coach_name} {coach_title} {email}".strip(),
+                clean_title_text(coach_title if coach_title else "coach"),
+                phone=phone_number,
+            ))
         
         print(f"✔ Found {len(entries)} coach entries using multi-line format")
     else:
@@ -682,33 +922,39 @@ def parse_pdf(path, output_txt=None):
         print(f"✔ Found {len(entries)} coach entries using single-line format")
 
     # Method 3: Window-based pass around any line containing 'coach' (always run to augment results)
-    seen_emails = set(e["email"] for e in entries if e.get("email"))
-    seen_full = set(e["full_line"] for e in entries if e.get("full_line"))
+    seen_emails, seen_full = set(), set()
+    for e in entries:
+        if e.get("email"):
+            seen_emails.add(e["email"])
+        if e.get("full_line"):
+            seen_full.add(e["full_line"])
     for i, line in enumerate(lines):
-        if "coach" not in line.lower():
+        if "coach" not in lowers[i]:
             continue
+        line_stripped = stripped[i]
         # Skip if identical line already included
-        if line.strip() in seen_full:
+        if line_stripped in seen_full:
             continue
         # find email on same line or nearby lines
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
-        look_range = list(range(-8, 9))
+        email_match = email_matches[i]
         email = None
         email_line_idx = i
         if email_match:
             email = email_match.group()
         else:
-            for d in look_range:
-                if d == 0 or i + d < 0 or i + d >= len(lines):
+            for d in NEIGHBOR_OFFSETS:
+                j = i + d
+                if j < 0 or j >= n_lines:
                     continue
-                m2 = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', lines[i + d])
+                m2 = email_matches[j]
                 if m2:
                     email = m2.group()
-                    email_line_idx = i + d
+                    email_line_idx = j
                     break
         title = extract_coach_title(line)
         if email and email not in seen_emails:
             username = email.split("@", 1)[0]
+            email_first, email_last = derive_name_from_email(email)
             # Prefer to split the pre-email segment into name and title
             name_src = lines[email_line_idx]
             prefix = name_src.split(email, 1)[0].strip()
@@ -717,87 +963,69 @@ def parse_pdf(path, output_txt=None):
             last_name = s_last3 or ""
             first_name, last_name = sanitize_name(first_name, last_name)
             if not first_name and not last_name:
-                df_first, df_last = derive_name_from_email(email)
-                first_name, last_name = sanitize_name(df_first, df_last)
+                first_name, last_name = sanitize_name(email_first, email_last)
             # Heuristic for window-based: title like "<Last> Coach" within prefix
             if (not last_name) and prefix:
-                m_last_coach2 = re.search(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", prefix, flags=re.IGNORECASE)
+                m_last_coach2 = SURNAME_COACH_RE.search(prefix)
                 if m_last_coach2:
                     last_candidate = m_last_coach2.group(1)
                     if not last_name:
                         last_name = last_candidate
                     if not first_name:
-                        df_first3, df_last3 = derive_name_from_email(email)
-                        if df_last3 and df_last3.lower() == last_name.lower():
-                            first_name = df_first3
-                        elif df_first3 and df_first3.lower().endswith(last_name.lower()) and len(df_first3) > len(last_name):
-                            first_name = df_first3[:len(df_first3)-len(last_name)].strip("._-").capitalize()
-                        elif df_first3:
-                            first_name = df_first3
+                        first_name = first_name_for_surname(email_first, email_last, last_name)
                     first_name, last_name = sanitize_name(first_name, last_name)
             normalized_title = normalize_title(title or s_title3, prefix)
             normalized_title = strip_name_from_title(normalized_title, first_name, last_name)
-            m_norm_surname = re.match(r"^([A-Za-z][A-Za-z’'\-]+)\s+Coach\b", (normalized_title or "").strip(), re.IGNORECASE)
+            m_norm_surname = SURNAME_COACH_RE.match((normalized_title or "").strip())
             if m_norm_surname and username:
                 possible_surname2 = m_norm_surname.group(1)
                 if possible_surname2 and (possible_surname2.lower() in username.lower() or username.lower().endswith(possible_surname2.lower())):
-                    normalized_title = re.sub(rf"^{re.escape(possible_surname2)}\s+Coach\b", "Coach", normalized_title, flags=re.IGNORECASE)
+                    normalized_title = _surname_coach_pattern(possible_surname2).sub("Coach", normalized_title)
             normalized_title = clean_title_text(normalized_title)
-            entry = {
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": email,
-                "username": username,
-                "full_line": f"{line.strip()} {email}",
-                "role": normalized_title,
-                "title": normalized_title,
-                "uploadable": True
-            }
-            entries.append(entry)
+            entries.append(make_entry(
+                first_name, last_name, email, username,
+                f"{line_stripped} {email}", normalized_title,
+            ))
             seen_emails.add(email)
-            seen_full.add(line.strip())
+            seen_full.add(line_stripped)
         else:
             # Coach line without an email nearby: include in TXT only
-            raw = line.strip()
+            raw = line_stripped
             # Skip obvious header rows like "Coaching Staff" blocks
-            if re.search(r"coaching\s+staff", raw, flags=re.IGNORECASE):
+            if "coaching" in lowers[i] and COACHING_STAFF_RE.search(lowers[i]):
                 first_name, last_name = "", ""
             else:
-                raw_name = re.sub(r"\b(head|assistant|associate|coach|coaching|coordinator|director|staff)\b.*$", "", raw, flags=re.IGNORECASE).strip()
+                role_word = RAW_ROLE_WORD_RE.search(raw)
+                raw_name = (raw[:role_word.start()] if role_word else raw).strip()
                 first_name, last_name = clean_name_tokens(raw_name)
-            entry = {
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": "",
-                "username": "",
-                "full_line": line.strip(),
-                "role": title or "coach",
-                "title": title or "coach",
-                "uploadable": False
-            }
-            entries.append(entry)
-            seen_full.add(line.strip())
+            entries.append(make_entry(
+                first_name, last_name, "", "", line_stripped, title or "coach",
+                uploadable=False,
+            ))
+            seen_full.add(line_stripped)
     
     # Post-process: assign usernames for entries without email using names
     for e in entries:
         # Trim any accidental leading spaces on names
-        e['first_name'] = (e.get('first_name') or '').strip()
-        e['last_name'] = (e.get('last_name') or '').strip()
+        fn = (e.get('first_name') or '').strip()
+        ln = (e.get('last_name') or '').strip()
+        e['first_name'] = fn
+        e['last_name'] = ln
         if (not e.get('email')):
             # Do not create usernames from header-like lines
             full_line_lower = (e.get('full_line') or '').lower()
-            display_name_lower = f"{e.get('first_name','')} {e.get('last_name','')}".strip().lower()
             is_header_like = (
                 'coaching staff' in full_line_lower or
                 full_line_lower.strip().startswith('coaches') or
-                display_name_lower in {'', 'staff', 'coaches', 'coaching'}
+                f"{fn} {ln}".strip().lower() in HEADER_DISPLAY_NAMES
             )
             if not e.get('username') and not is_header_like:
-                uname = build_username_from_name(e.get('first_name', ''), e.get('last_name', ''))
+                uname = build_username_from_name(fn, ln)
                 if uname:
                     e['username'] = uname
                     if e.get('uploadable') is False:
                         e['uploadable'] = True
+        e['_sports'] = entry_sports(e, pdf_info)
 
     # Output to txt file if specified
     if output_txt and entries:
@@ -810,61 +1038,120 @@ def write_to_txt(entries, all_lines, output_path, pdf_info=None):
     Write filtered coach entries to a txt file for quick review.
     Includes detected school/organization context when available.
     """
+    # Build the whole report in a list and write it in one call
+    out = [
+        f"COACH ENTRIES FOUND - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "=" * 60 + "\n\n",
+    ]
+    # School context block
+    if pdf_info:
+        university = pdf_info.get('university') or 'Unknown University'
+        organization = pdf_info.get('organization') or 'University Athletics'
+        location = pdf_info.get('location') or ''
+        source = pdf_info.get('source') or ''
+        out.append("SCHOOL CONTEXT\n")
+        out.append("-" * 40 + "\n")
+        out.append(f"University: {university}\n")
+        out.append(f"Organization: {organization}\n")
+        if pdf_info.get('state'):
+            out.append(f"State: {pdf_info['state']}\n")
+        if location:
+            out.append(f"Location: {location}\n")
+        if source:
+            out.append(f"Source: {source}\n")
+        out.append("\n")
+
+    out.append(f"Total coaches found: {len(entries)}\n\n")
+
+    out.append("PARSED ENTRIES:\n")
+    out.append("-" * 40 + "\n")
+
+    for i, entry in enumerate(entries, 1):
+        out.append(f"{i}. {entry['first_name']} {entry['last_name']}\n")
+        out.append(f"   Email: {entry['email']}\n")
+        out.append(f"   Username: {entry['username']}\n")
+        sports = entry.get('_sports')
+        if sports is None:
+            sports = entry_sports(entry, pdf_info)
+        if sports:
+            out.append(f"   Sports: {', '.join(sports)}\n")
+        if 'title' in entry and entry['title']:
+            out.append(f"   Title: {entry['title']}\n")
+        if entry.get('uploadable') is False:
+            out.append(f"   Note: No email found nearby; this entry will NOT be uploaded.\n")
+        if 'phone' in entry:
+            out.append(f"   Phone: {entry['phone']}\n")
+        out.append(f"   Original line: {entry['full_line']}\n")
+        out.append("\n")
+
+    out.append("\n" + "=" * 60 + "\n")
+    out.append("RAW LINES WITH 'COACH' KEYWORD:\n")
+    out.append("-" * 40 + "\n")
+
+    out.extend(f"• {line}\n" for line in all_lines)
+
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(f"COACH ENTRIES FOUND - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 60 + "\n\n")
-        # School context block
-        if pdf_info:
-            university = pdf_info.get('university') or 'Unknown University'
-            organization = pdf_info.get('organization') or 'University Athletics'
-            location = pdf_info.get('location') or ''
-            source = pdf_info.get('source') or ''
-            f.write("SCHOOL CONTEXT\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"University: {university}\n")
-            f.write(f"Organization: {organization}\n")
-            if pdf_info.get('state'):
-                f.write(f"State: {pdf_info['state']}\n")
-            if location:
-                f.write(f"Location: {location}\n")
-            if source:
-                f.write(f"Source: {source}\n")
-            f.write("\n")
-        
-        f.write(f"Total coaches found: {len(entries)}\n\n")
-        
-        f.write("PARSED ENTRIES:\n")
-        f.write("-" * 40 + "\n")
-        
-        for i, entry in enumerate(entries, 1):
-            f.write(f"{i}. {entry['first_name']} {entry['last_name']}\n")
-            f.write(f"   Email: {entry['email']}\n")
-            f.write(f"   Username: {entry['username']}\n")
-            try:
-                prof = map_to_coach_profile(entry, pdf_info)
-                sports_line = ", ".join(prof.get('sports', []) or [])
-                if sports_line:
-                    f.write(f"   Sports: {sports_line}\n")
-            except Exception:
-                pass
-            if 'title' in entry and entry['title']:
-                f.write(f"   Title: {entry['title']}\n")
-            if entry.get('uploadable') is False:
-                f.write(f"   Note: No email found nearby; this entry will NOT be uploaded.\n")
-            if 'phone' in entry:
-                f.write(f"   Phone: {entry['phone']}\n")
-            f.write(f"   Original line: {entry['full_line']}\n")
-            f.write("\n")
-        
-        f.write("\n" + "=" * 60 + "\n")
-        f.write("RAW LINES WITH 'COACH' KEYWORD:\n")
-        f.write("-" * 40 + "\n")
-        
-        for line in all_lines:
-            f.write(f"• {line}\n")
-    
+        f.write("".join(out))
+
     print(f"✔ Results written to {output_path}")
 
+def validate_txt_block(block_lines) -> bool:
+    """
+    Check one PARSED ENTRIES block from a review TXT.
+    Returns True, after printing the block and its missing fields, if it has a problem.
+    """
+    if not block_lines:
+        return False
+    # Skip blocks explicitly marked as non-uploadable
+    joined = "\n".join(block_lines)
+    if "will NOT be uploaded" in joined:
+        return False
+    # Skip obvious header sections
+    for ln in block_lines:
+        ln_low = ln.lower()
+        if ln_low.strip().startswith('original line:') and "coach" in ln_low and HEADER_ORIGINAL_LINE_RE.search(ln_low):
+            return False
+    # Extract fields
+    name_ok = False
+    email_ok = False
+    username_ok = False
+    title_ok = False
+    for ln in block_lines:
+        if ln[:1].isdigit() and ENTRY_NUMBER_RE.match(ln):
+            # e.g., "1. First Last" - the pattern guarantees a non-empty name
+            name_ok = True
+            continue
+        # Field lines are "Label: value"; split once and switch on the label
+        head, sep, val = ln.strip().partition(":")
+        if not sep:
+            continue
+        head = head.lower()
+        if head == "email":
+            val = val.strip()
+            if val and ("@" in val):
+                email_ok = True
+        elif head == "username":
+            if val.strip():
+                username_ok = True
+        elif head == "title":
+            if val.strip():
+                title_ok = True
+    # Email is optional if a username is present
+    if not (name_ok and username_ok and title_ok):
+        print("⚠️  Validation issue in TXT entry block:")
+        for ln in block_lines:
+            print(f"   {ln}")
+        missing = []
+        if not name_ok: missing.append("name")
+        # Only flag email if also missing username
+        if (not email_ok) and (not username_ok):
+            missing.append("email")
+        if not username_ok: missing.append("username")
+        if not title_ok: missing.append("title")
+        print(f"   → Missing/invalid: {', '.join(missing)}")
+        return True
+    return False
+
 def validate_txt_file(output_path: str) -> tuple:
     """
     Validate the generated TXT to ensure required fields are present for uploadable entries.
@@ -872,93 +1159,55 @@ def validate_txt_file(output_path: str) -> tuple:
     Entries marked with the dry-run note (no email) are ignored for upload. "Coaching Staff" header blocks are ignored.
     Returns (is_valid, issues_count).
     """
+    # One streaming pass. Lines before the PARSED ENTRIES header are skipped,
+    # as is the separator right after it. Entry lines are held back by one
+    # (`pending`) because the line just before the RAW LINES header is that
+    # section's separator and is not part of any entry block.
+    issues = 0
+    cur_block = []
+    in_parsed = False
+    skip_separator = False
+    pending = None
     try:
         with open(output_path, 'r', encoding='utf-8') as f:
-            lines = [ln.rstrip("\n") for ln in f.readlines()]
+            for ln in f:
+                ln = ln.rstrip("\n")
+                if not in_parsed:
+                    if ln.strip() == "PARSED ENTRIES:":
+                        in_parsed = True
+                        skip_separator = True
+                    continue
+                if ln.strip() == "RAW LINES WITH 'COACH' KEYWORD:":
+                    pending = None
+                    break
+                if skip_separator:
+                    skip_separator = False
+                    continue
+                if pending is not None:
+                    # Blocks are separated by blank lines
+                    if pending.strip() == "":
+                        issues += validate_txt_block(cur_block)
+                        cur_block = []
+                    else:
+                        cur_block.append(pending)
+                pending = ln
     except Exception as e:
         print(f"❌ Could not read TXT for validation: {output_path} ({e})")
         return False, 1
 
-    # Find start and end of parsed entries section
-    start_idx = None
-    end_idx = None
-    for i, ln in enumerate(lines):
-        if start_idx is None and ln.strip() == "PARSED ENTRIES:":
-            # Skip the separator line after header
-            start_idx = i + 2 if i + 1 < len(lines) else i + 1
-            continue
-        if start_idx is not None and ln.strip() == "RAW LINES WITH 'COACH' KEYWORD:":
-            end_idx = i - 1  # stop before the RAW LINES header (and preceding blank/separator)
-            break
-    if start_idx is None:
+    if not in_parsed:
         print("❌ Validation failed: 'PARSED ENTRIES' section not found in TXT")
         return False, 1
-    if end_idx is None:
-        end_idx = len(lines)
-
-    issues = 0
-    cur_block = []
 
-    def validate_block(block_lines):
-        nonlocal issues
-        if not block_lines:
-            return
-        # Skip blocks explicitly marked as non-uploadable
-        joined = "\n".join(block_lines)
-        if "will NOT be uploaded" in joined:
-            return
-        # Skip obvious header sections
-        for ln in block_lines:
-            if ln.strip().lower().startswith('original line:') and re.search(r"coaching\s+staff|^coaches\b", ln, flags=re.IGNORECASE):
-                return
-        # Extract fields
-        name_ok = False
-        email_ok = False
-        username_ok = False
-        title_ok = False
-        for ln in block_lines:
-            if re.match(r"^\d+\.\s+\S+", ln):
-                # e.g., "1. First Last"
-                tokens = ln.split(maxsplit=1)
-                rest = tokens[1] if len(tokens) > 1 else ""
-                if rest.strip():
-                    name_ok = True
-            elif ln.strip().lower().startswith("email:"):
-                val = ln.split(":", 1)[1].strip() if ":" in ln else ""
-                if val and ("@" in val):
-                    email_ok = True
-            elif ln.strip().lower().startswith("username:"):
-                val = ln.split(":", 1)[1].strip() if ":" in ln else ""
-                if val:
-                    username_ok = True
-            elif ln.strip().lower().startswith("title:"):
-                val = ln.split(":", 1)[1].strip() if ":" in ln else ""
-                if val:
-                    title_ok = True
-        # Email is optional if a username is present
-        if not (name_ok and username_ok and title_ok):
-            issues += 1
-            print("⚠️  Validation issue in TXT entry block:")
-            for ln in block_lines:
-                print(f"   {ln}")
-            missing = []
-            if not name_ok: missing.append("name")
-            # Only flag email if also missing username
-            if (not email_ok) and (not username_ok):
-                missing.append("email")
-            if not username_ok: missing.append("username")
-            if not title_ok: missing.append("title")
-            print(f"   → Missing/invalid: {', '.join(missing)}")
-
-    # Walk lines and split into blocks separated by blank lines, only within PARSED ENTRIES section
-    for ln in lines[start_idx:end_idx]:
-        if ln.strip() == "":
-            validate_block(cur_block)
+    # No RAW LINES header: the held-back line is the file's last entry line
+    if pending is not None:
+        if pending.strip() == "":
+            issues += validate_txt_block(cur_block)
             cur_block = []
         else:
-            cur_block.append(ln)
+            cur_block.append(pending)
     # Validate last block if any
-    validate_block(cur_block)
+    issues += validate_txt_block(cur_block)
 
     if issues == 0:
         print("✅ TXT validation passed")
@@ -981,87 +1230,37 @@ def mark_damaged_txt(output_path: str):
     except Exception as e:
         print(f"⚠️  Failed to mark damaged TXT: {e}")
 
-def map_to_coach_profile(entry, pdf_info=None):
+def entry_sports(entry, pdf_info=None):
     """
-    Map scraped coach data to ReviewMyCoach coach profile structure.
+    Work out the sports list for a parsed entry from its sport section,
+    role text and the PDF's school context.
     """
     # Extract sport from sport section context first, then from role text
     sports = []
-    sport_section = entry.get('sport_section', '').lower() if entry.get('sport_section') else ''
+    sport_section = (entry.get('sport_section') or '').lower()
     role_text = entry.get('full_line', '').lower()
     
-    # Map sport sections to sports
+    # Map sport sections to sports; the first keyword in table order wins
     if sport_section:
-        if 'basketball' in sport_section:
-            if 'men' in sport_section:
-                sports.append('Basketball (Men)')
-            elif 'women' in sport_section:
-                sports.append('Basketball (Women)')
-            else:
-                sports.append('Basketball')
-        elif 'soccer' in sport_section:
-            if 'men' in sport_section:
-                sports.append('Soccer (Men)')
-            elif 'women' in sport_section:
-                sports.append('Soccer (Women)')
-            else:
-                sports.append('Soccer')
-        elif 'football' in sport_section:
-            sports.append('Football')
-        elif 'baseball' in sport_section:
-            sports.append('Baseball')
-        elif 'softball' in sport_section:
-            sports.append('Softball')
-        elif 'swimming' in sport_section:
-            sports.append('Swimming')
-        elif 'track' in sport_section or 'field' in sport_section:
-            sports.append('Track & Field')
-        elif 'cross country' in sport_section:
-            sports.append('Cross Country')
-        elif 'volleyball' in sport_section:
-            sports.append('Volleyball')
-        elif 'lacrosse' in sport_section:
-            if 'women' in sport_section:
-                sports.append('Lacrosse (Women)')
-            else:
-                sports.append('Lacrosse')
-        elif 'field hockey' in sport_section:
-            sports.append('Field Hockey')
+        section_keywords = set(SECTION_SPORT_RE.findall(sport_section))
+        if section_keywords:
+            markers = {'men': 'men' in sport_section, 'women': 'women' in sport_section}
+            for keyword, sport in SECTION_SPORTS:
+                if keyword in section_keywords:
+                    for marker, qualifier in SECTION_GENDER_QUALIFIERS.get(sport, ()):
+                        if markers[marker]:
+                            sport = f"{sport} ({qualifier})"
+                            break
+                    sports.append(sport)
+                    break
     
     # Fallback to role text analysis if no sport section context
     if not sports:
-        sport_keywords = {
-            'soccer': 'Soccer',
-            'football': 'Soccer',  # In case they use "football" to mean soccer
-            'men\'s soccer': 'Soccer',
-            'mens soccer': 'Soccer',
-            'goalkeeper': 'Soccer',
-            'goalie': 'Soccer',
-            'midfielder': 'Soccer',
-            'defender': 'Soccer',
-            'forward': 'Soccer',
-            'striker': 'Soccer',
-            # Keep other common sports as fallback
-            'baseball': 'Baseball',
-            'basketball': 'Basketball',
-            'tennis': 'Tennis',
-            'swimming': 'Swimming',
-            'track': 'Track & Field',
-            'field': 'Track & Field',
-            'cross country': 'Cross Country',
-            'volleyball': 'Volleyball',
-            'golf': 'Golf',
-            'wrestling': 'Wrestling',
-            'lacrosse': 'Lacrosse',
-            'softball': 'Softball',
-            'hockey': 'Hockey',
-            'rowing': 'Rowing',
-            'strength': 'Strength & Conditioning',
-            'conditioning': 'Strength & Conditioning'
-        }
-        
-        for keyword, sport in sport_keywords.items():
-            if keyword in role_text and sport not in sports:
+        # Every keyword occurring anywhere in the line, found in one scan;
+        # sports are still listed in keyword order
+        found = {m.group(1) for m in SPORT_KEYWORD_RE.finditer(role_text)}
+        for keyword, sport in SPORT_KEYWORDS.items():
+            if keyword in found and sport not in sports:
                 sports.append(sport)
     
     # Use PDF info to determine default sport and organization
@@ -1079,6 +1278,17 @@ def map_to_coach_profile(entry, pdf_info=None):
     elif not sports:
         sports = ['General Athletics']  # Generic fallback
     
+    return sports
+
+def map_to_coach_profile(entry, pdf_info=None):
+    """
+    Map scraped coach data to ReviewMyCoach coach profile structure.
+    """
+    # parse_pdf stores each entry's sports once so the TXT writer and the
+    # uploader don't both rescan the role text
+    sports = entry.get('_sports')
+    sports = list(sports) if sports is not None else entry_sports(entry, pdf_info)
+    
     # Extract role/title from parsed entry when available; fallback to regex
     parsed_title = (entry.get('title') or entry.get('role') or '').strip()
     if parsed_title:
@@ -1086,7 +1296,7 @@ def map_to_coach_profile(entry, pdf_info=None):
     else:
         role_part = entry.get('full_line', '')
         if 'coach' in role_part.lower():
-            role_match = re.search(r'(Head Coach|Assistant Coach|Defensive Coordinator|[A-Za-z\s]+Coach)', role_part, re.IGNORECASE)
+            role_match = ROLE_FALLBACK_RE.search(role_part)
             role = role_match.group(1) if role_match else 'Coach'
         else:
             role = 'Coach'
@@ -1103,45 +1313,29 @@ def map_to_coach_profile(entry, pdf_info=None):
         source_url = 'University Athletics Directory'
 
     # Create complete coach profile matching the app structure
-    coach_profile = {
-        'username': entry['username'],
-        'displayName': f"{entry['first_name']} {entry['last_name']}".strip(),
-        'email': entry['email'],
-        'bio': f"Experienced {role.lower()} specializing in {', '.join(sports).lower()}.",
-        'sports': sports,
-        # 'experience' intentionally omitted per user request
-        'certifications': [],
-        'hourlyRate': 0,  # To be set during profile completion
-        'location': location,
-        'availability': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'],
-        'specialties': sports,
-        'languages': ['English'],
-        'organization': organization,
-        'university': pdf_info.get('university', ''),
-        'role': role,
-        'gender': '',  # To be filled during claiming
-        'ageGroup': ['Adult', 'Teen', 'Youth'],
-        'sourceUrl': source_url,
-        'averageRating': 0,
-        'totalReviews': 0,
-        'isVerified': False,
-        'isPublic': True,  # Required by search API to show in results
-        'hasActiveServices': False,  # Will be set to True when services are added
-        'profileImage': '',
-        'website': '',
-        'socialMedia': {
+    coach_profile = COACH_PROFILE_TEMPLATE.copy()
+    coach_profile.update(
+        username=entry['username'],
+        displayName=f"{entry['first_name']} {entry['last_name']}".strip(),
+        email=entry['email'],
+        bio=f"Experienced {role.lower()} specializing in {', '.join(sports).lower()}.",
+        sports=sports,
+        certifications=[],
+        location=location,
+        availability=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'],
+        specialties=sports,
+        languages=['English'],
+        organization=organization,
+        university=pdf_info.get('university', ''),
+        role=role,
+        ageGroup=['Adult', 'Teen', 'Youth'],
+        sourceUrl=source_url,
+        socialMedia={
             'instagram': '',
             'twitter': '',
             'linkedin': ''
         },
-        'createdAt': firestore.SERVER_TIMESTAMP,
-        'updatedAt': firestore.SERVER_TIMESTAMP,
-        'profileCompleted': False,
-        'isClaimed': False,  # Key field for claiming system
-        'userId': None,  # Will be linked when claimed
-        'claimedAt': None,
-        'verificationStatus': 'pending'  # pending, in_review, verified, rejected
-    }
+    )
     
     # Add phone number if available
     if 'phone' in entry:
@@ -1177,37 +1371,67 @@ def upload_to_firestore(entries, key_path, pdf_info=None, collection='coaches',
     uploaded_count = 0
     skipped_count = 0
 
+    # One profile per username; a later entry for the same username wins,
+    # as it would have with sequential set() calls
+    profiles = {}
     for e in entries:
         if e.get('uploadable') is False:
             continue
         try:
             coach_profile = map_to_coach_profile(e, pdf_info)
-            username = coach_profile['username']
-            
-            # Check if coach profile already exists
-            coach_ref = db.collection('coaches').document(username)
-            existing_coach = coach_ref.get()
-            
-            if existing_coach.exists:
-                existing_data = existing_coach.to_dict()
+            profiles[coach_profile['username']] = coach_profile
+        except Exception as error:
+            print(f"❌ Error processing {e['email']}: {error}")
+
+    refs = [db.collection(collection).document(username) for username in profiles]
+    existing_usernames = set()
+
+    # This PDF's writes are acknowledged on BulkWriter's threads, not main's
+    count_lock = threading.Lock()
+
+    def on_write_result(reference, result, bulk_writer):
+        nonlocal uploaded_count
+        coach_profile = profiles[reference.id]
+        phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
+        status = "Updated" if reference.id in existing_usernames else "Created"
+        print(f"✔ {status} unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → {collection}/{reference.id}{phone_info}")
+        with count_lock:
+            uploaded_count += 1
+
+    def on_write_error(failure, bulk_writer):
+        # Timeouts, contention and transient unavailability are retried with backoff
+        if failure.code in RETRYABLE_WRITE_CODES and failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        print(f"❌ Error processing {profiles[failure.operation.reference.id]['email']}: {failure.message}")
+        return False
+
+    bulk_writer = db.bulk_writer(options=BulkWriterOptions(initial_ops_per_second=500))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+
+    try:
+        # Single batched read instead of one get() round trip per coach
+        for coach_doc in db.get_all(refs):
+            username = coach_doc.id
+            coach_profile = profiles[username]
+            if coach_doc.exists:
+                existing_data = coach_doc.to_dict()
                 if existing_data.get('isClaimed', False):
                     print(f"⏭️  Skipped {coach_profile['email']} - already claimed by user")
                     skipped_count += 1
                     continue
                 else:
                     print(f"🔄 Updating unclaimed profile for {coach_profile['email']}")
-            
+                    existing_usernames.add(username)
+
             # Upload/update the coach profile
-            coach_ref.set(coach_profile)
-            
-            phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
-            status = "Updated" if existing_coach.exists else "Created"
-            print(f"✔ {status} unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → coaches/{username}{phone_info}")
-            uploaded_count += 1
-            
-        except Exception as error:
-            print(f"❌ Error processing {e['email']}: {error}")
-    
+            bulk_writer.set(coach_doc.reference, coach_profile)
+    except Exception as error:
+        print(f"❌ Error looking up coach profiles: {error}")
+    finally:
+        # Flushes all queued writes and waits for their results
+        bulk_writer.close()
+
     print(f"\n📊 Upload Summary:")
     print(f"✔ {uploaded_count} coach profiles created/updated")
     print(f"⏭️  {skipped_count} profiles skipped (already claimed)")
@@ -1215,6 +1439,45 @@ def upload_to_firestore(entries, key_path, pdf_info=None, collection='coaches',
     return uploaded_count, skipped_count
 
 
+def find_pdfs(root: str):
+    """
+    Yield the paths of all .pdf files under root, recursively.
+    Like os.walk, symlinked directories are not followed and unreadable
+    directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        yield from find_pdfs(entry.path)
+                elif entry.name.lower().endswith(".pdf"):
+                    yield entry.path
+    except OSError:
+        return
+
+def parse_pdf_job(job):
+    """
+    Pool entry point: parse one (pdf_path, output_txt) pair.
+    Returns (coaches, pdf_info, error, log) so one bad PDF does not abort the
+    pool; log is parse_pdf's printed output, for the caller to show in order.
+    """
+    pdf_path, output_txt = job
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            coaches, pdf_info = parse_pdf(pdf_path, output_txt)
+        return coaches, pdf_info, None, log.getvalue()
+    except Exception as e:
+        return [], None, str(e), log.getvalue()
+
+def parse_job_result(future):
+    """Result of a submitted parse_pdf_job; a worker that died fails only its own PDF"""
+    try:
+        return future.result()
+    except Exception as e:
+        return [], None, str(e) or type(e).__name__, ""
+
 def main():
     p = argparse.ArgumentParser(
         description="Import coaches from University Athletics PDF(s). Can take a single PDF path OR a directory of PDFs."
@@ -1226,6 +1489,7 @@ def main():
     p.add_argument("--output-txt", help="Path to output txt file for quick review (single PDF mode). If processing a directory, per-PDF files will go under --output-dir.")
     p.add_argument("--output-dir", default="dry-run-output", help="Directory to store per-PDF review txt files (default: dry-run-output)")
     p.add_argument("--dry-run", action="store_true", help="If set, do not upload to Firestore; just print and write the review txt.")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes used to parse PDFs in parallel (default: CPU count)")
     args = p.parse_args()
 
     # Resolve input path. If --nj is set, force ./pdfs/nj
@@ -1243,11 +1507,7 @@ def main():
     # Collect list of pdf paths
     pdf_paths = []
     if is_dir:
-        for root, _, files in os.walk(input_path):
-            for f in files:
-                if f.lower().endswith(".pdf"):
-                    pdf_paths.append(os.path.join(root, f))
-        pdf_paths.sort()
+        pdf_paths = sorted(find_pdfs(input_path))
         if not pdf_paths:
             print(f"No PDFs found under directory: {input_path}")
             return
@@ -1257,54 +1517,75 @@ def main():
     total_found = 0
     total_uploaded = 0
 
-    # Process each PDF
+    jobs = []
+    # Names are built before any PDF is parsed, so they all share one stamp;
+    # PDFs with the same basename in different folders get their job number
+    # appended so parallel workers never write the same review file
+    run_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    used_txt_names = set()
     for idx, pdf_path in enumerate(pdf_paths, start=1):
         pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
         # Per-file output unless user forced a single output path
         if args.output_txt and not is_dir:
             output_txt = args.output_txt
         else:
-            output_txt = os.path.join(output_dir, f"coaches_filtered_{pdf_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+            txt_name = f"coaches_filtered_{pdf_name}_{run_stamp}"
+            if txt_name in used_txt_names:
+                txt_name = f"{txt_name}_{idx}"
+            used_txt_names.add(txt_name)
+            output_txt = os.path.join(output_dir, f"{txt_name}.txt")
+        jobs.append((pdf_path, output_txt))
 
-        print(f"\n=== [{idx}/{len(pdf_paths)}] Processing: {pdf_path} ===")
-        try:
-            coaches, pdf_info = parse_pdf(pdf_path, output_txt)
-        except Exception as e:
-            print(f"!! Failed to parse {pdf_path}: {e}")
-            continue
+    # Parse PDFs in worker processes; uploads stay in this process and run in
+    # input order while the remaining PDFs are still being parsed. A worker's
+    # output is captured and printed under its PDF's header.
+    workers = max(1, min(args.workers, len(jobs)))
+    with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as pool:
+        if pool:
+            futures = [pool.submit(parse_pdf_job, job) for job in jobs]
+            results = map(parse_job_result, futures)
+        else:
+            results = map(parse_pdf_job, jobs)
+        # Process each PDF
+        for idx, ((pdf_path, output_txt), (coaches, pdf_info, parse_error, parse_log)) in enumerate(zip(jobs, results), start=1):
+            print(f"\n=== [{idx}/{len(pdf_paths)}] Processing: {pdf_path} ===")
+            print(parse_log, end="")
+            if parse_error is not None:
+                print(f"!! Failed to parse {pdf_path}: {parse_error}")
+                continue
 
-        print(f"Found {len(coaches)} coach entries (filtered from PDF).")
-        total_found += len(coaches)
+            print(f"Found {len(coaches)} coach entries (filtered from PDF).")
+            total_found += len(coaches)
 
-        if len(coaches) == 0:
-            print("No entries with 'coach' keyword found in the PDF.")
-            continue
+            if len(coaches) == 0:
+                print("No entries with 'coach' keyword found in the PDF.")
+                continue
 
-        try:
-            if args.dry_run:
-                # Always perform dry-run printing of intended uploads
-                upload_to_firestore(coaches, None, pdf_info, args.collection, dry_run=True)
-            elif args.key:
-                # Validate TXT before uploading for this PDF
-                is_valid, _ = validate_txt_file(output_txt)
-                if not is_valid:
-                    mark_damaged_txt(output_txt)
-                    print("⏭️  Skipping upload for this PDF due to validation issues. Moved to damaged-pdfs.")
-                    continue
-                # Build usernames for entries missing emails
-                for e in coaches:
-                    if not e.get('email'):
-                        uname = build_username_from_name(e.get('first_name', ''), e.get('last_name', ''))
-                        e['username'] = uname or e.get('username') or ''
-                        e['uploadable'] = True if uname else False
-                uploaded_count, skipped_count = upload_to_firestore(coaches, args.key, pdf_info, args.collection)
-                total_uploaded += uploaded_count
-            else:
-                print("No Firebase key provided - results only saved to txt file.")
-                print("To upload to Firestore, run with --key path/to/firebase-key.json")
-        except Exception as e:
-            print(f"!! Failed to upload entries for {pdf_path}: {e}")
-            continue
+            try:
+                if args.dry_run:
+                    # Always perform dry-run printing of intended uploads
+                    upload_to_firestore(coaches, None, pdf_info, args.collection, dry_run=True)
+                elif args.key:
+                    # Validate TXT before uploading for this PDF
+                    is_valid, _ = validate_txt_file(output_txt)
+                    if not is_valid:
+                        mark_damaged_txt(output_txt)
+                        print("⏭️  Skipping upload for this PDF due to validation issues. Moved to damaged-pdfs.")
+                        continue
+                    # Build usernames for entries missing emails
+                    for e in coaches:
+                        if not e.get('email'):
+                            uname = build_username_from_name(e.get('first_name', ''), e.get('last_name', ''))
+                            e['username'] = uname or e.get('username') or ''
+                            e['uploadable'] = True if uname else False
+                    uploaded_count, skipped_count = upload_to_firestore(coaches, args.key, pdf_info, args.collection)
+                    total_uploaded += uploaded_count
+                else:
+                    print("No Firebase key provided - results only saved to txt file.")
+                    print("To upload to Firestore, run with --key path/to/firebase-key.json")
+            except Exception as e:
+                print(f"!! Failed to upload entries for {pdf_path}: {e}")
+                continue
 
     print(f"\n=== DONE ===")
     print(f"PDFs processed: {len(pdf_paths)}")
@@ -1,59 +1,188 @@
 import argparse
 import re
+from concurrent.futures import ProcessPoolExecutor
 import pdfplumber
+import pypdfium2 as pdfium
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 import os
+import threading
 from datetime import datetime
 
+# Phone number patterns, in priority order, each tagged with the shape of
+# what it matches so extract_and_format_phone never has to re-match it
+PHONE_PATTERNS = [(re.compile(p), shape) for p, shape in (
+    (r'\(\d{3}\)\s*\d{3}-\d{4}', 'as_is'),      # (856) 256-4687
+    (r'\(\d{3}\)\s*\d{3}\.\d{4}', 'as_is'),      # (856) 256.4687
+    (r'\d{3}-\d{3}-\d{4}', 'dashed_10'),         # 856-256-4687
+    (r'\d{3}\.\d{3}\.\d{4}', 'as_is'),           # 856.256.4687
+    (r'\d{3}\s+\d{3}-\d{4}', 'spaced_10'),       # 856 256-4687
+    (r'\d{3}-\d{4}', 'local_7'),                 # 256-4687 (7-digit)
+    (r'\d{3}\.\d{4}', 'local_7'),                # 256.4687 (7-digit)
+    (r'\b\d{7}\b', 'digits_7')                   # 2564687 (7-digit no separator)
+)]
+# Union of the patterns above, so lines without any phone number are
+# rejected in a single scan. The ordered list above still decides which
+# pattern wins, since an alternation would prefer the leftmost match instead.
+ANY_PHONE_RE = re.compile("|".join(f"(?:{p.pattern})" for p, _ in PHONE_PATTERNS))
+
+AREA_CODE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'Area Code \((\d{3})\)',
+    r'Area Code: \((\d{3})\)',
+    r'Area Code (\d{3})',
+    r'Area Code: (\d{3})',
+    r'\((\d{3})\) area code'
+)]
+
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+# Lines that cannot be a coach's name in the multi-line format (matched against lowercased lines)
+NAME_LINE_BLOCKLIST_RE = re.compile("coaching|staff|soccer|university|2025|/|pm|am|director of")
+
+# Line classification
+SPORT_SECTION_RE = re.compile(r'^([A-Z\s&]+(?:\([^)]+\))?)$')
+# Sports that make an all-caps line a section header; matched as substrings of the lowercased line
+SPORT_NAME_RE = re.compile(
+    "baseball|basketball|soccer|football|swimming|volleyball|lacrosse|track|field hockey|cross country|softball"
+)
+
+# Sport-section keywords → sport, in priority order. 'field hockey' sections
+# land on 'field' first and map to Track & Field.
+SECTION_SPORTS = (
+    ('basketball', 'Basketball'),
+    ('soccer', 'Soccer'),
+    ('football', 'Football'),
+    ('baseball', 'Baseball'),
+    ('softball', 'Softball'),
+    ('swimming', 'Swimming'),
+    ('track', 'Track & Field'),
+    ('field', 'Track & Field'),
+    ('cross country', 'Cross Country'),
+    ('volleyball', 'Volleyball'),
+    ('lacrosse', 'Lacrosse'),
+)
+# Every section keyword present, in one scan; no keyword is a prefix of another
+SECTION_SPORT_RE = re.compile("(?=(" + "|".join(re.escape(k) for k, _ in SECTION_SPORTS) + "))")
+# (section marker, qualifier) pairs checked in order for gendered programs
+SECTION_GENDER_QUALIFIERS = {
+    'Basketball': (('men', 'Men'), ('women', 'Women')),
+    'Soccer': (('men', 'Men'), ('women', 'Women')),
+    'Lacrosse': (('women', 'Women'),),
+}
+
+# Role-text keywords → sport, used by map_to_coach_profile when there is no sport section
+SPORT_KEYWORDS = {
+    'soccer': 'Soccer',
+    'football': 'Soccer',  # In case they use "football" to mean soccer
+    'men\'s soccer': 'Soccer',
+    'mens soccer': 'Soccer',
+    'goalkeeper': 'Soccer',
+    'goalie': 'Soccer',
+    'midfielder': 'Soccer',
+    'defender': 'Soccer',
+    'forward': 'Soccer',
+    'striker': 'Soccer',
+    # Keep other common sports as fallback
+    'baseball': 'Baseball',
+    'basketball': 'Basketball',
+    'tennis': 'Tennis',
+    'swimming': 'Swimming',
+    'track': 'Track & Field',
+    'field': 'Track & Field',
+    'cross country': 'Cross Country',
+    'volleyball': 'Volleyball',
+    'golf': 'Golf',
+    'wrestling': 'Wrestling',
+    'lacrosse': 'Lacrosse',
+    'softball': 'Softball',
+    'hockey': 'Hockey',
+    'rowing': 'Rowing',
+    'strength': 'Strength & Conditioning',
+    'conditioning': 'Strength & Conditioning'
+}
+# Zero-width so overlapping keywords ('men's soccer' / 'soccer') are all seen;
+# no keyword is a prefix of another, so one alternative per position suffices
+SPORT_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, SPORT_KEYWORDS)) + "))")
+
+# Role fallback in map_to_coach_profile
+ROLE_FALLBACK_RE = re.compile(r'(Head Coach|Assistant Coach|Defensive Coordinator|[A-Za-z\s]+Coach)', re.IGNORECASE)
+
+# google.rpc status codes worth retrying for a bulk write: DEADLINE_EXCEEDED, ABORTED, UNAVAILABLE
+RETRYABLE_WRITE_CODES = (4, 10, 14)
+MAX_WRITE_ATTEMPTS = 5
+
+# PDFium needs only a few ms per page, so a worker process only pays for
+# itself once it has at least this many pages to read
+MIN_PAGES_PER_WORKER = 25
+
+# New unclaimed coach profile, in document order. Fields set to None are
+# filled per entry by map_to_coach_profile, which also gives each profile
+# its own lists and dicts.
+COACH_PROFILE_TEMPLATE = {
+    'username': None,
+    'displayName': None,
+    'email': None,
+    'bio': None,
+    'sports': None,
+    'experience': 5,  # Default to 5 years
+    'certifications': None,
+    'hourlyRate': 0,  # To be set during profile completion
+    'location': None,
+    'availability': None,
+    'specialties': None,
+    'languages': None,
+    'organization': None,
+    'role': None,
+    'gender': '',  # To be filled during claiming
+    'ageGroup': None,
+    'sourceUrl': None,
+    'averageRating': 0,
+    'totalReviews': 0,
+    'isVerified': False,
+    'isPublic': True,  # Required by search API to show in results
+    'hasActiveServices': False,  # Will be set to True when services are added
+    'profileImage': '',
+    'website': '',
+    'socialMedia': None,
+    'createdAt': firestore.SERVER_TIMESTAMP,
+    'updatedAt': firestore.SERVER_TIMESTAMP,
+    'profileCompleted': False,
+    'isClaimed': False,  # Key field for claiming system
+    'userId': None,  # Will be linked when claimed
+    'claimedAt': None,
+    'verificationStatus': 'pending'  # pending, in_review, verified, rejected
+}
+
 def extract_and_format_phone(line, area_code):
     """
     Extract phone number from line and format with area code if needed.
     """
-    # Phone number patterns
-    phone_patterns = [
-        r'\(\d{3}\)\s*\d{3}-\d{4}',      # (856) 256-4687
-        r'\(\d{3}\)\s*\d{3}\.\d{4}',      # (856) 256.4687
-        r'\d{3}-\d{3}-\d{4}',             # 856-256-4687
-        r'\d{3}\.\d{3}\.\d{4}',           # 856.256.4687
-        r'\d{3}\s+\d{3}-\d{4}',           # 856 256-4687
-        r'\d{3}-\d{4}',                   # 256-4687 (7-digit)
-        r'\d{3}\.\d{4}',                  # 256.4687 (7-digit)
-        r'\b\d{7}\b'                      # 2564687 (7-digit no separator)
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, line)
+    if not ANY_PHONE_RE.search(line):
+        return None
+
+    for pattern, shape in PHONE_PATTERNS:
+        match = pattern.search(line)
         if match:
-            phone = match.group().strip()
+            # No pattern can match leading or trailing whitespace
+            phone = match.group()
             
             # If it's a 7-digit number and we have an area code, add it
-            if area_code and (re.match(r'^\d{3}-\d{4}$', phone) or 
-                             re.match(r'^\d{3}\.\d{4}$', phone) or 
-                             re.match(r'^\d{7}$', phone)):
-                if re.match(r'^\d{7}$', phone):
-                    # Format 7-digit number with dash
-                    phone = phone[:3] + '-' + phone[3:]
-                
+            if shape == 'local_7' and area_code:
                 return f"({area_code}) {phone}"
             
+            elif shape == 'digits_7' and area_code:
+                # Format 7-digit number with dash
+                return f"({area_code}) {phone[:3]}-{phone[3:]}"
+            
             # If it already has area code, clean up format
-            elif re.match(r'^\d{3}-\d{3}-\d{4}$', phone):
-                area = phone[:3]
-                number = phone[4:]
-                return f"({area}) {number}"
+            elif shape == 'dashed_10':
+                return f"({phone[:3]}) {phone[4:]}"
             
-            elif re.match(r'^\d{3}\s+\d{3}-\d{4}$', phone):
-                parts = phone.split()
-                area = parts[0]
-                number = parts[1]
+            elif shape == 'spaced_10':
+                area, number = phone.split()
                 return f"({area}) {number}"
             
-            # Return as-is if already well formatted
-            elif re.match(r'^\(\d{3}\)', phone):
-                return phone
-            
-            # For other formats, return as-is
+            # "(###) ###-####" and other formats are returned as-is
             else:
                 return phone
     
@@ -109,7 +238,62 @@ def detect_pdf_info(path, text_content):
     
     return pdf_info
 
-def parse_pdf(path, output_txt=None):
+def _page_texts(pdf, start, stop):
+    """PDFium text of pages [start, stop) of an open document."""
+    texts = []
+    for index in range(start, stop):
+        page = pdf[index]
+        textpage = page.get_textpage()
+        texts.append(textpage.get_text_range())
+        textpage.close()
+        page.close()
+    return texts
+
+def _extract_page_range(job):
+    """
+    Pool entry point: PDFium text of pages [start, stop) of one PDF.
+    Each worker opens its own handle, since PDFium documents can't be shared across processes.
+    """
+    path, start, stop = job
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return _page_texts(pdf, start, stop)
+    finally:
+        pdf.close()
+
+def extract_pdf_text(path, workers=1):
+    """
+    Return the text of every non-empty page joined with newlines.
+    Text comes from PDFium (C++), once per page; long PDFs are split into
+    page ranges read by up to `workers` processes. Pages where PDFium finds
+    nothing are retried with pdfplumber, which is only opened if needed.
+    """
+    pdf = pdfium.PdfDocument(path)
+    try:
+        page_count = len(pdf)
+        workers = min(workers, page_count // MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            page_texts = _page_texts(pdf, 0, page_count)
+    finally:
+        pdf.close()
+
+    if workers > 1:
+        # Contiguous ranges, read in parallel and reassembled in page order
+        chunk = -(-page_count // workers)
+        jobs = [(path, start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            page_texts = [text for texts in pool.map(_extract_page_range, jobs) for text in texts]
+
+    empty_pages = [index for index, page_text in enumerate(page_texts) if not page_text.strip()]
+    if empty_pages:
+        # extract_text() runs pdfminer's layout analysis, so call it once per page
+        with pdfplumber.open(path) as plumber_pdf:
+            for index in empty_pages:
+                page_texts[index] = plumber_pdf.pages[index].extract_text() or ""
+
+    return "\n".join(page_text for page_text in page_texts if page_text)
+
+def parse_pdf(path, output_txt=None, workers=1):
     """
     Extract lines with emails from PDF and parse first/last names + username.
     Filter for entries that contain 'coach' in their title/line.
@@ -133,24 +317,11 @@ def parse_pdf(path, output_txt=None):
     else:
         # Handle PDF file
         print(f"📄 Processing PDF file: {path}")
-        with pdfplumber.open(path) as pdf:
-            text = "\n".join(
-                page.extract_text() 
-                for page in pdf.pages 
-                if page.extract_text()
-            )
+        text = extract_pdf_text(path, workers)
 
     # Extract area code from the text (Rhode Island commonly uses 401)
-    area_code_patterns = [
-        r'Area Code \((\d{3})\)',
-        r'Area Code: \((\d{3})\)',
-        r'Area Code (\d{3})',
-        r'Area Code: (\d{3})',
-        r'\((\d{3})\) area code'
-    ]
-    
-    for pattern in area_code_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in AREA_CODE_PATTERNS:
+        match = pattern.search(text)
         if match:
             area_code = match.group(1)
             print(f"📞 Detected area code: ({area_code})")
@@ -164,6 +335,11 @@ def parse_pdf(path, output_txt=None):
     print(f"🏫 Detected organization: {pdf_info.get('organization', 'Unknown')}")
 
     lines = text.splitlines()
+    # Per-line views shared by both methods, computed once. The email
+    # regex only runs on lines that contain '@'.
+    stripped = [ln.strip() for ln in lines]
+    lowers = [st.lower() for st in stripped]
+    email_matches = [EMAIL_RE.search(ln) if '@' in ln else None for ln in lines]
     
     # Method 1: Try single-line format first (original logic)  
     single_line_entries = []
@@ -171,21 +347,21 @@ def parse_pdf(path, output_txt=None):
     
     for i, line in enumerate(lines):
         # Check if this line is a sport section header
-        line_stripped = line.strip()
-        sport_section_match = re.match(r'^([A-Z\s&]+(?:\([^)]+\))?)$', line_stripped)
-        if sport_section_match and any(sport in line_stripped.lower() for sport in 
-                                      ['baseball', 'basketball', 'soccer', 'football', 'swimming', 
-                                       'volleyball', 'lacrosse', 'track', 'field hockey', 'cross country', 'softball']):
+        line_stripped = stripped[i]
+        # Section headers are all caps, so most lines fail on their first character
+        first_char = line_stripped[:1]
+        if ((first_char.isupper() or first_char == '&') and SPORT_SECTION_RE.match(line_stripped)
+                and SPORT_NAME_RE.search(lowers[i])):
             current_sport_section = line_stripped
             print(f"🏃‍♂️ Found sport section: {current_sport_section}")
             continue
         
-        m = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
-        if not m:
+        # Filter for lines containing "coach" (case-insensitive) before the email regex
+        if "coach" not in lowers[i]:
             continue
-        
-        # Filter for lines containing "coach" (case-insensitive)
-        if "coach" not in line.lower():
+
+        m = email_matches[i]
+        if not m:
             continue
             
         email = m.group()
@@ -195,7 +371,7 @@ def parse_pdf(path, output_txt=None):
         phone_number = extract_and_format_phone(line, area_code)
         
         # Store full line for txt output
-        all_lines.append(line.strip())
+        all_lines.append(line_stripped)
 
         # drop common prefixes
         tokens = name_part.split()
@@ -212,7 +388,7 @@ def parse_pdf(path, output_txt=None):
             "last_name":  last_name,
             "email":      email,
             "username":   username,
-            "full_line":  line.strip(),
+            "full_line":  line_stripped,
             "role": "coach",
             "sport_section": current_sport_section  # Add sport context
         }
@@ -227,7 +403,7 @@ def parse_pdf(path, output_txt=None):
         print("🔄 No single-line format found, trying multi-line format...")
         for i, line in enumerate(lines):
             # Look for email addresses
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
+            email_match = email_matches[i]
             if not email_match:
                 continue
             
@@ -243,21 +419,20 @@ def parse_pdf(path, output_txt=None):
             for j in range(1, 4):  # Look back up to 3 lines
                 if i - j < 0:
                     break
-                prev_line = lines[i - j].strip()
+                prev_line = stripped[i - j]
                 
                 # Check if this line contains "coach"
-                if "coach" in prev_line.lower() and not coach_title:
+                if "coach" in lowers[i - j] and not coach_title:
                     coach_title = prev_line
-                    all_lines.append(f"{prev_line} -> {line.strip()}")
+                    all_lines.append(f"{prev_line} -> {stripped[i]}")
                     
                     # The name should be the line immediately before the coach title
                     if i - j - 1 >= 0:
-                        potential_name_line = lines[i - j - 1].strip()
+                        potential_name_line = stripped[i - j - 1]
                         # Make sure it's not an email, header, or other metadata
                         if (potential_name_line and 
-                            not re.search(r'[\w\.-]+@[\w\.-]+\.\w+', potential_name_line) and
-                            not any(keyword in potential_name_line.lower() for keyword in 
-                                   ['coaching', 'staff', 'soccer', 'university', '2025', '/', 'pm', 'am', 'director of']) and
+                            not email_matches[i - j - 1] and
+                            not NAME_LINE_BLOCKLIST_RE.search(lowers[i - j - 1]) and
                             len(potential_name_line.split()) >= 2):  # Require at least first and last name
                             coach_name = potential_name_line
                     break  # Stop once we find the coach title
@@ -266,7 +441,7 @@ def parse_pdf(path, output_txt=None):
             for j in range(1, 3):  # Look ahead up to 2 lines
                 if i + j >= len(lines):
                     break
-                next_line = lines[i + j].strip()
+                next_line = stripped[i + j]
                 phone_number = extract_and_format_phone(next_line, area_code)
                 if phone_number:
                     break
@@ -345,81 +520,30 @@ def map_to_coach_profile(entry, pdf_info=None):
     """
     # Extract sport from sport section context first, then from role text
     sports = []
-    sport_section = entry.get('sport_section', '').lower() if entry.get('sport_section') else ''
+    sport_section = (entry.get('sport_section') or '').lower()
     role_text = entry.get('full_line', '').lower()
     
-    # Map sport sections to sports
+    # Map sport sections to sports; the first keyword in table order wins
     if sport_section:
-        if 'basketball' in sport_section:
-            if 'men' in sport_section:
-                sports.append('Basketball (Men)')
-            elif 'women' in sport_section:
-                sports.append('Basketball (Women)')
-            else:
-                sports.append('Basketball')
-        elif 'soccer' in sport_section:
-            if 'men' in sport_section:
-                sports.append('Soccer (Men)')
-            elif 'women' in sport_section:
-                sports.append('Soccer (Women)')
-            else:
-                sports.append('Soccer')
-        elif 'football' in sport_section:
-            sports.append('Football')
-        elif 'baseball' in sport_section:
-            sports.append('Baseball')
-        elif 'softball' in sport_section:
-            sports.append('Softball')
-        elif 'swimming' in sport_section:
-            sports.append('Swimming')
-        elif 'track' in sport_section or 'field' in sport_section:
-            sports.append('Track & Field')
-        elif 'cross country' in sport_section:
-            sports.append('Cross Country')
-        elif 'volleyball' in sport_section:
-            sports.append('Volleyball')
-        elif 'lacrosse' in sport_section:
-            if 'women' in sport_section:
-                sports.append('Lacrosse (Women)')
-            else:
-                sports.append('Lacrosse')
-        elif 'field hockey' in sport_section:
-            sports.append('Field Hockey')
+        section_keywords = set(SECTION_SPORT_RE.findall(sport_section))
+        if section_keywords:
+            markers = {'men': 'men' in sport_section, 'women': 'women' in sport_section}
+            for keyword, sport in SECTION_SPORTS:
+                if keyword in section_keywords:
+                    for marker, qualifier in SECTION_GENDER_QUALIFIERS.get(sport, ()):
+                        if markers[marker]:
+                            sport = f"{sport} ({qualifier})"
+                            break
+                    sports.append(sport)
+                    break
     
     # Fallback to role text analysis if no sport section context
     if not sports:
-        sport_keywords = {
-            'soccer': 'Soccer',
-            'football': 'Soccer',  # In case they use "football" to mean soccer
-            'men\'s soccer': 'Soccer',
-            'mens soccer': 'Soccer',
-            'goalkeeper': 'Soccer',
-            'goalie': 'Soccer',
-            'midfielder': 'Soccer',
-            'defender': 'Soccer',
-            'forward': 'Soccer',
-            'striker': 'Soccer',
-            # Keep other common sports as fallback
-            'baseball': 'Baseball',
-            'basketball': 'Basketball',
-            'tennis': 'Tennis',
-            'swimming': 'Swimming',
-            'track': 'Track & Field',
-            'field': 'Track & Field',
-            'cross country': 'Cross Country',
-            'volleyball': 'Volleyball',
-            'golf': 'Golf',
-            'wrestling': 'Wrestling',
-            'lacrosse': 'Lacrosse',
-            'softball': 'Softball',
-            'hockey': 'Hockey',
-            'rowing': 'Rowing',
-            'strength': 'Strength & Conditioning',
-            'conditioning': 'Strength & Conditioning'
-        }
-        
-        for keyword, sport in sport_keywords.items():
-            if keyword in role_text and sport not in sports:
+        # Every keyword occurring anywhere in the line, found in one scan;
+        # sports are still listed in keyword order
+        found = set(SPORT_KEYWORD_RE.findall(role_text))
+        for keyword, sport in SPORT_KEYWORDS.items():
+            if keyword in found and sport not in sports:
                 sports.append(sport)
     
     # Use PDF info to determine default sport and organization
@@ -441,7 +565,7 @@ def map_to_coach_profile(entry, pdf_info=None):
     role_part = entry.get('full_line', '')
     if 'coach' in role_part.lower():
         # Try to extract the coaching role
-        role_match = re.search(r'(Head Coach|Assistant Coach|Defensive Coordinator|[A-Za-z\s]+Coach)', role_part, re.IGNORECASE)
+        role_match = ROLE_FALLBACK_RE.search(role_part)
         role = role_match.group(1) if role_match else 'Coach'
     else:
         role = 'Coach'
@@ -458,44 +582,28 @@ def map_to_coach_profile(entry, pdf_info=None):
         source_url = 'University Athletics Directory'
 
     # Create complete coach profile matching the app structure
-    coach_profile = {
-        'username': entry['username'],
-        'displayName': f"{entry['first_name']} {entry['last_name']}".strip(),
-        'email': entry['email'],
-        'bio': f"Experienced {role.lower()} specializing in {', '.join(sports).lower()}.",
-        'sports': sports,
-        'experience': 5,  # Default to 5 years
-        'certifications': [],
-        'hourlyRate': 0,  # To be set during profile completion
-        'location': location,
-        'availability': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'],
-        'specialties': sports,
-        'languages': ['English'],
-        'organization': organization,
-        'role': role,
-        'gender': '',  # To be filled during claiming
-        'ageGroup': ['Adult', 'Teen', 'Youth'],
-        'sourceUrl': source_url,
-        'averageRating': 0,
-        'totalReviews': 0,
-        'isVerified': False,
-        'isPublic': True,  # Required by search API to show in results
-        'hasActiveServices': False,  # Will be set to True when services are added
-        'profileImage': '',
-        'website': '',
-        'socialMedia': {
+    coach_profile = COACH_PROFILE_TEMPLATE.copy()
+    coach_profile.update(
+        username=entry['username'],
+        displayName=f"{entry['first_name']} {entry['last_name']}".strip(),
+        email=entry['email'],
+        bio=f"Experienced {role.lower()} specializing in {', '.join(sports).lower()}.",
+        sports=sports,
+        certifications=[],
+        location=location,
+        availability=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'],
+        specialties=sports,
+        languages=['English'],
+        organization=organization,
+        role=role,
+        ageGroup=['Adult', 'Teen', 'Youth'],
+        sourceUrl=source_url,
+        socialMedia={
             'instagram': '',
             'twitter': '',
             'linkedin': ''
         },
-        'createdAt': firestore.SERVER_TIMESTAMP,
-        'updatedAt': firestore.SERVER_TIMESTAMP,
-        'profileCompleted': False,
-        'isClaimed': False,  # Key field for claiming system
-        'userId': None,  # Will be linked when claimed
-        'claimedAt': None,
-        'verificationStatus': 'pending'  # pending, in_review, verified, rejected
-    }
+    )
     
     # Add phone number if available
     if 'phone' in entry:
@@ -510,10 +618,11 @@ def upload_to_firestore(entries, key_path, pdf_info=None, collection='coaches',
     """
     if dry_run:
         print("DRY RUN MODE - No actual upload to Firestore")
+        # Only the fields shown here are needed, so skip building full profiles
         for e in entries:
-            coach_profile = map_to_coach_profile(e, pdf_info)
-            phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
-            print(f"[DRY RUN] Would create unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → coaches/{coach_profile['username']}{phone_info}")
+            display_name = f"{e['first_name']} {e['last_name']}".strip()
+            phone_info = f" | Phone: {e['phone']}" if 'phone' in e else ""
+            print(f"[DRY RUN] Would create unclaimed coach profile: {display_name} ({e['email']}) → coaches/{e['username']}{phone_info}")
         return
     
     cred = credentials.Certificate(key_path)
@@ -523,34 +632,64 @@ def upload_to_firestore(entries, key_path, pdf_info=None, collection='coaches',
     uploaded_count = 0
     skipped_count = 0
 
+    # One profile per username; a later entry for the same username wins,
+    # as it would have with sequential set() calls
+    profiles = {}
     for e in entries:
         try:
             coach_profile = map_to_coach_profile(e, pdf_info)
-            username = coach_profile['username']
-            
-            # Check if coach profile already exists
-            coach_ref = db.collection('coaches').document(username)
-            existing_coach = coach_ref.get()
-            
-            if existing_coach.exists:
-                existing_data = existing_coach.to_dict()
+            profiles[coach_profile['username']] = coach_profile
+        except Exception as error:
+            print(f"❌ Error processing {e['email']}: {error}")
+
+    refs = [db.collection('coaches').document(username) for username in profiles]
+    existing_usernames = set()
+
+    # BulkWriter acknowledges the profile writes on its own threads
+    count_lock = threading.Lock()
+
+    def on_write_result(reference, result, bulk_writer):
+        nonlocal uploaded_count
+        coach_profile = profiles[reference.id]
+        phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
+        status = "Updated" if reference.id in existing_usernames else "Created"
+        print(f"✔ {status} unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → coaches/{reference.id}{phone_info}")
+        with count_lock:
+            uploaded_count += 1
+
+    def on_write_error(failure, bulk_writer):
+        # Timeouts, contention and transient unavailability are retried with backoff
+        if failure.code in RETRYABLE_WRITE_CODES and failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        print(f"❌ Error processing {profiles[failure.operation.reference.id]['email']}: {failure.message}")
+        return False
+
+    bulk_writer = db.bulk_writer(options=BulkWriterOptions(initial_ops_per_second=500))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+
+    try:
+        # Single batched read instead of one get() round trip per coach
+        for coach_doc in db.get_all(refs):
+            username = coach_doc.id
+            coach_profile = profiles[username]
+            if coach_doc.exists:
+                existing_data = coach_doc.to_dict()
                 if existing_data.get('isClaimed', False):
                     print(f"⏭️  Skipped {coach_profile['email']} - already claimed by user")
                     skipped_count += 1
                     continue
                 else:
                     print(f"🔄 Updating unclaimed profile for {coach_profile['email']}")
-            
+                    existing_usernames.add(username)
+
             # Upload/update the coach profile
-            coach_ref.set(coach_profile)
-            
-            phone_info = f" | Phone: {coach_profile.get('phoneNumber', 'N/A')}" if 'phoneNumber' in coach_profile else ""
-            status = "Updated" if existing_coach.exists else "Created"
-            print(f"✔ {status} unclaimed coach profile: {coach_profile['displayName']} ({coach_profile['email']}) → coaches/{username}{phone_info}")
-            uploaded_count += 1
-            
-        except Exception as error:
-            print(f"❌ Error processing {e['email']}: {error}")
+            bulk_writer.set(coach_doc.reference, coach_profile)
+    except Exception as error:
+        print(f"❌ Error looking up coach profiles: {error}")
+    finally:
+        # Flushes all queued writes and waits for their results
+        bulk_writer.close()
     
     print(f"\n📊 Upload Summary:")
     print(f"✔ {uploaded_count} coach profiles created/updated")
@@ -575,6 +714,10 @@ def main():
         "--dry-run", action="store_true",
         help="Parse and show results without uploading to Firestore"
     )
+    p.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Processes used to read the pages of long PDFs in parallel (default: CPU count)"
+    )
     args = p.parse_args()
 
     # Set default output txt file if not specified
@@ -582,7 +725,7 @@ def main():
         pdf_name = os.path.splitext(os.path.basename(args.pdf))[0]
         args.output_txt = f"coaches_filtered_{pdf_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
-    coaches, pdf_info = parse_pdf(args.pdf, args.output_txt)
+    coaches, pdf_info = parse_pdf(args.pdf, args.output_txt, args.workers)
     print(f"Found {len(coaches)} coach entries (filtered from PDF).")
     
     if len(coaches) == 0:
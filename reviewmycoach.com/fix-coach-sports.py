@@ -6,8 +6,11 @@ Run this after uploading coaches to properly categorize them by sport
 
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 import re
 import sys
+import threading
+from functools import lru_cache
 
 # Sports mapping dictionary
 SPORTS_MAPPING = {
@@ -40,17 +43,28 @@ SPORTS_MAPPING = {
     'crossfit': 'CrossFit'
 }
 
-def extract_sports_from_role(role_description):
-    """Extract sports from role description"""
+# Every keyword present in a role, found in one scan. Each alternative is a
+# zero-width lookahead so overlapping keywords are all seen; no keyword is a
+# prefix of another, so one alternative per position suffices.
+SPORTS_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, SPORTS_MAPPING)) + "))")
+
+# google.rpc status codes worth retrying for a bulk write: DEADLINE_EXCEEDED, ABORTED, UNAVAILABLE
+RETRYABLE_WRITE_CODES = (4, 10, 14)
+MAX_WRITE_ATTEMPTS = 5
+
+@lru_cache(maxsize=4096)
+def _sports_for_role(role_description):
+    """Sports for a role description, as a tuple so cached results can't be mutated"""
     if not role_description:
-        return ['General Coaching']
+        return ('General Coaching',)
     
     sports = []
     role_lower = role_description.lower()
     
-    # Check for each sport in the role description
+    # Sports are still listed in SPORTS_MAPPING order
+    found = set(SPORTS_KEYWORD_RE.findall(role_lower))
     for keyword, sport_name in SPORTS_MAPPING.items():
-        if keyword in role_lower:
+        if keyword in found:
             if sport_name not in sports:
                 sports.append(sport_name)
     
@@ -58,7 +72,18 @@ def extract_sports_from_role(role_description):
     if not sports:
         sports = ['General Coaching']
     
-    return sports
+    return tuple(sports)
+
+@lru_cache(maxsize=4096)
+def _sport_set_for_role(role_description):
+    """Set of sports for a role description, for order-insensitive comparison"""
+    return frozenset(_sports_for_role(role_description))
+
+def extract_sports_from_role(role_description):
+    """Extract sports from role description"""
+    # Roles repeat across coaches ("Head Coach", "Assistant Coach"), so the
+    # keyword scan is cached per distinct role
+    return list(_sports_for_role(role_description))
 
 def fix_coach_sports(firebase_key_path):
     """Fix sports mapping for all coaches"""
@@ -75,6 +100,26 @@ def fix_coach_sports(firebase_key_path):
     coaches = coaches_ref.stream()
     
     updated_count = 0
+    # Updates are acknowledged on BulkWriter threads while the stream is still
+    # queueing more, so the tally is taken under a lock
+    count_lock = threading.Lock()
+
+    def on_write_result(reference, result, bulk_writer):
+        nonlocal updated_count
+        with count_lock:
+            updated_count += 1
+
+    def on_write_error(failure, bulk_writer):
+        # Timeouts, contention and transient unavailability are retried with backoff
+        if failure.code in RETRYABLE_WRITE_CODES and failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        print(f"Failed to update {failure.operation.reference.id}: {failure.message}")
+        return False
+
+    # Updates are queued while the stream is read instead of one blocking RPC each
+    bulk_writer = db.bulk_writer(options=BulkWriterOptions(initial_ops_per_second=500))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
     
     for coach_doc in coaches:
         coach_data = coach_doc.to_dict()
@@ -84,11 +129,11 @@ def fix_coach_sports(firebase_key_path):
         current_role = coach_data.get('role', '')
         current_sports = coach_data.get('sports', [])
         
-        # Extract sports from role
-        new_sports = extract_sports_from_role(current_role)
-        
-        # Update if sports changed
-        if set(new_sports) != set(current_sports):
+        # Update if sports changed; the role's sport set is cached, so only
+        # the stored list is converted per coach
+        if _sport_set_for_role(current_role) != set(current_sports):
+            # Extract sports from role
+            new_sports = extract_sports_from_role(current_role)
             print(f"Updating {coach_data.get('displayName', coach_id)}:")
             print(f"  Role: {current_role}")
             print(f"  Old sports: {current_sports}")
@@ -96,13 +141,13 @@ def fix_coach_sports(firebase_key_path):
             print()
             
             # Update the coach document
-            coaches_ref.document(coach_id).update({
+            bulk_writer.update(coaches_ref.document(coach_id), {
                 'sports': new_sports,
                 'updatedAt': firestore.SERVER_TIMESTAMP
             })
-            
-            updated_count += 1
     
+    # Flushes all queued updates and waits for their results
+    bulk_writer.close()
     print(f"Updated {updated_count} coaches")
 
 if __name__ == "__main__":
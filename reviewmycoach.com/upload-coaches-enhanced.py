@@ -6,12 +6,19 @@ with proper sports categorization based on role descriptions.
 """
 
 import pdfplumber
+import pypdfium2 as pdfium
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
 import re
+import os
 import sys
+import threading
+import uuid
 import argparse
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from functools import lru_cache
 import logging
 
 # Configure logging
@@ -58,6 +65,97 @@ SPORTS_MAPPING = {
     'head coach': 'General Coaching'
 }
 
+# Every keyword present in a role, found in one scan. Each alternative is a
+# zero-width lookahead so overlapping keywords are all seen. Longer keywords
+# are tried first, and a hit also counts for the keywords it starts with
+# ('swimming' -> 'swim', 'track and field' -> 'track').
+SPORTS_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(SPORTS_MAPPING, key=len, reverse=True))) + "))"
+)
+SPORTS_KEYWORD_PREFIXES = {
+    keyword: [other for other in SPORTS_MAPPING if keyword.startswith(other)]
+    for keyword in SPORTS_MAPPING
+}
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Phone number formats, tried in order
+PHONE_PATTERNS = [
+    re.compile(r'\((\d{3})\)\s*(\d{3})-?(\d{4})'),  # (123) 456-7890
+    re.compile(r'(\d{3})-(\d{3})-(\d{4})'),         # 123-456-7890
+    re.compile(r'(\d{3})\.(\d{3})\.(\d{4})'),       # 123.456.7890
+    re.compile(r'(\d{3})\s+(\d{3})\s+(\d{4})'),     # 123 456 7890
+]
+
+NAME_PREFIX_RE = re.compile(r'^(Dr\.|Prof\.|Mr\.|Ms\.|Mrs\.)\s+', re.IGNORECASE)
+# 2-4 words, starting with capital letters
+NAME_RE = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]*){1,3})')
+
+# Role context: the comma-separated part of the line that contains "coach"
+ROLE_RE = re.compile(r'([^,\n]*coach[^,\n]*)', re.IGNORECASE)
+
+# New unclaimed coach profile, in document order. Fields set to None are
+# filled per coach by build_coach_profile, which also gives each profile
+# its own lists and dicts.
+COACH_PROFILE_TEMPLATE = {
+    'userId': None,  # Will be set when claimed
+    'username': None,
+    'displayName': None,
+    'email': None,
+    'phoneNumber': None,
+    'bio': None,
+    'sports': None,
+    'role': None,
+    'organization': 'Imported from PDF',
+    'location': 'Not specified',
+    'experience': 5,  # Default experience
+    'certifications': None,
+    'hourlyRate': 0,  # Price on request
+    'availability': None,
+    'specialties': None,
+    'languages': None,
+    'gender': '',
+    'ageGroup': None,
+    'sourceUrl': '',
+    'averageRating': 0,
+    'totalReviews': 0,
+    'isVerified': False,
+    'isClaimed': False,  # Key field for claiming system
+    'claimedAt': None,
+    'verificationStatus': 'pending',
+    'profileImage': '',
+    'website': '',
+    'socialMedia': None,
+    'createdAt': firestore.SERVER_TIMESTAMP,
+    'updatedAt': firestore.SERVER_TIMESTAMP,
+    'profileCompleted': True,
+    'importedFromPDF': True
+}
+
+# google.rpc status codes worth retrying for a bulk write: DEADLINE_EXCEEDED, ABORTED, UNAVAILABLE
+RETRYABLE_WRITE_CODES = (4, 10, 14)
+MAX_WRITE_ATTEMPTS = 5
+
+@lru_cache(maxsize=2048)
+def _sports_for_role(role_description: str) -> Tuple[str, ...]:
+    """Sports for a non-empty role description, as a tuple so cached results can't be mutated"""
+    role_lower = role_description.lower()
+    
+    found = set()
+    for hit in SPORTS_KEYWORD_RE.findall(role_lower):
+        found.update(SPORTS_KEYWORD_PREFIXES[hit])
+    
+    # Sports are still listed in SPORTS_MAPPING order; an insertion-ordered
+    # dict drops repeats without rescanning the list. Compound roles such as
+    # "track and field" are already covered by the 'track' keyword.
+    sports = dict.fromkeys(sport_name for keyword, sport_name in SPORTS_MAPPING.items() if keyword in found)
+    
+    # If no specific sport found, default to General Coaching
+    if not sports:
+        return ('General Coaching',)
+    
+    return tuple(sports)
+
 def extract_sports_from_role(role_description: str) -> List[str]:
     """
     Extract sports from role description
@@ -71,46 +169,24 @@ def extract_sports_from_role(role_description: str) -> List[str]:
     if not role_description:
         return ['General Coaching']
     
-    sports = []
-    role_lower = role_description.lower()
-    
-    # Check for each sport in the role description
-    for keyword, sport_name in SPORTS_MAPPING.items():
-        if keyword in role_lower:
-            if sport_name not in sports:
-                sports.append(sport_name)
-    
-    # Special cases for compound roles
-    if 'track' in role_lower and 'field' in role_lower:
-        if 'Track & Field' not in sports:
-            sports = [s for s in sports if s != 'Track & Field']  # Remove duplicates
-            sports.append('Track & Field')
-    
-    # If no specific sport found, default to General Coaching
-    if not sports:
-        sports = ['General Coaching']
+    # Roles repeat across lines ("Head Coach", "Assistant Coach"), so the
+    # keyword scan is cached per distinct role
+    sports = list(_sports_for_role(role_description))
     
-    logger.info(f"Role: '{role_description}' → Sports: {sports}")
+    # Per-role detail is debug-only; the arguments are only formatted if it's enabled
+    logger.debug("Role: '%s' → Sports: %s", role_description, sports)
     return sports
 
 def extract_email(text: str) -> Optional[str]:
     """Extract email address from text"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = EMAIL_RE.search(text)
     return match.group(0) if match else None
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract and format phone number"""
     # Look for various phone number patterns
-    phone_patterns = [
-        r'\((\d{3})\)\s*(\d{3})-?(\d{4})',  # (123) 456-7890
-        r'(\d{3})-(\d{3})-(\d{4})',         # 123-456-7890
-        r'(\d{3})\.(\d{3})\.(\d{4})',       # 123.456.7890
-        r'(\d{3})\s+(\d{3})\s+(\d{4})',     # 123 456 7890
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
             if len(match.groups()) == 3:
                 return f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
@@ -120,30 +196,65 @@ def extract_phone(text: str) -> Optional[str]:
 def extract_name(text: str) -> Optional[str]:
     """Extract name from text - assumes name comes first"""
     # Remove common prefixes and clean up
-    text = re.sub(r'^(Dr\.|Prof\.|Mr\.|Ms\.|Mrs\.)\s+', '', text, flags=re.IGNORECASE)
+    text = NAME_PREFIX_RE.sub('', text)
     
     # Look for name pattern (2-4 words, starting with capital letters)
-    name_pattern = r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]*){1,3})'
-    match = re.match(name_pattern, text.strip())
+    match = NAME_RE.match(text.strip())
     
     return match.group(1) if match else None
 
+def iter_pdf_lines(pdf_path: str) -> Iterator[str]:
+    """
+    Yield the text lines of a PDF, one page at a time
+    
+    Only the current page's text is held in memory. Text comes from PDFium,
+    which is much faster and lighter than pdfplumber's pdfminer layout
+    analysis. Pages where PDFium finds no text are retried with pdfplumber,
+    which is only opened if needed.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    plumber_pdf = None
+    try:
+        for index, page in enumerate(pdf):
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            
+            if not page_text.strip():
+                if plumber_pdf is None:
+                    plumber_pdf = pdfplumber.open(pdf_path)
+                page_text = plumber_pdf.pages[index].extract_text() or ""
+            
+            # Every page ends with a line break
+            yield from page_text.split('\n')
+        yield ''
+    finally:
+        if plumber_pdf is not None:
+            plumber_pdf.close()
+        pdf.close()
+
 def generate_username(name: str) -> str:
     """Generate username from name"""
     if not name:
-        return f"coach_{int(time.time())}"
+        # Random rather than time-based, so names in the same second (or in
+        # parallel worker processes) can't collide
+        return f"coach_{uuid.uuid4().hex[:8]}"
     
     # Take first name and last name, lowercase, remove spaces
-    parts = name.split()
+    parts = name.lower().split()
     if len(parts) >= 2:
-        return f"{parts[0].lower()}{parts[-1].lower()}"
+        return parts[0] + parts[-1]
     else:
-        return parts[0].lower()
+        return parts[0]
 
 def parse_coach_line(line: str) -> Optional[Dict]:
     """Parse a single line to extract coach information"""
-    # Skip lines that don't contain "coach" (case insensitive)
-    if 'coach' not in line.lower():
+    # Skip lines that don't contain "coach" (case insensitive). The role
+    # pattern matches exactly those lines, so it doubles as the check and
+    # the line isn't lowercased just to test it
+    role_match = ROLE_RE.search(line)
+    if not role_match:
         return None
     
     # Extract information
@@ -152,26 +263,11 @@ def parse_coach_line(line: str) -> Optional[Dict]:
     phone = extract_phone(line)
     
     if not name:
-        logger.warning(f"Could not extract name from line: {line}")
+        logger.warning("Could not extract name from line: %s", line)
         return None
     
-    # Extract role (everything that contains "coach" or related terms)
-    role_patterns = [
-        r'([^,\n]*coach[^,\n]*)',
-        r'([^,\n]*director[^,\n]*)',
-        r'([^,\n]*instructor[^,\n]*)',
-        r'([^,\n]*trainer[^,\n]*)'
-    ]
-    
-    role = None
-    for pattern in role_patterns:
-        match = re.search(pattern, line, re.IGNORECASE)
-        if match:
-            role = match.group(1).strip()
-            break
-    
-    if not role:
-        role = "Coach"  # Default role
+    # Extract role (the comma-separated part containing "coach")
+    role = role_match.group(1).strip()
     
     # Extract sports from role
     sports = extract_sports_from_role(role)
@@ -193,69 +289,121 @@ def parse_coach_line(line: str) -> Optional[Dict]:
         'bio': bio
     }
 
-def upload_coach_to_firebase(coach_data: Dict, db) -> bool:
-    """Upload a single coach to Firebase"""
+def build_coach_profile(coach_data: Dict) -> Dict:
+    """Create the complete coach profile for a parsed coach"""
+    profile = COACH_PROFILE_TEMPLATE.copy()
+    profile.update(
+        username=coach_data['username'],
+        displayName=coach_data['displayName'],
+        email=coach_data['email'],
+        phoneNumber=coach_data.get('phoneNumber', ''),
+        bio=coach_data['bio'],
+        sports=coach_data['sports'],
+        role=coach_data['role'],
+        certifications=[],
+        availability=[],
+        specialties=coach_data['sports'],  # Use sports as specialties
+        languages=['English'],
+        ageGroup=[],
+        socialMedia={
+            'instagram': '',
+            'twitter': '',
+            'linkedin': ''
+        },
+    )
+    return profile
+
+def upload_coaches_to_firebase(coaches: List[Dict], db) -> int:
+    """
+    Upload coaches to Firebase, skipping any that already exist
+    
+    Existing coaches are looked up with one batched read and new profiles are
+    written through a BulkWriter, instead of a get() and a set() round trip
+    per coach.
+    
+    Returns:
+        Number of coaches uploaded
+    """
+    coaches_ref = db.collection('coaches')
+    uploaded_count = 0
+    
+    # The first coach parsed for a username is uploaded; later ones are
+    # skipped as if it already existed, as with sequential get()/set() calls
+    new_coaches = {}
+    for coach_data in coaches:
+        if coach_data['username'] in new_coaches:
+            logger.warning("Coach %s already exists, skipping...", coach_data['username'])
+        else:
+            new_coaches[coach_data['username']] = coach_data
+    
+    # Each acknowledged profile bumps uploaded_count from a BulkWriter thread
+    count_lock = threading.Lock()
+    
+    def on_write_result(reference, result, bulk_writer):
+        nonlocal uploaded_count
+        coach_data = new_coaches[reference.id]
+        logger.info("✅ Uploaded coach: %s (%s)", coach_data['displayName'], coach_data['sports'])
+        with count_lock:
+            uploaded_count += 1
+    
+    def on_write_error(failure, bulk_writer):
+        # Timeouts, contention and transient unavailability are retried with backoff
+        if failure.code in RETRYABLE_WRITE_CODES and failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        logger.error("❌ Error uploading coach %s: %s", new_coaches[failure.operation.reference.id]['displayName'], failure.message)
+        return False
+    
+    bulk_writer = db.bulk_writer(options=BulkWriterOptions(initial_ops_per_second=500))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+    
     try:
-        coach_ref = db.collection('coaches').document(coach_data['username'])
-        
-        # Check if coach already exists
-        if coach_ref.get().exists:
-            logger.warning(f"Coach {coach_data['username']} already exists, skipping...")
-            return False
-        
-        # Create complete coach profile
-        complete_profile = {
-            'userId': None,  # Will be set when claimed
-            'username': coach_data['username'],
-            'displayName': coach_data['displayName'],
-            'email': coach_data['email'],
-            'phoneNumber': coach_data.get('phoneNumber', ''),
-            'bio': coach_data['bio'],
-            'sports': coach_data['sports'],
-            'role': coach_data['role'],
-            'organization': 'Imported from PDF',
-            'location': 'Not specified',
-            'experience': 5,  # Default experience
-            'certifications': [],
-            'hourlyRate': 0,  # Price on request
-            'availability': [],
-            'specialties': coach_data['sports'],  # Use sports as specialties
-            'languages': ['English'],
-            'gender': '',
-            'ageGroup': [],
-            'sourceUrl': '',
-            'averageRating': 0,
-            'totalReviews': 0,
-            'isVerified': False,
-            'isClaimed': False,  # Key field for claiming system
-            'claimedAt': None,
-            'verificationStatus': 'pending',
-            'profileImage': '',
-            'website': '',
-            'socialMedia': {
-                'instagram': '',
-                'twitter': '',
-                'linkedin': ''
-            },
-            'createdAt': firestore.SERVER_TIMESTAMP,
-            'updatedAt': firestore.SERVER_TIMESTAMP,
-            'profileCompleted': True,
-            'importedFromPDF': True
-        }
-        
-        coach_ref.set(complete_profile)
-        logger.info(f"✅ Uploaded coach: {coach_data['displayName']} ({coach_data['sports']})")
-        return True
-        
+        refs = [coaches_ref.document(username) for username in new_coaches]
+        for coach_doc in db.get_all(refs):
+            coach_data = new_coaches[coach_doc.id]
+            if coach_doc.exists:
+                logger.warning("Coach %s already exists, skipping...", coach_doc.id)
+                continue
+            
+            try:
+                bulk_writer.set(coach_doc.reference, build_coach_profile(coach_data))
+            except Exception as e:
+                logger.error(f"❌ Error uploading coach {coach_data['displayName']}: {e}")
     except Exception as e:
-        logger.error(f"❌ Error uploading coach {coach_data['displayName']}: {e}")
-        return False
+        logger.error(f"❌ Error looking up existing coaches: {e}")
+    finally:
+        # Flushes all queued writes and waits for their results
+        bulk_writer.close()
+    
+    return uploaded_count
+
+def extract_coaches(pdf_path: str) -> List[Dict]:
+    """Parse every coach line of a PDF"""
+    logger.info(f"📖 Parsing PDF: {pdf_path}")
+    coaches = []
+    
+    # Process each line as its page is read
+    line_num = 0
+    for line_num, line in enumerate(iter_pdf_lines(pdf_path), 1):
+        line = line.strip()
+        if not line:
+            continue
+            
+        coach_data = parse_coach_line(line)
+        if coach_data:
+            coaches.append(coach_data)
+            logger.info("📝 Line %d: Found coach - %s", line_num, coach_data['displayName'])
+    
+    logger.info(f"📄 Processed {line_num} lines from PDF")
+    return coaches
 
 def main():
     parser = argparse.ArgumentParser(description='Upload coaches from PDF to Firebase')
-    parser.add_argument('--pdf', required=True, help='Path to PDF file')
+    parser.add_argument('--pdf', required=True, nargs='+', help='Path to PDF file (several may be given)')
     parser.add_argument('--key', required=True, help='Path to Firebase service account key')
     parser.add_argument('--dry-run', action='store_true', help='Parse PDF without uploading to Firebase')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes used to parse several PDFs in parallel (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -271,38 +419,22 @@ def main():
             logger.error(f"❌ Failed to initialize Firebase: {e}")
             return
     
-    # Parse PDF
+    # Parse PDFs
     try:
-        logger.info(f"📖 Parsing PDF: {args.pdf}")
-        coaches = []
-        
-        with pdfplumber.open(args.pdf) as pdf:
-            full_text = ""
-            for page in pdf.pages:
-                full_text += page.extract_text() + "\n"
-        
-        # Process each line
-        lines = full_text.split('\n')
-        logger.info(f"📄 Processing {len(lines)} lines from PDF")
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-                
-            coach_data = parse_coach_line(line)
-            if coach_data:
-                coaches.append(coach_data)
-                logger.info(f"📝 Line {line_num}: Found coach - {coach_data['displayName']}")
+        workers = min(args.workers, len(args.pdf))
+        if workers > 1:
+            # Text extraction is CPU-bound, so each PDF gets its own process.
+            # Results come back in argument order, keeping duplicate handling stable
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                coaches = [coach for pdf_coaches in pool.map(extract_coaches, args.pdf) for coach in pdf_coaches]
+        else:
+            coaches = [coach for pdf_path in args.pdf for coach in extract_coaches(pdf_path)]
         
         logger.info(f"🎯 Found {len(coaches)} coaches total")
         
         # Upload to Firebase (unless dry run)
         if not args.dry_run and db:
-            uploaded_count = 0
-            for coach in coaches:
-                if upload_coach_to_firebase(coach, db):
-                    uploaded_count += 1
+            uploaded_count = upload_coaches_to_firebase(coaches, db)
             
             logger.info(f"🚀 Successfully uploaded {uploaded_count}/{len(coaches)} coaches")
         else:
@@ -314,5 +446,4 @@ def main():
         logger.error(f"❌ Error processing PDF: {e}")
 
 if __name__ == "__main__":
-    import time
     main()
\ No newline at end of file